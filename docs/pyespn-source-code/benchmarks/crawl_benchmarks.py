@@ -0,0 +1,157 @@
+"""
+Benchmarks for the pyespn crawl hot paths, run against recorded ESPN responses.
+
+Record a fixture set once against the live api, then replay it as often as needed:
+
+    python benchmarks/crawl_benchmarks.py --record benchmarks/fixtures/nfl
+    python benchmarks/crawl_benchmarks.py --replay benchmarks/fixtures/nfl --latency 0.05
+
+Every workload reports how many requests it sent, its wall time and its peak Python
+memory (tracemalloc). Replays are deterministic, so a change in the request count is a
+real change in crawl behaviour and wall time differences come from pyespn itself plus
+the injected latency.
+"""
+from pyespn import PYESPN
+from pyespn.utilities import (FixtureStore, HttpTransport, RecordingTransport, ReplayTransport,
+                              use_transport)
+import argparse
+import json
+import time
+import tracemalloc
+
+
+def _workloads(espn, args):
+    """
+    Returns the (name, callable) pairs to benchmark, in run order.
+
+    Later workloads reuse objects built by earlier ones (the game event, the team), the
+    same way the py/ scripts chain calls.
+    """
+    state = {}
+
+    def schedule():
+        espn.load_season_schedule(season=args.season)
+
+    def game():
+        state['event'] = espn.get_game_info(event_id=args.event_id)
+
+    def play_by_play():
+        event = state.get('event') or espn.get_game_info(event_id=args.event_id)
+        event.load_play_by_play()
+
+    def roster():
+        team = espn.get_team_by_id(team_id=args.team_id)
+        team.load_season_roster(season=args.season)
+        state['team'] = team
+
+    def player_game_log():
+        player = espn.get_player_info(player_id=args.player_id)
+        player.load_player_box_scores_season(season=args.season)
+
+    return [
+        ('schedule', schedule),
+        ('game', game),
+        ('play_by_play', play_by_play),
+        ('roster', roster),
+        ('player_game_log', player_game_log),
+    ]
+
+
+def _measure(name, func, transport) -> dict:
+    """
+    Runs one workload and returns its request count, wall time and peak memory.
+    """
+    requests_before = transport.requests
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    error = None
+    try:
+        func()
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    return {
+        'workload': name,
+        'requests': transport.requests - requests_before,
+        'seconds': round(elapsed, 3),
+        'peak_mb': round(peak / (1024 * 1024), 2),
+        'error': error,
+    }
+
+
+def run(args) -> list:
+    """
+    Builds the transport requested on the command line and runs every selected workload.
+
+    Returns:
+        list[dict]: One result per workload, the first being the client construction itself.
+    """
+    if args.record:
+        transport = RecordingTransport(FixtureStore(args.record))
+    elif args.replay:
+        transport = ReplayTransport(FixtureStore(args.replay), latency=args.latency, jitter=args.jitter, seed=0)
+    else:
+        transport = HttpTransport()
+
+    results = []
+    tracemalloc.start()
+    try:
+        with use_transport(transport):
+            holder = {}
+
+            def client():
+                holder['espn'] = PYESPN(sport_league=args.league, max_workers=args.workers)
+
+            results.append(_measure('client', client, transport))
+            espn = holder.get('espn')
+            if espn is None:
+                return results
+            for name, func in _workloads(espn, args):
+                if args.only and name not in args.only:
+                    continue
+                results.append(_measure(name, func, transport))
+            espn.close()
+    finally:
+        tracemalloc.stop()
+
+    if isinstance(transport, ReplayTransport) and transport.misses:
+        print(f'warning: {len(transport.misses)} requests had no recorded response, re-record the fixtures')
+    return results
+
+
+def _print_table(results) -> None:
+    print(f'{"workload":<18}{"requests":>10}{"seconds":>10}{"peak MB":>10}')
+    for result in results:
+        line = f'{result["workload"]:<18}{result["requests"]:>10}{result["seconds"]:>10.3f}{result["peak_mb"]:>10.2f}'
+        if result['error']:
+            line += f'  ! {result["error"]}'
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark pyespn crawl workloads.')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--record', metavar='DIR', help='run live and record every response into DIR')
+    source.add_argument('--replay', metavar='DIR', help='serve responses recorded in DIR')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds injected per replayed request')
+    parser.add_argument('--jitter', type=float, default=0.0, help='max random extra seconds per replayed request')
+    parser.add_argument('--league', default='nfl')
+    parser.add_argument('--season', type=int, default=2024)
+    parser.add_argument('--event-id', default='401671789')
+    parser.add_argument('--team-id', type=int, default=12)
+    parser.add_argument('--player-id', default='3139477')
+    parser.add_argument('--workers', type=int, default=16, help='size of the client executor')
+    parser.add_argument('--only', action='append', help='run only the named workload (repeatable)')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+
+if __name__ == '__main__':
+    main()
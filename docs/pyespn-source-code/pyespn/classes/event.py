@@ -343,6 +343,53 @@ class Event:
                                        espn_instance=self._espn_instance,
                                        event_instance=self)
 
+    @property
+    def known_state(self):
+        """
+            str or None: the competition state ('pre', 'in' or 'post') carried by the loaded documents, None if they only link to the status
+        """
+        competition_status = self.competition.status if self.competition else None
+        for status in ((self.competition_list or [{}])[0].get('status'), competition_status):
+            state = ((status or {}).get('type') or {}).get('state') if isinstance(status, dict) else None
+            if state:
+                return state
+        return None
+
+    def fetch_state(self):
+        """
+        Fetches the competition's current status and returns its state.
+
+        The status is always requested, even when the loaded documents carry one inline,
+        since that copy is as old as the event and can't show the game moving on.
+
+        Returns:
+            str or None: 'pre', 'in' or 'post', or None if the status could not be loaded.
+        """
+        status = (self.competition.status if self.competition else None) or {}
+        url = status.get('$ref') or f'http://sports.core.api.espn.com/{self._espn_instance.v}/sports/{self.api_info["sport"]}/leagues/{self.api_info["league"]}/events/{self._event_id}/competitions/{self._event_id}/status'
+        content = fetch_espn_data(url)
+        return ((content or {}).get('type') or {}).get('state')
+
+    def refresh(self) -> None:
+        """
+        Reloads the event from the API, so every holder of this instance sees the new data.
+
+        The reloaded event is built completely as a separate instance and its state is then
+        swapped in with one assignment, so readers never see a half rebuilt event. Betting
+        odds and play by play are reloaded as well if they had been loaded before.
+        """
+        url = self.url_ref or f'http://sports.core.api.espn.com/{self._espn_instance.v}/sports/{self.api_info["sport"]}/leagues/{self.api_info["league"]}/events/{self._event_id}?lang=en&region=us'
+        content = fetch_espn_data(url)
+        if content is None:
+            return
+        fresh = Event(event_json=content,
+                      espn_instance=self._espn_instance,
+                      load_game_odds=self._odds is not None,
+                      load_play_by_play=self._drives is not None or self._plays is not None)
+        # both instances now share one __dict__, so the competition, drives and odds built
+        # against the fresh instance see the same state as this one
+        self.__dict__ = fresh.__dict__
+
     def load_play_by_play(self):
         """
         Private method to load play-by-play data for the event.
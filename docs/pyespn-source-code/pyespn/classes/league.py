@@ -1,5 +1,6 @@
 from pyespn.core.decorators import validate_json
-from pyespn.utilities import fetch_espn_data
+from pyespn.utilities import fetch_espn_data, get_athlete_id
+from pyespn.core.orchestration import fetch_all_core
 from pyespn.exceptions import API400Error
 from pyespn.core.schedule import get_regular_season_schedule_core
 from pyespn.classes.betting import Betting
@@ -383,53 +384,77 @@ class League:
         """
         return Betting(betting_json=bet, espn_instance=self._espn_instance, season=season)
 
-    def fetch_leader_category(self, category, season) -> LeaderCategory:
+    def fetch_leader_category(self, category, season, athletes=None) -> LeaderCategory:
         """
         Fetches leader category data for a specific category in the given season.
 
         Args:
             category (dict): The category data to be processed.
             season (str): The season for which the leader data is fetched.
+            athletes (dict, optional): Already resolved Player objects keyed by athlete id.
 
         Returns:
             LeaderCategory: The LeaderCategory object created for this category.
         """
         return LeaderCategory(leader_cat_json=category,
                               espn_instance=self._espn_instance,
-                              season=season)
+                              season=season,
+                              athletes=athletes)
 
-    def load_season_league_leaders(self, season):
+    def _resolve_leader_athletes(self, categories) -> dict:
         """
-        Fetches the league leaders for the given season using futures to process categories concurrently.
+        Resolves every distinct athlete referenced across the leader categories in one batch.
+
+        Each athlete is fetched once on the client's shared executor no matter how many
+        categories they lead, instead of crawling every team roster first.
 
         Args:
-            season (str): The season for which the league leaders are fetched.
+            categories (list[dict]): The raw leader categories.
+
+        Returns:
+            dict: Player objects keyed by athlete id.
+        """
+        from pyespn.classes.player import Player
+        refs = {}
+        for category in categories:
+            for leader in category.get('leaders', []):
+                ref = leader.get('athlete', {}).get('$ref')
+                if ref:
+                    refs.setdefault(get_athlete_id(ref), ref)
+
+        contents = fetch_all_core(urls=refs.values(),
+                                  espn_instance=self._espn_instance)
+        athletes = {}
+        for athlete_id, ref in refs.items():
+            if contents.get(ref):
+                athletes[athlete_id] = Player(player_json=contents[ref],
+                                              espn_instance=self._espn_instance)
+        return athletes
+
+    def load_season_league_leaders(self, season):
         """
+        Fetches the league leaders for the given season.
 
-        for team in self._espn_instance.teams:
-            if season not in team.roster:
-                team.load_season_roster(season=season)
+        The distinct athletes across all categories are resolved in one concurrent,
+        deduplicated batch before the categories are built, so no team rosters need
+        to be loaded first.
 
+        Args:
+            season (str): The season for which the league leaders are fetched.
+        """
         url = f'http://sports.core.api.espn.com/{self._espn_instance.v}/sports/{self.api_info["sport"]}/leagues/{self.api_info["league"]}/seasons/{season}/types/2/leaders'
 
         try:
             leaders_content = fetch_espn_data(url)
+            categories = leaders_content.get('categories', [])
+            athletes = self._resolve_leader_athletes(categories)
             leaders = []
 
-            with ThreadPoolExecutor() as executor:
-                # Submit a task for each category to fetch leader data concurrently
-                future_to_category = {
-                    executor.submit(self.fetch_leader_category, category, season): category
-                    for category in leaders_content.get('categories', [])
-                }
-
-                # Collect results as they complete
-                for future in as_completed(future_to_category):
-                    try:
-                        category_data = future.result()
-                        leaders.append(category_data)
-                    except Exception as e:
-                        print(f"Error fetching leader category: {e}")
+            for category in categories:
+                try:
+                    leaders.append(self.fetch_leader_category(category, season, athletes=athletes))
+                except Exception as e:
+                    print(f"Error fetching leader category: {e}")
 
             self._league_leaders[season] = leaders
 
@@ -259,15 +259,13 @@ class Player:
             for event_log in event_log_content.get('events', {}).get('items', []):
                 event_list.append(event_log)
 
+        from pyespn.core.games import get_event_core
         event_stats_log = []
         for event in event_list:
-            event_id = get_an_id(event.get('event', {}).get('$ref'), 'events')
-            event_find = self._espn_instance.league.get_event_by_season(season=season,
-                                                                       event_id=event_id)
-            if not event_find:
-                event_content = fetch_espn_data(event.get('event', {}).get('$ref'))
-                event_find = Event(event_json=event_content,
-                                   espn_instance=self._espn_instance)
+            event_ref = event.get('event', {}).get('$ref')
+            event_find = get_event_core(event_id=get_an_id(event_ref, 'events'),
+                                        espn_instance=self._espn_instance,
+                                        url=event_ref)
             stats = []
             if event.get('played'):
                 stats_content = fetch_espn_data(event.get('statistics', {}).get('$ref'))
@@ -337,11 +337,7 @@ class Week:
         Populates the events list by fetching event data for the given week.
         """
         for event in self.week_list:
-            event_content = fetch_espn_data(event)
-            self._events.append(Event(event_json=event_content,
-                                      espn_instance=self._espn_instance,
-                                      load_game_odds=self._espn_instance.league.load_game_odds,
-                                      load_play_by_play=self._espn_instance.league.load_game_play_by_play))
+            self._events.append(self._fetch_event(event))
 
     def _set_week_datav2(self) -> None:
         """
@@ -372,11 +368,12 @@ class Week:
         Returns:
             Event: An Event instance.
         """
-        event_content = fetch_espn_data(event_url)
-        return Event(event_json=event_content,
-                     espn_instance=self._espn_instance,
-                     load_game_odds=self._espn_instance.league.load_game_odds,
-                     load_play_by_play=self._espn_instance.league.load_game_play_by_play)
+        from pyespn.core.games import get_event_core
+        return get_event_core(event_id=get_an_id(event_url, 'events'),
+                              espn_instance=self._espn_instance,
+                              url=event_url,
+                              load_game_odds=self._espn_instance.league.load_game_odds,
+                              load_play_by_play=self._espn_instance.league.load_game_play_by_play)
 
     def get_events(self) -> list["Event"]:
         """
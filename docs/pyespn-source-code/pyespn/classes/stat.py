@@ -201,7 +201,7 @@ class LeaderCategory:
         _load_leaders_data(): Loads the leader data from the provided JSON and initializes the class attributes.
     """
 
-    def __init__(self, leader_cat_json, espn_instance, season):
+    def __init__(self, leader_cat_json, espn_instance, season, athletes=None):
         """
         Initializes a LeaderCategory instance with the given data.
 
@@ -209,9 +209,11 @@ class LeaderCategory:
             leader_cat_json (dict): The JSON data for the leader category.
             espn_instance (object): An instance of the ESPN class for interacting with ESPN data.
             season (str or int): The season the leader category is related to.
+            athletes (dict, optional): Already resolved Player objects keyed by athlete id.
         """
         self.leader_cat_json = leader_cat_json
         self._espn_instance = espn_instance
+        self._resolved_athletes = athletes or {}
         self.athletes = {}
         self.season = season
         self._load_leaders_data()
@@ -252,7 +254,8 @@ class LeaderCategory:
             all_athletes.append(Leader(leader_json=ath,
                                        espn_instance=self._espn_instance,
                                        season=self.season,
-                                       rank=rank))
+                                       rank=rank,
+                                       athletes=self._resolved_athletes))
             rank += 1
         self.athletes[self.season] = all_athletes
 
@@ -290,7 +293,7 @@ class Leader:
         _load_leader_data(): Loads the leader data from the provided JSON, initializing athlete, team, and value.
     """
 
-    def __init__(self, leader_json, espn_instance, season, rank):
+    def __init__(self, leader_json, espn_instance, season, rank, athletes=None):
         """
         Initializes a Leader instance with the given leader data.
 
@@ -298,9 +301,11 @@ class Leader:
             leader_json (dict): The JSON data representing the leader's information.
             espn_instance (object): An instance of the ESPN class for interacting with ESPN data.
             rank (int): The rank of the athlete in the leader category.
+            athletes (dict, optional): Already resolved Player objects keyed by athlete id.
         """
         self.leader_json = leader_json
         self._espn_instance = espn_instance
+        self._resolved_athletes = athletes or {}
         self.rank = rank
         self.season = season
         self.athlete = None
@@ -329,10 +334,10 @@ class Leader:
         Loads the leader's data from the provided JSON.
 
         This method extracts the statistical value, the athlete reference, and
-        the team reference from the leader's JSON data. It fetches the athlete
-        information by calling `fetch_espn_data` if an athlete reference exists,
-        and it fetches the team information by calling `get_team_id` and
-        `get_team_by_id` if a team reference exists.
+        the team reference from the leader's JSON data. The athlete is taken from
+        the pre-resolved athletes when available, then from the team's roster,
+        and only fetched with `fetch_espn_data` as a last resort. The team is
+        found by calling `get_team_id` and `get_team_by_id` if a team reference exists.
 
         This method initializes the athlete and team attributes, as well as the
         statistical value and rank.
@@ -349,7 +354,9 @@ class Leader:
         if 'athlete' in self.rel:
             try:
                 athlete_id = get_athlete_id(self.leader_json.get('athlete', {}).get('$ref'))
-                self.athlete = self.team.get_player_by_season_id(season=self.season, player_id=athlete_id)
+                self.athlete = self._resolved_athletes.get(athlete_id)
+                if not self.athlete:
+                    self.athlete = self.team.get_player_by_season_id(season=self.season, player_id=athlete_id)
             except Exception as e:
                 print(e)
             finally:
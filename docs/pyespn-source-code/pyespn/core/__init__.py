@@ -1,20 +1,28 @@
 from .players import (get_player_info_core,
                       get_player_stat_urls_core,
                       get_player_ids_core,
+                      load_athlete_directory_core,
                       extract_stats_from_url_core,
+                      build_stats_from_content_core,
                       load_athletes_core)
-from .recruiting import get_recruiting_rankings_core
-from .games import get_game_info_core
+from .recruiting import get_recruiting_rankings_core, iter_recruiting_rankings_core
+from .games import get_game_info_core, get_event_core, clear_event_cache_core
 from .teams import (get_team_info_core, get_season_team_stats_core,
                     get_manufacturers_core)
 from .draft import get_draft_pick_data_core, load_draft_data_core
-from .orchestration import get_players_historical_stats_core
+from .orchestration import (get_players_historical_stats_core, get_many_players_historical_stats_core,
+                            fetch_season_stats_documents_core, clear_season_stats_cache_core,
+                            load_season_rosters_core,
+                            load_season_coaches_core, load_season_depth_charts_core,
+                            load_season_betting_records_core, load_season_results_core,
+                            load_season_team_stats_core, load_seasons_box_scores_core)
 from .betting import (get_year_league_champions_futures_core, get_division_champ_futures_core,
                       get_team_year_ats_away_core, get_team_year_ats_home_favorite_core,
                       get_team_year_ats_away_underdog_core, get_team_year_ats_favorite_core,
                       get_team_year_ats_home_core, get_team_year_ats_overall_core,
                       get_team_year_ats_underdog_core,
                       get_team_year_ats_home_underdog_core,
+                      get_team_year_ats_bundle_core, get_league_year_ats_core,
                       get_season_futures_core)
 from .awards import get_awards_core
 from .standings import get_standings_core
@@ -1,8 +1,6 @@
-from pyespn.utilities import lookup_league_api_info, get_athlete_id, fetch_espn_data
+from pyespn.utilities import lookup_league_api_info, get_athlete_id, fetch_espn_data, fetch_espn_json
 from pyespn.core.players import get_player_info_core
 from pyespn.data.version import espn_api_version as v
-import requests
-import json
 
 
 def get_awards_core(season, league_abbv) -> dict:
@@ -54,8 +52,7 @@ def get_awards_core(season, league_abbv) -> dict:
     awards_urls = content['items']
     awards = []
     for award_url in awards_urls:
-        award_response = requests.get(award_url['$ref'])
-        award_content = json.loads(award_response.content)
+        award_content = fetch_espn_json(award_url['$ref'])
         for winner in award_content['winners']:
             athlete_id = get_athlete_id(winner['athlete']['$ref'])
             athlete_info = get_player_info_core(player_id=athlete_id,
@@ -1,5 +1,6 @@
 from pyespn.utilities import (lookup_league_api_info, get_team_id, get_type_futures,
-                              get_type_ats, fetch_espn_data)
+                              fetch_espn_data)
+from pyespn.core.orchestration import fetch_all_core
 from pyespn.data.betting import LEAGUE_CHAMPION_FUTURES_MAP, LEAGUE_DIVISION_FUTURES_MAPPING
 from pyespn.data.teams import LEAGUE_TEAMS_MAPPING
 from pyespn.data.version import espn_api_version as v
@@ -19,12 +20,26 @@ def _get_team_ats(team_id, season, ats_type, league_abbv) -> dict:
     Returns:
         dict: The ATS data for the specified team and season.
     """
-    content = _get_team_year_ats(team_id=team_id,
-                                 season=season,
-                                 league_abbv=league_abbv)
-    ats = get_type_ats(data=content,
-                       ats_type=ats_type)
-    return ats
+    ats = get_team_year_ats_bundle_core(team_id=team_id,
+                                        season=season,
+                                        league_abbv=league_abbv)
+    return ats.get(ats_type)
+
+
+def _index_team_ats(content) -> dict:
+    """
+    Indexes a team's ATS document by type name, keeping the first entry of each type.
+
+    Args:
+        content (dict or None): The team's ATS document.
+
+    Returns:
+        dict: A mapping of ATS type name (e.g. 'atsHome') to its entry.
+    """
+    index = {}
+    for item in (content or {}).get('items', []):
+        index.setdefault(item.get('type', {}).get('name'), item)
+    return index
 
 
 def _get_futures_year(year, league_abbv):
@@ -72,6 +87,22 @@ def _get_futures_year_v2(year, league_abbv):
     return all_futures
 
 
+def _team_year_ats_url(team_id, season, league_abbv) -> str:
+    """
+    Builds the url of a team's Against The Spread (ATS) document for a given season.
+
+    Args:
+        team_id (int): The ID of the team.
+        season (int): The season year.
+        league_abbv (str): The league abbreviation.
+
+    Returns:
+        str: The ATS document url.
+    """
+    api_info = lookup_league_api_info(league_abbv=league_abbv)
+    return f'http://sports.core.api.espn.com/{v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/seasons/{season}/types/2/teams/{team_id}/ats?lang=en&region=us'
+
+
 def _get_team_year_ats(team_id, season, league_abbv):
     """
     Retrieves a team's Against The Spread (ATS) data for a given season.
@@ -84,13 +115,57 @@ def _get_team_year_ats(team_id, season, league_abbv):
     Returns:
         dict: The ATS data for the specified team and season.
     """
+    content = fetch_espn_data(_team_year_ats_url(team_id=team_id,
+                                                 season=season,
+                                                 league_abbv=league_abbv))
 
-    api_info = lookup_league_api_info(league_abbv=league_abbv)
+    return content
 
-    url = f'http://sports.core.api.espn.com/{v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/seasons/{season}/types/2/teams/{team_id}/ats?lang=en&region=us'
-    content = fetch_espn_data(url)
 
-    return content
+def get_team_year_ats_bundle_core(team_id, season, league_abbv) -> dict:
+    """
+    Retrieves every ATS split for a team's season from a single request.
+
+    Args:
+        team_id (int): The ID of the team.
+        season (int): The season year.
+        league_abbv (str): The league abbreviation.
+
+    Returns:
+        dict: A mapping of ATS type name (e.g. 'atsOverall', 'atsHomeUnderdog') to its entry.
+    """
+    content = _get_team_year_ats(team_id=team_id,
+                                 season=season,
+                                 league_abbv=league_abbv)
+    return _index_team_ats(content)
+
+
+def get_league_year_ats_core(season, espn_instance, team_ids=None) -> dict:
+    """
+    Retrieves every ATS split for many teams' seasons, one request per team on the client's shared executor.
+
+    Args:
+        season (int): The season year.
+        espn_instance (PYESPN): The espn client instance.
+        team_ids (list, optional): The team ids to load. Defaults to every team in the client.
+
+    Returns:
+        dict: A mapping of team id to that team's ATS splits by type name (an empty dict if the document failed to load).
+
+    Example:
+        >>> ats = get_league_year_ats_core(season=2024, espn_instance=espn)
+        >>> ats[12]['atsHomeUnderdog']['wins']
+    """
+    if team_ids is None:
+        team_ids = [team.team_id for team in espn_instance.teams]
+    urls = {team_id: _team_year_ats_url(team_id=team_id,
+                                        season=season,
+                                        league_abbv=espn_instance.league_abbv)
+            for team_id in team_ids}
+    contents = fetch_all_core(urls=urls.values(),
+                              espn_instance=espn_instance)
+
+    return {team_id: _index_team_ats(contents.get(url)) for team_id, url in urls.items()}
 
 
 def get_season_futures_core(season, league_abbv, espn_instance):
@@ -193,6 +268,9 @@ def get_team_year_ats_overall_core(team_id, season, league_abbv):
     """
     Retrieves a team's overall ATS data for a given season.
 
+    Not memoized, every call fetches the team's ATS document again; use
+    `PYESPN.get_team_year_ats` to read several splits from one fetch.
+
     Args:
         team_id (int): The ID of the team.
         season (int): The season year.
@@ -211,6 +289,9 @@ def get_team_year_ats_favorite_core(team_id, season, league_abbv):
     """
     Retrieves a team's ATS data when playing as a favorite.
 
+    Not memoized, every call fetches the team's ATS document again; use
+    `PYESPN.get_team_year_ats` to read several splits from one fetch.
+
     Args:
         team_id (int): The ID of the team.
         season (int): The season year.
@@ -230,6 +311,9 @@ def get_team_year_ats_underdog_core(team_id, season, league_abbv):
     """
     Retrieves a team's ATS data when playing as an underdog.
 
+    Not memoized, every call fetches the team's ATS document again; use
+    `PYESPN.get_team_year_ats` to read several splits from one fetch.
+
     Args:
         team_id (int): The ID of the team.
         season (int): The season year.
@@ -249,6 +333,9 @@ def get_team_year_ats_away_core(team_id, season, league_abbv):
     """
     Retrieves a team's ATS data when playing away.
 
+    Not memoized, every call fetches the team's ATS document again; use
+    `PYESPN.get_team_year_ats` to read several splits from one fetch.
+
     Args:
         team_id (int): The ID of the team.
         season (int): The season year.
@@ -268,6 +355,9 @@ def get_team_year_ats_home_core(team_id, season, league_abbv):
     """
     Retrieves a team's ATS data when playing at home.
 
+    Not memoized, every call fetches the team's ATS document again; use
+    `PYESPN.get_team_year_ats` to read several splits from one fetch.
+
     Args:
         team_id (int): The ID of the team.
         season (int): The season year.
@@ -287,6 +377,9 @@ def get_team_year_ats_home_favorite_core(team_id, season, league_abbv):
     """
     Retrieves a team's home favorite ATS data for a given season.
 
+    Not memoized, every call fetches the team's ATS document again; use
+    `PYESPN.get_team_year_ats` to read several splits from one fetch.
+
     Args:
         team_id (int): The ID of the team.
         season (int): The season year.
@@ -305,6 +398,9 @@ def get_team_year_ats_away_underdog_core(team_id, season, league_abbv):
     """
     Retrieves a team's ATS data when playing as an away underdog.
 
+    Not memoized, every call fetches the team's ATS document again; use
+    `PYESPN.get_team_year_ats` to read several splits from one fetch.
+
     Args:
         team_id (int): The ID of the team.
         season (int): The season year.
@@ -324,6 +420,9 @@ def get_team_year_ats_home_underdog_core(team_id, season, league_abbv):
     """
     Retrieves a team's ATS data when playing as a home underdog.
 
+    Not memoized, every call fetches the team's ATS document again; use
+    `PYESPN.get_team_year_ats` to read several splits from one fetch.
+
     Args:
         team_id (int): The ID of the team.
         season (int): The season year.
@@ -11,6 +11,7 @@ from .decorators import *
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 import concurrent.futures
+import threading
 
 if TYPE_CHECKING:
     from pyespn.classes import Team, Player, Recruit, Event, League  # Only imports for type checking
@@ -40,10 +41,12 @@ class PYESPN:
         athletes (dict): Athlete metadata and statistics by season.
         manufacturers (dict): Manufacturer/team-like objects (e.g., F1 constructors).
         v (str): ESPN API version.
+        executor (ThreadPoolExecutor): Shared, bounded worker pool used by the league-wide loaders.
 
     Args:
         sport_league (str): Abbreviation of the league to interact with (default is `'nfl'`).
         load_teams (bool): Whether to immediately load team data (default is `True`).
+        max_workers (int): Size of the shared worker pool used for league-wide loads (default is `16`).
 
     Example:
         >>> from pyespn import PYESPN
@@ -56,13 +59,14 @@ class PYESPN:
     untested_leagues = {league['league_abbv'] for league in LEAGUE_API_MAPPING if league['status'] == 'untested'}
     all_leagues = {league['league_abbv'] for league in LEAGUE_API_MAPPING if league['status'] == 'unavailable'}
 
-    def __init__(self, sport_league='nfl', load_teams=True):
+    def __init__(self, sport_league='nfl', load_teams=True, max_workers=16):
         """
         Initializes the PYESPN instance for a specified sport league.
 
         Args:
             sport_league (str): The abbreviation of the league to interact with (default is 'nfl').
             load_teams (bool): Whether to load team data (default is True).
+            max_workers (int): The number of workers in the shared pool used for league-wide loads (default is 16).
         """
         self._league_abbv = sport_league.lower()
         self._team_id_mapping = LEAGUE_TEAMS_MAPPING.get(self._league_abbv)
@@ -72,12 +76,19 @@ class PYESPN:
         self._api_mapping = lookup_league_api_info(league_abbv=self._league_abbv)
         self._v = v
         self._rpp = rpp
+        self._max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
         self._teams = []
         self.standings = {}
         self.recruit_rankings = {}
         self.drafts = {}
         self.manufacturers = {}
         self.athletes = {}
+        self._ats = {}
+        self._ats_lock = threading.Lock()
+        self._events = {}
+        self._events_lock = threading.Lock()
         self._league = None
         self._load_league_data()
         if load_teams:
@@ -149,6 +160,26 @@ class PYESPN:
         """
         return self._api_mapping
 
+    @property
+    def executor(self):
+        """
+        ThreadPoolExecutor: the shared, bounded worker pool for league-wide loads (created on first use)
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers,
+                                                                           thread_name_prefix='pyespn')
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Shuts down the shared worker pool, waiting for any in-flight work to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the PYESPN instance.
@@ -236,6 +267,23 @@ class PYESPN:
                                     league_abbv=self._league_abbv,
                                     espn_instance=self)
 
+    def get_many_players_historical_stats(self, player_ids) -> dict:
+        """
+        Retrieves the historical statistics for many players at once.
+
+        The players' season documents are fetched concurrently and finished seasons
+        are cached for the life of the process.
+
+        Args:
+            player_ids (list): The IDs of the players.
+
+        Returns:
+            dict: A mapping of player ID to that player's historical statistics by season.
+        """
+        return get_many_players_historical_stats_core(player_ids=player_ids,
+                                                      league_abbv=self._league_abbv,
+                                                      espn_instance=self)
+
     def get_player_ids(self) -> list:
         """
         Retrieves the IDs of all players in the league.
@@ -243,7 +291,29 @@ class PYESPN:
         Returns:
             list: A list of player IDs.
         """
-        return get_player_ids_core(league_abbv=self._league_abbv)
+        return get_player_ids_core(league_abbv=self._league_abbv,
+                                   espn_instance=self)
+
+    def load_athlete_directory(self, refresh=False, max_age=None, verbose=False) -> dict:
+        """
+        Builds or updates the on-disk directory of every athlete in the league.
+
+        Only athletes that are new since the last run (or older than `max_age`) are fetched,
+        and progress is saved as it goes so an interrupted build resumes.
+
+        Args:
+            refresh (bool, optional): Fetch every athlete again. Defaults to False.
+            max_age (float, optional): Refetch athletes saved more than this many seconds ago. Defaults to never.
+            verbose (bool, optional): Show a progress bar. Defaults to False.
+
+        Returns:
+            dict: A mapping of athlete id to its id, name, position, team_id, jersey, headshot, ref and fetched_at.
+        """
+        return load_athlete_directory_core(league_abbv=self._league_abbv,
+                                           espn_instance=self,
+                                           refresh=refresh,
+                                           max_age=max_age,
+                                           verbose=verbose)
 
     @requires_college_league('recruiting')
     def get_recruiting_rankings(self, season, max_pages=None) -> list["Recruit"]:
@@ -262,29 +332,58 @@ class PYESPN:
                                             espn_instance=self,
                                             max_pages=max_pages)
 
+    @requires_college_league('recruiting')
+    def iter_recruiting_rankings(self, season, max_pages=None):
+        """
+        Streams the recruiting rankings for a given season in rank order as pages arrive.
+
+        Args:
+            season (int): The season for which to retrieve rankings.
+            max_pages (int, optional): The maximum number of pages of data to retrieve.
+
+        Yields:
+            Recruit: The recruits, in rank order.
+        """
+        return iter_recruiting_rankings_core(season=season,
+                                             league_abbv=self._league_abbv,
+                                             espn_instance=self,
+                                             max_pages=max_pages)
+
     def load_year_recruiting_rankings(self, year: int):
         """
         Loads the regular season recruiting rankings for a given season and stores it in the `recruiting rankings` attribute.
 
+        Previously loaded years are kept.
+
         Args:
             year (int): The season for which to load the recruiting rankings.
         """
 
-        self.recruit_rankings = {year: self.get_recruiting_rankings(season=year)}
+        self.recruit_rankings[year] = self.get_recruiting_rankings(season=year)
 
-    def get_game_info(self, event_id) -> "Event":
+    def get_game_info(self, event_id, refresh=False) -> "Event":
         """
         Retrieves detailed information about a specific game.
 
+        Games are shared with schedules and player game logs loaded by this client, see `get_event_core`.
+
         Args:
             event_id (str or int): The ID of the game.
+            refresh (bool, optional): Re-check the game even if it was loaded recently. Defaults to False.
 
         Returns:
             Event: The game's information.
         """
         return get_game_info_core(event_id=event_id,
                                   league_abbv=self._league_abbv,
-                                  espn_instnace=self)
+                                  espn_instance=self,
+                                  refresh=refresh)
+
+    def clear_events(self) -> None:
+        """
+        Forgets every game this client has loaded, so the next lookups fetch them again.
+        """
+        clear_event_cache_core(espn_instance=self)
 
     def get_season_team_stats(self, season) -> dict:
         """
@@ -364,7 +463,7 @@ class PYESPN:
         Loads player-level box score data for all teams in a given season.
 
         This method first ensures that rosters are loaded for the specified season,
-        then calls each team's method to load box score data for all players on their roster.
+        then schedules every rostered player's box score load on the shared executor.
 
         Args:
             season (int or int): The season year for which to load box score data.
@@ -372,23 +471,22 @@ class PYESPN:
         Returns:
             None
         """
-        self.load_season_rosters(season=season)
-        for team in self._teams:
-            team.load_season_roster_box_score(season=season)
+        load_seasons_box_scores_core(season=season,
+                                     espn_instance=self)
 
     def load_season_depth_charts(self, season):
         """
         Loads depth charts for all teams in the league for a given season.
 
         This method first ensures that team rosters are loaded for the specified season,
-        then iterates through each team in the league and loads their individual depth charts.
+        then fetches every team's depth chart concurrently on the shared executor.
 
         Args:
             season (int): The season year for which to load depth chart data.
         """
         self.load_season_rosters(season=season)
-        for team in self._teams:
-            team.load_season_depth_chart(season=season)
+        load_season_depth_charts_core(season=season,
+                                      espn_instance=self)
 
     def get_team_by_id(self, team_id) -> "Team":
         """
@@ -406,9 +504,10 @@ class PYESPN:
         """
         Loads the season roster for all teams in the league if not already loaded.
 
-        This method iterates through each team in the league and checks if the roster
-        for the given season is already present. If not, it calls the team's
-        `load_season_roster` method to fetch and store the data.
+        Teams whose roster for the given season is already present are skipped. The
+        remaining teams' athlete lists are collected and every athlete is fetched in one
+        batch on the shared executor, so the load is bounded by `max_workers` rather
+        than by the number of teams.
 
         Args:
             season (int or str): The season year for which to load rosters.
@@ -424,23 +523,24 @@ class PYESPN:
             [<Player | John Doe>, <Player | Jane Smith>, ...]
         """
 
-        for team in self._teams:
-            if season not in team.roster:
-                team.load_season_roster(season=season)
+        missing = [team for team in self._teams if season not in team.roster]
+        if missing:
+            load_season_rosters_core(season=season,
+                                     espn_instance=self,
+                                     teams=missing)
 
     def load_season_team_stats(self, season) -> None:
         """
         Loads seasonal statistical data for each team in the league.
 
-        Iterates through all teams in the current league instance and calls each team's
-        `load_team_season_stats` method, passing in the specified season. This typically
-        includes team-level metrics such as points scored, allowed, total yardage, turnovers, etc.
+        Every team's statistics pages are fetched concurrently on the shared executor. This
+        typically includes team-level metrics such as points scored, allowed, total yardage, turnovers, etc.
 
         Args:
             season (int): The season year for which team stats should be retrieved.
         """
-        for team in self._teams:
-            team.load_team_season_stats(season=season)
+        load_season_team_stats_core(season=season,
+                                    espn_instance=self)
 
     def load_season_league_stat_leaders(self, season) -> None:
         """
@@ -464,44 +564,94 @@ class PYESPN:
         """
         Loads the betting records for each team in the specified season.
 
-        This method iterates over all the teams in the instance and calls the
-        `load_season_betting_records` method on each team to load their
-        respective betting records for the given season.
+        Every team's odds-records pages are fetched concurrently on the shared executor
+        and stored on each team's `betting` attribute for the given season.
 
         Args:
             season (str or int): The season for which the betting records need to be loaded.
                                 This can be a string (e.g., "2023") or an integer (e.g., 2023).
         """
-        for team in self._teams:
-            team.load_season_betting_records(season=season)
+        load_season_betting_records_core(season=season,
+                                         espn_instance=self)
+
+    def get_league_year_ats(self, season, team_ids=None, refresh=False) -> dict:
+        """
+        Retrieves every Against The Spread (ATS) split for many teams in one pass.
+
+        Each team's ATS document is fetched once, concurrently on the shared executor,
+        and kept on the client so later calls for the same team and season are free.
+        Documents that failed to load come back empty and are fetched again next time.
+
+        Args:
+            season (int): The season year.
+            team_ids (list, optional): The team ids to load. Defaults to every team in the league.
+            refresh (bool, optional): Refetch teams that were already loaded. Defaults to False.
+
+        Returns:
+            dict: A mapping of team id to that team's ATS splits by type name (see `pyespn.data.betting.ATS_TYPES`).
+        """
+        if team_ids is None:
+            team_ids = [team.team_id for team in self.teams]
+        with self._ats_lock:
+            found = {team_id: self._ats[(str(season), str(team_id))] for team_id in team_ids
+                     if not refresh and (str(season), str(team_id)) in self._ats}
+        missing = [team_id for team_id in team_ids if team_id not in found]
+        if missing:
+            loaded = get_league_year_ats_core(season=season,
+                                              espn_instance=self,
+                                              team_ids=missing)
+            found.update(loaded)
+            with self._ats_lock:
+                for team_id, ats in loaded.items():
+                    # an empty index is a failed fetch, keeping it would hide the team until refresh
+                    if ats:
+                        self._ats[(str(season), str(team_id))] = ats
+        return {team_id: found[team_id] for team_id in team_ids}
+
+    def get_team_year_ats(self, team_id, season, ats_type=None, refresh=False):
+        """
+        Retrieves a team's Against The Spread (ATS) splits for a season.
+
+        Args:
+            team_id (int): The ID of the team.
+            season (int): The season year.
+            ats_type (str, optional): A single split to return (e.g. 'atsHomeUnderdog'). Defaults to all of them.
+            refresh (bool, optional): Refetch the team's document even if it was already loaded. Defaults to False.
+
+        Returns:
+            dict: The team's ATS splits by type name, or the single requested split (None if ESPN has no entry for it).
+        """
+        ats = self.get_league_year_ats(season=season,
+                                       team_ids=[team_id],
+                                       refresh=refresh)[team_id]
+        return ats if ats_type is None else ats.get(ats_type)
 
     def load_season_teams_results(self, season) -> None:
         """
         Loads win/loss and game result data for each team in the specified season.
 
-        For each team in the league, this method calls `load_season_results`, which
-        fetches the outcomes of all games played during the season, including opponent
-        data, scores, home/away context, and dates.
+        Every team's season record document is fetched concurrently on the shared executor,
+        including opponent data, scores, home/away context, and dates.
 
         Args:
             season (int): The season year for which game results should be retrieved.
         """
-        for team in self._teams:
-            team.load_season_results(season=season)
+        load_season_results_core(season=season,
+                                 espn_instance=self)
 
     def load_season_coaches(self, season) -> None:
         """
         Loads coaching staff information for each team for the specified season.
 
-        This method calls each team's `load_season_coaches` method, which typically
-        retrieves data such as head coach, offensive/defensive coordinators, tenure,
-        and any mid-season coaching changes.
+        Coach references for every team are collected and each coach is then fetched in one
+        batch on the shared executor. This typically includes the head coach,
+        offensive/defensive coordinators, tenure, and any mid-season coaching changes.
 
         Args:
             season (int): The season year for which coaching data should be retrieved.
         """
-        for team in self._teams:
-            team.load_season_coaches(season=season)
+        load_season_coaches_core(season=season,
+                                 espn_instance=self)
 
     def load_athletes(self, season) -> None:
         """
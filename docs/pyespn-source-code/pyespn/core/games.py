@@ -1,27 +1,138 @@
-from pyespn.utilities import lookup_league_api_info, fetch_espn_data
+from pyespn.utilities import lookup_league_api_info, fetch_espn_data, record_cache_lookup
 from pyespn.data.version import espn_api_version as v
 from pyespn.classes import Event
+import threading
+import time
 
+# how long (seconds) a stored event is served before its status is checked again, by competition state.
+# finished games never change, so once an event is known to be 'post' it is never checked again.
+EVENT_MAX_AGE = {
+    'pre': 10 * 60,
+    'in': 30,
+    None: 5 * 60,
+}
 
-def get_game_info_core(event_id, league_abbv, espn_instnace) -> Event:
+
+def _event_url(event_id, league_abbv) -> str:
+    api_info = lookup_league_api_info(league_abbv=league_abbv)
+    return f'http://sports.core.api.espn.com/{v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/events/{event_id}?lang=en&region=us'
+
+
+def _revalidate_event(entry, requested) -> None:
+    """
+    Brings a stored event up to date according to its competition state.
+
+    Games that are still scheduled only have their status checked, in progress games
+    (or games whose state is unknown) are reloaded, and a game seen final after any
+    other state is reloaded one last time and then never checked again. An event built
+    without a known state has it resolved on its first check, and is only reloaded then
+    if it was built longer ago than `EVENT_MAX_AGE` allows for that state. Only one thread
+    revalidates an entry at a time; threads that asked while it ran reuse its result.
+    """
+    with entry['lock']:
+        if entry['checked'] >= requested:
+            return
+        event = entry['event']
+        state = event.fetch_state()
+        if not entry['resolved']:
+            reload = state != 'pre' and requested - entry['checked'] > EVENT_MAX_AGE.get(state, EVENT_MAX_AGE[None])
+        else:
+            reload = not (state == 'post' and entry['state'] == 'post') and state != 'pre'
+        if reload:
+            event.refresh()
+        entry['state'] = state
+        entry['resolved'] = True
+        entry['checked'] = time.monotonic()
+
+
+def get_event_core(event_id, espn_instance, url=None, event_json=None,
+                   load_game_odds=False, load_play_by_play=False, refresh=False) -> Event:
+    """
+    Returns the client's canonical `Event` for an event id, building it only the first time.
+
+    Every event the client loads (schedules, game info, player game logs) is kept in one
+    identity map on the client, so the same game is fetched and constructed once and every
+    caller shares the same instance. Stored events are re-checked once they are older than
+    `EVENT_MAX_AGE` for their state; finished games are kept forever.
+
+    Args:
+        event_id (int or str): The event id.
+        espn_instance (PYESPN): The espn client that owns the identity map.
+        url (str, optional): The event's api url. Built from the id if not given.
+        event_json (dict, optional): The already fetched event document, saves a request on a miss.
+        load_game_odds (bool, optional): Make sure the event's betting odds are loaded. Defaults to False.
+        load_play_by_play (bool, optional): Make sure the event's play by play is loaded. Defaults to False.
+        refresh (bool, optional): Re-check the event now regardless of its age. Defaults to False.
+
+    Returns:
+        Event: The canonical event instance.
+    """
+    key = str(event_id)
+    with espn_instance._events_lock:
+        entry = espn_instance._events.get(key)
+    record_cache_lookup(cache='event', hit=entry is not None)
+
+    if entry is None:
+        content = event_json or fetch_espn_data(url or _event_url(event_id=event_id,
+                                                                  league_abbv=espn_instance.league_abbv))
+        event = Event(event_json=content,
+                      espn_instance=espn_instance,
+                      load_game_odds=load_game_odds,
+                      load_play_by_play=load_play_by_play)
+        # a game that is already final when it is built is never checked again. The core api
+        # usually only links to the status, then the state is left to the next lookup rather
+        # than spending a request on it here
+        state = event.known_state
+        with espn_instance._events_lock:
+            # another thread may have built the same event meanwhile, the first one stored wins
+            entry = espn_instance._events.setdefault(key, {'event': event,
+                                                           'state': state,
+                                                           'resolved': state is not None,
+                                                           'checked': time.monotonic(),
+                                                           'lock': threading.Lock()})
+    elif entry['state'] != 'post' or refresh:
+        now = time.monotonic()
+        max_age = EVENT_MAX_AGE.get(entry['state'], EVENT_MAX_AGE[None])
+        if refresh or not entry['resolved'] or now - entry['checked'] > max_age:
+            _revalidate_event(entry, requested=now)
+
+    event = entry['event']
+    if load_game_odds and event.odds is None:
+        event.load_betting_odds()
+    if load_play_by_play and event.drives is None and event.plays is None:
+        event.load_play_by_play()
+    return event
+
+
+def clear_event_cache_core(espn_instance) -> None:
+    """
+    Forgets every event stored on the client.
+
+    Args:
+        espn_instance (PYESPN): The espn client that owns the identity map.
+    """
+    with espn_instance._events_lock:
+        espn_instance._events.clear()
+
+
+def get_game_info_core(event_id, league_abbv, espn_instance, refresh=False) -> Event:
     """
     Retrieves detailed information for a specific game event.
 
     Args:
         event_id (int): The unique identifier for the game event.
         league_abbv (str): The abbreviation of the league.
-        espn_instnace (object): An instance of the ESPN API handler.
+        espn_instance (object): An instance of the ESPN API handler.
+        refresh (bool, optional): Re-check the game even if it was loaded recently. Defaults to False.
 
     Returns:
         Event: An Event object containing details about the game.
     """
-
-    api_info = lookup_league_api_info(league_abbv=league_abbv)
-    url = f'http://sports.core.api.espn.com/{v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/events/{event_id}?lang=en&region=us'
-    content = fetch_espn_data(url)
-    current_event = Event(event_json=content,
-                          espn_instance=espn_instnace)
-    return current_event
+    return get_event_core(event_id=event_id,
+                          espn_instance=espn_instance,
+                          url=_event_url(event_id=event_id,
+                                         league_abbv=league_abbv),
+                          refresh=refresh)
 
 
 # todo i think this doesn't work
@@ -1,8 +1,110 @@
-from pyespn.utilities import get_an_id
+from pyespn.utilities import get_an_id, fetch_espn_data, record_cache_lookup
+from concurrent.futures import as_completed
+import threading
+
+_finished_season_stats = {}
+_finished_season_stats_lock = threading.Lock()
+
+
+def _is_finished_season(season, espn_instance) -> bool:
+    """
+    Checks whether a season is over, i.e. earlier than the league's current season.
+    """
+    current = (getattr(espn_instance.league, 'season', None) or {}).get('year')
+    try:
+        return current is not None and int(season) < int(current)
+    except (TypeError, ValueError):
+        return False
+
+
+def fetch_season_stats_documents_core(urls, espn_instance) -> dict:
+    """
+    Fetches player season statistics documents, serving finished seasons from memory.
+
+    A finished season's statistics never change, so once fetched the document is kept
+    for the life of the process. The current season is always fetched fresh.
+
+    Args:
+        urls (Iterable[str]): The season statistics urls.
+        espn_instance (PYESPN): The espn client whose shared executor is used.
+
+    Returns:
+        dict: A mapping of url to the statistics document (or None if it couldn't be fetched).
+    """
+    urls = set(urls)
+    cached = {url: _finished_season_stats[url] for url in urls if url in _finished_season_stats}
+    for url in urls:
+        record_cache_lookup(cache='season_stats', hit=url in cached)
+    fetched = fetch_all_core(urls=[url for url in urls if url not in cached],
+                             espn_instance=espn_instance)
+
+    with _finished_season_stats_lock:
+        for url, content in fetched.items():
+            if content and _is_finished_season(get_an_id(url=url, slug='seasons'), espn_instance):
+                _finished_season_stats[url] = content
+
+    return {**fetched, **cached}
+
+
+def clear_season_stats_cache_core() -> None:
+    """
+    Drops every cached finished season statistics document.
+    """
+    with _finished_season_stats_lock:
+        _finished_season_stats.clear()
+
+
+def get_many_players_historical_stats_core(player_ids, league_abbv, espn_instance) -> dict:
+    """
+    Retrieves the historical statistics of many players at once.
+
+    Every player's statistics log is fetched concurrently on the client's shared executor,
+    then every season document across all of the players is fetched in one batch.
+    Finished seasons are served from memory after the first fetch.
+
+    Args:
+        player_ids (Iterable[str]): The unique identifiers of the players.
+        league_abbv (str): The abbreviation of the league.
+        espn_instance (PYESPN): The espn client instance.
+
+    Returns:
+        dict: A mapping of player id to that player's dict of historical statistics.
+    """
+    from pyespn.core.players import build_stats_from_content_core, get_player_stat_urls_core
+
+    stat_urls = {}
+    futures = {espn_instance.executor.submit(get_player_stat_urls_core,
+                                             player_id=player_id,
+                                             league_abbv=league_abbv): player_id
+               for player_id in set(player_ids)}
+    for future in as_completed(futures):
+        player_id = futures[future]
+        try:
+            stat_urls[player_id] = future.result()
+        except Exception as e:
+            print(f"Failed to fetch the statistics log for player {player_id}: {e}")
+            stat_urls[player_id] = []
+
+    documents = fetch_season_stats_documents_core(urls=[url for urls in stat_urls.values() for url in urls],
+                                                  espn_instance=espn_instance)
+
+    all_historical_stats = {}
+    for player_id, urls in stat_urls.items():
+        historical_player_stats = {}
+        for url in urls:
+            content = documents.get(url)
+            if not content:
+                continue
+            year = get_an_id(url=url, slug='seasons')
+            historical_player_stats[year] = build_stats_from_content_core(url=url,
+                                                                          content=content,
+                                                                          espn_instance=espn_instance)
+        all_historical_stats[player_id] = historical_player_stats
+
+    return all_historical_stats
 
 
 def get_players_historical_stats_core(player_id, league_abbv, espn_instance) -> dict:
-    from pyespn.core.players import extract_stats_from_url_core, get_player_stat_urls_core
     """
     Retrieves the historical statistics of a player.
 
@@ -13,13 +115,282 @@ def get_players_historical_stats_core(player_id, league_abbv, espn_instance) ->
     Returns:
         dict: A dict of historical player statistics extracted from various URLs.
     """
-    historical_player_stats = {}
-    urls = get_player_stat_urls_core(player_id=player_id,
-                                     league_abbv=league_abbv)
-    for url in urls:
-        year = get_an_id(url=url, slug='seasons')
+    return get_many_players_historical_stats_core(player_ids=[player_id],
+                                                  league_abbv=league_abbv,
+                                                  espn_instance=espn_instance).get(player_id, {})
+
+
+def _team_season_url(espn_instance, team, season, endpoint, season_type=None) -> str:
+    """
+    Builds the core api url for a team/season endpoint (e.g. athletes, coaches, depthcharts).
+
+    Args:
+        espn_instance (PYESPN): The espn client instance.
+        team (Team): The team the url is for.
+        season (int): The season year.
+        endpoint (str): The trailing endpoint name.
+        season_type (int, optional): The season type to include in the url, if the endpoint needs one.
+
+    Returns:
+        str: The fully built url.
+    """
+    api_info = espn_instance.api_mapping
+    types = f'/types/{season_type}' if season_type is not None else ''
+    return f'http://sports.core.api.espn.com/{espn_instance.v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/seasons/{season}{types}/teams/{team.team_id}/{endpoint}'
+
+
+def _page_url(url, page) -> str:
+    """
+    Appends a page query parameter to a url, respecting any existing query string.
+    """
+    separator = '&' if '?' in url else '?'
+    return f'{url}{separator}page={page}'
+
+
+def fetch_all_core(urls, espn_instance) -> dict:
+    """
+    Fetches every url on the client's shared executor.
+
+    Duplicate urls are only fetched once. Failed requests are reported and mapped to None
+    so one bad document doesn't abort a league-wide load.
+
+    Args:
+        urls (Iterable[str]): The urls to fetch.
+        espn_instance (PYESPN): The espn client whose shared executor is used.
+
+    Returns:
+        dict: A mapping of url to the parsed response (or None).
+    """
+    results = {}
+    futures = {espn_instance.executor.submit(fetch_espn_data, url): url for url in set(urls) if url}
+    for future in as_completed(futures):
+        url = futures[future]
+        try:
+            results[url] = future.result()
+        except Exception as e:
+            print(f"Failed to fetch {url}: {e}")
+            results[url] = None
+    return results
+
+
+def fetch_paged_core(urls_by_key, espn_instance) -> dict:
+    """
+    Fetches every page of several paginated endpoints on the client's shared executor.
+
+    The first page of every endpoint is fetched concurrently to learn the page counts,
+    then all of the remaining pages across every endpoint are fetched in one batch.
+
+    Args:
+        urls_by_key (dict): A mapping of a caller chosen key (e.g. a Team) to the endpoint url.
+        espn_instance (PYESPN): The espn client whose shared executor is used.
 
-        historical_player_stats[year] = extract_stats_from_url_core(url=url,
-                                                                    espn_instance=espn_instance)
+    Returns:
+        dict: A mapping of each key to the list of its page responses, in page order.
+    """
+    first_pages = fetch_all_core(urls=urls_by_key.values(),
+                                 espn_instance=espn_instance)
+    remaining = {}
+    for key, url in urls_by_key.items():
+        page_count = (first_pages.get(url) or {}).get('pageCount', 1) or 1
+        remaining[key] = [_page_url(url, page) for page in range(2, page_count + 1)]
+
+    other_pages = fetch_all_core(urls=[url for urls in remaining.values() for url in urls],
+                                 espn_instance=espn_instance)
+
+    pages = {}
+    for key, url in urls_by_key.items():
+        key_pages = [first_pages.get(url)] + [other_pages.get(page_url) for page_url in remaining[key]]
+        pages[key] = [page for page in key_pages if page is not None]
+    return pages
+
+
+def fetch_paged_items_core(urls_by_key, espn_instance, items_key='items') -> dict:
+    """
+    Fetches every page of several paginated endpoints and combines their items.
+
+    Args:
+        urls_by_key (dict): A mapping of a caller chosen key (e.g. a Team) to the endpoint url.
+        espn_instance (PYESPN): The espn client whose shared executor is used.
+        items_key (str, optional): The key holding the items list in each page. Defaults to 'items'.
+
+    Returns:
+        dict: A mapping of each key to the combined list of items across all of its pages.
+    """
+    pages = fetch_paged_core(urls_by_key=urls_by_key,
+                             espn_instance=espn_instance)
+    return {key: [item for page in key_pages for item in page.get(items_key, [])]
+            for key, key_pages in pages.items()}
+
+
+def load_season_rosters_core(season, espn_instance, teams=None) -> None:
+    """
+    Loads the season roster for many teams at once through the client's shared executor.
+
+    Athlete references for every team are collected first, then every athlete across the
+    league is fetched in one bounded batch, so a league-wide load is limited by the
+    executor's worker count rather than by the number of teams.
+
+    Args:
+        season (int): The season year for which to load rosters.
+        espn_instance (PYESPN): The espn client instance.
+        teams (list[Team], optional): The teams to load. Defaults to every team in the client.
+    """
+    from pyespn.classes.player import Player
+    teams = espn_instance.teams if teams is None else teams
+    urls = {team: _team_season_url(espn_instance, team, season, 'athletes') for team in teams}
+    refs = fetch_paged_items_core(urls_by_key=urls,
+                                  espn_instance=espn_instance)
+    athletes = fetch_all_core(urls=[item.get('$ref') for items in refs.values() for item in items],
+                              espn_instance=espn_instance)
+
+    for team, items in refs.items():
+        roster = []
+        for item in items:
+            athlete_content = athletes.get(item.get('$ref'))
+            if athlete_content:
+                roster.append(Player(player_json=athlete_content,
+                                     espn_instance=espn_instance))
+        team.roster[season] = roster
+
+
+def load_season_coaches_core(season, espn_instance, teams=None) -> None:
+    """
+    Loads the coaching staff for many teams at once through the client's shared executor.
+
+    Args:
+        season (int): The season year for which coaching data should be loaded.
+        espn_instance (PYESPN): The espn client instance.
+        teams (list[Team], optional): The teams to load. Defaults to every team in the client.
+    """
+    from pyespn.classes.player import Player
+    teams = espn_instance.teams if teams is None else teams
+    urls = {team: _team_season_url(espn_instance, team, season, 'coaches?lang=en&region=us') for team in teams}
+    refs = fetch_paged_items_core(urls_by_key=urls,
+                                  espn_instance=espn_instance)
+    coaches = fetch_all_core(urls=[item.get('$ref') for items in refs.values() for item in items],
+                             espn_instance=espn_instance)
+
+    for team, items in refs.items():
+        team.coaches[season] = [Player(player_json=coaches.get(item.get('$ref')),
+                                       espn_instance=espn_instance)
+                                for item in items if coaches.get(item.get('$ref'))]
+
+
+def load_season_depth_charts_core(season, espn_instance, teams=None) -> None:
+    """
+    Loads the depth chart for many teams at once through the client's shared executor.
+
+    Args:
+        season (int): The season year for which to load depth charts.
+        espn_instance (PYESPN): The espn client instance.
+        teams (list[Team], optional): The teams to load. Defaults to every team in the client.
+    """
+    from pyespn.classes.roster import DepthChart
+    teams = espn_instance.teams if teams is None else teams
+    urls = {team: _team_season_url(espn_instance, team, season, 'depthcharts') for team in teams}
+    charts = fetch_paged_items_core(urls_by_key=urls,
+                                    espn_instance=espn_instance)
+
+    for team, items in charts.items():
+        team.depth_charts[season] = [DepthChart(depth_chart_json=item,
+                                                espn_instance=espn_instance,
+                                                team_instance=team)
+                                     for item in items]
+
+
+def load_season_betting_records_core(season, espn_instance, teams=None) -> None:
+    """
+    Loads the betting odds records for many teams at once through the client's shared executor.
+
+    Args:
+        season (int): The season year to fetch betting odds records for.
+        espn_instance (PYESPN): The espn client instance.
+        teams (list[Team], optional): The teams to load. Defaults to every team in the client.
+    """
+    from pyespn.classes.stat import Record
+    teams = espn_instance.teams if teams is None else teams
+    urls = {team: _team_season_url(espn_instance, team, season, 'odds-records', season_type=0) for team in teams}
+    records = fetch_paged_items_core(urls_by_key=urls,
+                                     espn_instance=espn_instance)
+
+    for team, items in records.items():
+        team.betting[season] = [Record(record_json=item,
+                                       espn_instance=espn_instance)
+                                for item in items]
+
+
+def load_season_results_core(season, espn_instance, teams=None) -> None:
+    """
+    Loads the seasonal game records for many teams at once through the client's shared executor.
+
+    Args:
+        season (int): The season year for which game results should be retrieved.
+        espn_instance (PYESPN): The espn client instance.
+        teams (list[Team], optional): The teams to load. Defaults to every team in the client.
+    """
+    from pyespn.classes.stat import Record
+    teams = espn_instance.teams if teams is None else teams
+    urls = {team: _team_season_url(espn_instance, team, season, 'record?lang=en&region=us', season_type=2) for team in teams}
+    contents = fetch_all_core(urls=urls.values(),
+                              espn_instance=espn_instance)
+
+    for team, url in urls.items():
+        content = contents.get(url)
+        if content is None:
+            continue
+        team.records[season] = [Record(record_json=item,
+                                       espn_instance=espn_instance)
+                                for item in content.get('items', [])]
+
+
+def load_season_team_stats_core(season, espn_instance, teams=None) -> None:
+    """
+    Loads team-level statistics for many teams at once through the client's shared executor.
+
+    Args:
+        season (int): The season year for which statistics should be retrieved.
+        espn_instance (PYESPN): The espn client instance.
+        teams (list[Team], optional): The teams to load. Defaults to every team in the client.
+    """
+    from pyespn.classes.stat import Stat
+    teams = espn_instance.teams if teams is None else teams
+    urls = {team: _team_season_url(espn_instance, team, season, 'statistics', season_type=2) for team in teams}
+    pages = fetch_paged_core(urls_by_key=urls,
+                             espn_instance=espn_instance)
+
+    for team, team_pages in pages.items():
+        if not team_pages:
+            continue
+        team.stats[season] = [Stat(stat_json=stat,
+                                   espn_instance=espn_instance)
+                              for page in team_pages
+                              for category in page.get('splits', {}).get('categories', [])
+                              for stat in category.get('stats', [])]
+
+
+def load_seasons_box_scores_core(season, espn_instance, teams=None) -> None:
+    """
+    Loads every rostered player's season box scores through the client's shared executor.
+
+    Rosters that aren't loaded yet are loaded first. Each player's game log is then a
+    single task on the shared executor rather than one serial loop per team.
+
+    Args:
+        season (int): The season year to load box score data for.
+        espn_instance (PYESPN): The espn client instance.
+        teams (list[Team], optional): The teams to load. Defaults to every team in the client.
+    """
+    teams = espn_instance.teams if teams is None else teams
+    missing = [team for team in teams if season not in team.roster]
+    if missing:
+        load_season_rosters_core(season=season,
+                                 espn_instance=espn_instance,
+                                 teams=missing)
 
-    return historical_player_stats
+    futures = {espn_instance.executor.submit(player.load_player_box_scores_season, season): player
+               for team in teams for player in team.roster.get(season, [])}
+    for future in as_completed(futures):
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Failed to load box scores for {futures[future]}: {e}")
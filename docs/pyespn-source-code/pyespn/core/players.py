@@ -1,46 +1,146 @@
-from pyespn.utilities import lookup_league_api_info, fetch_espn_data, get_an_id, get_athlete_id
+from pyespn.utilities import (lookup_league_api_info, fetch_espn_data, fetch_espn_json, get_an_id, get_athlete_id, get_team_id,
+                              cache_path, read_json_file, write_json_file, append_json_line, read_json_lines,
+                              record_cache_lookup)
 from pyespn.data.version import espn_api_version as v
 from pyespn.classes.player import Player
 from pyespn.classes.stat import Stat
+from pyespn.core.orchestration import fetch_all_core, fetch_paged_items_core
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
-import requests
-import json
+import os
+import time
 import warnings
 
+# every this many athletes are appended to the checkpoint so an interrupted build resumes
+ATHLETE_DIRECTORY_CHECKPOINT = 500
 
-def get_player_ids_core(league_abbv: str) -> list:
+
+def _athlete_directory_path(league_abbv) -> str:
+    return cache_path('athletes', league_abbv, 'directory.json')
+
+
+def _athlete_checkpoint_path(league_abbv) -> str:
+    return cache_path('athletes', league_abbv, 'directory.checkpoint.jsonl')
+
+
+def _remove_file(path) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _athlete_directory_entry(content) -> dict:
     """
-    Retrieves a list of player IDs and names for a given league.
+    Reduces an athlete document to the fields kept in the athlete directory.
+    """
+    team_ref = (content.get('team') or {}).get('$ref')
+    return {
+        'id': str(content['id']),
+        'name': content.get('fullName'),
+        'position': (content.get('position') or {}).get('abbreviation'),
+        'team_id': get_team_id(team_ref) if team_ref else None,
+        'jersey': content.get('jersey'),
+        'headshot': (content.get('headshot') or {}).get('href'),
+        'ref': content.get('$ref'),
+        'fetched_at': time.time(),
+    }
+
+
+def load_athlete_directory_core(league_abbv, espn_instance, refresh=False, max_age=None, verbose=False) -> dict:
+    """
+    Builds or updates the on-disk directory of every athlete in a league.
+
+    The league's athlete list is paged through on the client's shared executor, then only
+    athletes missing from the saved directory (or older than `max_age`) are fetched, in
+    batches on the same executor. Every batch is appended to a checkpoint file and the
+    directory is saved under the pyespn cache directory once the build finishes, so an
+    interrupted build picks up where it stopped.
 
     Args:
         league_abbv (str): The abbreviation of the league (e.g., "nfl", "nba").
+        espn_instance (PYESPN): The espn client whose shared executor is used.
+        refresh (bool, optional): Ignore the saved directory and fetch every athlete again. Defaults to False.
+        max_age (float, optional): Refetch athletes saved more than this many seconds ago. Defaults to never.
+        verbose (bool, optional): Show a progress bar while athletes are fetched. Defaults to False.
 
     Returns:
-        list: A list of dictionaries containing player IDs and names.
+        dict: A mapping of athlete id (str) to its id, name, position, team_id, jersey, headshot, ref and fetched_at.
+
+    Example:
+        >>> directory = load_athlete_directory_core('nfl', espn)
+        >>> directory['3139477']['name']
+        'Patrick Mahomes'
     """
+    path = _athlete_directory_path(league_abbv=league_abbv)
+    checkpoint_path = _athlete_checkpoint_path(league_abbv=league_abbv)
+    if refresh:
+        stored, checkpoints = None, []
+        _remove_file(checkpoint_path)
+    else:
+        stored, checkpoints = read_json_file(path), read_json_lines(checkpoint_path)
+    athletes = (stored or {}).get('athletes', {})
+    for batch in checkpoints:
+        athletes.update(batch)
 
     api_info = lookup_league_api_info(league_abbv=league_abbv)
-    all_players = []
-    cfb_ath_url = f'http://sports.core.api.espn.com/{v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/athletes?lang=en&region=us'
-    content = fetch_espn_data(cfb_ath_url)
+    url = f'http://sports.core.api.espn.com/{v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/athletes?lang=en&region=us&limit=1000'
+    items = fetch_paged_items_core(urls_by_key={'athletes': url},
+                                   espn_instance=espn_instance)['athletes']
+
+    cutoff = time.time() - max_age if max_age else None
+    pending = []
+    for item in items:
+        ref = item.get('$ref')
+        if not ref:
+            continue
+        saved = athletes.get(str(get_athlete_id(ref)))
+        fresh = saved is not None and (cutoff is None or saved.get('fetched_at', 0) >= cutoff)
+        record_cache_lookup(cache='athlete_directory', hit=fresh)
+        if not fresh:
+            pending.append(ref)
+
+    with tqdm(total=len(pending), disable=not verbose, desc="Fetching athletes") as progress:
+        for start in range(0, len(pending), ATHLETE_DIRECTORY_CHECKPOINT):
+            batch = pending[start:start + ATHLETE_DIRECTORY_CHECKPOINT]
+            contents = fetch_all_core(urls=batch,
+                                      espn_instance=espn_instance)
+            fetched = {}
+            for ref in batch:
+                content = contents.get(ref)
+                if content and content.get('id') is not None:
+                    entry = _athlete_directory_entry(content)
+                    fetched[entry['id']] = entry
+            athletes.update(fetched)
+            append_json_line(checkpoint_path, fetched)
+            progress.update(len(batch))
+
+    if stored is None or pending or checkpoints:
+        write_json_file(path, {'league': league_abbv, 'updated': time.time(), 'athletes': athletes})
+    _remove_file(checkpoint_path)
+    return athletes
+
 
-    num_pages = content.get('pageCount')
+def get_player_ids_core(league_abbv: str, espn_instance=None) -> list:
+    """
+    Retrieves a list of player IDs and names for a given league.
 
-    for i in range(1, num_pages + 1):
-        page_url = cfb_ath_url + f'&page={i}'
-        page_response = requests.get(page_url)
-        content = json.loads(page_response.content)
+    The ids come from the league's athlete directory, see `load_athlete_directory_core`.
 
-        for athlete in content:
-            if athlete['$ref']:
-                athlete_response = requests.get(athlete['$ref'])
-                athlete_content = json.loads(athlete_response.content)
-                athlete_data = {'id': athlete_content['id'],
-                                'name': athlete_content['full_name']}
-                all_players.append(athlete_data)
+    Args:
+        league_abbv (str): The abbreviation of the league (e.g., "nfl", "nba").
+        espn_instance (PYESPN, optional): The espn client whose shared executor is used.
+            Defaults to a new client for the league.
 
-    return all_players
+    Returns:
+        list: A list of dictionaries containing player IDs and names.
+    """
+    if espn_instance is None:
+        from pyespn.core.client import PYESPN
+        espn_instance = PYESPN(sport_league=league_abbv, load_teams=False)
+    directory = load_athlete_directory_core(league_abbv=league_abbv,
+                                            espn_instance=espn_instance)
+    return [{'id': athlete['id'], 'name': athlete['name']} for athlete in directory.values()]
 
 
 def get_player_stat_urls_core(player_id, league_abbv) -> list:
@@ -77,11 +177,28 @@ def extract_stats_from_url_core(url, espn_instance) -> dict:
         dict: A dict with list of stat objects with statistics.
     """
 
+    content_dict = fetch_espn_data(url)
+    return build_stats_from_content_core(url=url,
+                                         content=content_dict,
+                                         espn_instance=espn_instance)
+
+
+def build_stats_from_content_core(url, content, espn_instance) -> dict:
+    """
+    Builds player statistics from an already fetched season statistics document.
+
+    Args:
+        url (str): The URL the statistics document was fetched from.
+        content (dict): The statistics document.
+
+    Returns:
+        dict: A dict with list of stat objects with statistics.
+    """
+
     all_stats = []
     year = get_an_id(url=url, slug='seasons')
     player_id = get_athlete_id(url=url)
-    content_dict = fetch_espn_data(url)
-    stats = content_dict.get('splits').get('categories')
+    stats = content.get('splits').get('categories')
 
     for category in stats:
         category_name = category['name']
@@ -96,7 +213,7 @@ def extract_stats_from_url_core(url, espn_instance) -> dict:
                 'description': stat.get('description')
             }
             all_stats.append(Stat(stat_json=this_stat,
-                                  espn_isntance=espn_instance))
+                                  espn_instance=espn_instance))
 
     return {year: all_stats}
 
@@ -117,8 +234,7 @@ def get_player_info_core(player_id, league_abbv, espn_instance) -> Player:
     api_info = lookup_league_api_info(league_abbv=league_abbv)
 
     url = f'http://sports.core.api.espn.com/{v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/athletes/{player_id}'
-    response = requests.get(url)
-    content = json.loads(response.content)
+    content = fetch_espn_json(url)
     current_player = Player(player_json=content,
                             espn_instance=espn_instance)
     return current_player
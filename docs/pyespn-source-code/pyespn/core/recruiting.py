@@ -1,45 +1,128 @@
-from pyespn.utilities import lookup_league_api_info, fetch_espn_data
+from pyespn.utilities import (lookup_league_api_info, fetch_espn_data, cache_path, read_json_file,
+                              write_json_file, record_cache_lookup)
 from pyespn.data.version import espn_api_version as v
 from pyespn.classes.player import Recruit
-import concurrent.futures
+from collections import deque
+from datetime import datetime
 
+# recruiting classes are signed by the end of february, after that the rankings rarely move
+SIGNING_DAY_MONTH = 2
 
-def get_recruiting_rankings_core(season, league_abbv, espn_instance, max_pages=None) -> list[Recruit]:
+
+def _is_finished_class(season) -> bool:
     """
-    Retrieves recruiting rankings and athlete data for a specific season and league, utilizing the ESPN API.
+    Checks whether a recruiting class is past signing day.
+    """
+    now = datetime.now()
+    return (int(season), SIGNING_DAY_MONTH) < (now.year, now.month)
 
-    NOTE: The star rating for recruits is not directly available via the API. To obtain the star rating,
-    the player's page must be loaded and the corresponding rating image (e.g., rating-#_stars.png) must be processed
-    to extract the number of stars.
+
+def _recruiting_cache_path(season, league_abbv) -> str:
+    return cache_path('recruiting', league_abbv, f'{season}.json')
+
+
+def _fetch_recruiting_pages(url, first_page, num_of_pages, espn_instance):
+    """
+    Yields the items of each recruiting page in page order.
+
+    Pages are fetched on the client's shared executor with at most `max_workers`
+    pages in flight, so memory stays bounded while later pages download.
+    """
+    yield first_page.get('items', [])
+
+    window = max(1, getattr(espn_instance, '_max_workers', 1))
+    pages = iter(range(2, num_of_pages + 1))
+    in_flight = deque()
+
+    def submit_next():
+        page = next(pages, None)
+        if page is not None:
+            in_flight.append((page, espn_instance.executor.submit(fetch_espn_data, f"{url}?page={page}")))
+
+    for _ in range(window):
+        submit_next()
+
+    while in_flight:
+        page, future = in_flight.popleft()
+        submit_next()
+        try:
+            response = future.result() or {}
+        except Exception as e:
+            print(f"Failed to fetch recruiting page {page}: {e}")
+            response = {}
+        yield response.get('items', [])
+
+
+def iter_recruiting_rankings_core(season, league_abbv, espn_instance, max_pages=None):
+    """
+    Streams recruiting rankings for a specific season and league in rank order.
+
+    Pages are fetched concurrently but yielded in page order as soon as each one is ready.
+    Once a class is past signing day, the full set of pages is saved to the pyespn cache
+    directory and later calls read it from disk instead of the API.
 
     Args:
         season (int): The season year for which the recruiting rankings are to be fetched.
-        league_abbv (str): The abbreviation for the league (e.g., 'nfl', 'nba').
+        league_abbv (str): The abbreviation for the league (e.g., 'cfb', 'mcbb').
         espn_instance (object): An instance of the ESPN class used for interaction with the ESPN API.
         max_pages (int, optional): The maximum number of pages to fetch. If not provided, all available pages are fetched.
 
-    Returns:
-        list: A list of `Recruit` objects representing the recruits and their information retrieved from the API.
+    Yields:
+        Recruit: The recruits, in rank order.
+
+    Example:
+        >>> for recruit in iter_recruiting_rankings_core(2024, 'cfb', espn, max_pages=2):
+        >>>     print(recruit.rank, recruit.full_name)
     """
+    path = _recruiting_cache_path(season=season, league_abbv=league_abbv)
+    stored = read_json_file(path)
+    record_cache_lookup(cache='recruiting_class', hit=bool(stored))
+    if stored:
+        for items in stored['pages'][:max_pages]:
+            for recruit in items:
+                yield Recruit(recruit_json=recruit, espn_instance=espn_instance)
+        return
 
     api_info = lookup_league_api_info(league_abbv=league_abbv)
     url = f'https://sports.core.api.espn.com/{v}/sports/{api_info["sport"]}/leagues/{api_info["league"]}/recruiting/{season}/athletes'
     content = fetch_espn_data(url)
 
-    num_of_pages = content['pageCount'] if not max_pages else max_pages
+    page_count = content['pageCount']
+    num_of_pages = min(page_count, max_pages) if max_pages else page_count
+    keep_pages = num_of_pages == page_count and _is_finished_class(season)
 
-    recruiting_data = []
+    pages = []
+    for items in _fetch_recruiting_pages(url=url,
+                                         first_page=content,
+                                         num_of_pages=num_of_pages,
+                                         espn_instance=espn_instance):
+        if keep_pages:
+            pages.append(items)
+        for recruit in items:
+            yield Recruit(recruit_json=recruit, espn_instance=espn_instance)
 
-    def fetch_and_process_page(page):
-        """Fetches a page and processes recruits."""
-        paged_url = f"{url}?page={page}"
-        response = fetch_espn_data(paged_url)
-        return [Recruit(recruit_json=recruit, espn_instance=espn_instance) for recruit in response.get('items', [])]
+    if keep_pages and all(pages):
+        write_json_file(path, {'season': season, 'pages': pages})
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future_to_page = {executor.submit(fetch_and_process_page, page): page for page in range(1, num_of_pages + 1)}
 
-        for future in concurrent.futures.as_completed(future_to_page):
-            recruiting_data.extend(future.result())
+def get_recruiting_rankings_core(season, league_abbv, espn_instance, max_pages=None) -> list[Recruit]:
+    """
+    Retrieves recruiting rankings and athlete data for a specific season and league, utilizing the ESPN API.
 
-    return recruiting_data
+    NOTE: The star rating for recruits is not directly available via the API. To obtain the star rating,
+    the player's page must be loaded and the corresponding rating image (e.g., rating-#_stars.png) must be processed
+    to extract the number of stars.
+
+    Args:
+        season (int): The season year for which the recruiting rankings are to be fetched.
+        league_abbv (str): The abbreviation for the league (e.g., 'nfl', 'nba').
+        espn_instance (object): An instance of the ESPN class used for interaction with the ESPN API.
+        max_pages (int, optional): The maximum number of pages to fetch. If not provided, all available pages are fetched.
+
+    Returns:
+        list: A list of `Recruit` objects, in rank order, representing the recruits and their information retrieved from the API.
+    """
+    return list(iter_recruiting_rankings_core(season=season,
+                                              league_abbv=league_abbv,
+                                              espn_instance=espn_instance,
+                                              max_pages=max_pages))
@@ -12,6 +12,17 @@ BETTING_PROVIDERS = [
     "Betradar"
 ]
 
+ATS_TYPES = [
+    'atsOverall',
+    'atsFavorite',
+    'atsUnderdog',
+    'atsAway',
+    'atsHome',
+    'atsHomeFavorite',
+    'atsAwayUnderdog',
+    'atsHomeUnderdog',
+]
+
 DEFAULT_BETTING_PROVIDERS_MAP = {
     'mlb': 'Unibet',
     'nfl': 'Betradar',
@@ -1,4 +1,4 @@
 from .leagues import LeagueNotSupportedError, LeagueNotAvailableError, InvalidLeagueError
-from .api import API400Error, NoDataReturnedError
+from .api import API400Error, NoDataReturnedError, RateLimitedError
 from .classes import JSONNotProvidedError
 from .schedules import ScheduleTypeUnknownError
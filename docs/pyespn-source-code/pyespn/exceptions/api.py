@@ -14,3 +14,14 @@ class NoDataReturnedError(Exception):
         self.code = code
         self.message = f"{message} | status code {self.code}"
         super().__init__(self.message)
+
+
+class RateLimitedError(API400Error):
+    """Exception raised when the espn api keeps answering 429 or 5xx after every retry"""
+    def __init__(self, status_code, url, attempts, message="espn api kept throttling"):
+        self.status_code = status_code
+        self.url = url
+        self.attempts = attempts
+        super().__init__(error_code=status_code,
+                         error_message=f"{url} after {attempts} attempts",
+                         message=f"{message}: ")
@@ -2,5 +2,14 @@ from .urls import (get_team_id, get_athlete_id,
                    get_schedule_type, get_an_id,
                    get_a_value)
 from .finds import get_type_futures, get_type_ats
-from .api import lookup_league_api_info, check_response_code, fetch_espn_data
+from .api import lookup_league_api_info, check_response_code, fetch_espn_data, fetch_espn_json
+from .throttle import (RateLimiter, HostGovernor, set_rate_limit, get_rate_limiter,
+                       configure_host, get_governor, get_fetch_stats, reset_fetch_stats)
+from .transport import (FixtureStore, HttpTransport, RecordingTransport, ReplayTransport,
+                        TransportResponse, get_transport, set_transport, use_transport)
+from .diagnostics import (FetchDiagnostics, url_pattern, record_fetch, record_cache_lookup,
+                          track_operation, get_fetch_diagnostics, reset_fetch_diagnostics)
 from .strings import camel_to_snake
+from .storage import (get_cache_dir, cache_path, read_json_file, write_json_file,
+                      append_json_line, read_json_lines)
+from .serialization import get_serializer, set_serializer, loads, dumps
@@ -1,6 +1,11 @@
 from pyespn.data.leagues import LEAGUE_API_MAPPING
-from pyespn.exceptions import API400Error, NoDataReturnedError
+from pyespn.exceptions import API400Error, NoDataReturnedError, RateLimitedError
+from pyespn.utilities.throttle import get_governor
+from pyespn.utilities.transport import get_transport
+from pyespn.utilities.diagnostics import record_fetch
+from pyespn.utilities.serialization import loads
 import requests
+import time
 
 
 def lookup_league_api_info(league_abbv) -> dict:
@@ -42,10 +47,74 @@ def check_response_code(content: dict):
                               error_message=content.get('error').get('message'))
 
 
+def _retry_after_seconds(response) -> float:
+    """
+    Parses a numeric Retry-After header from a response, if one was sent.
+    """
+    try:
+        return float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_body(response):
+    """
+    Parses a response body with the active serializer, straight from the raw bytes when the
+    response has them so the body is not decoded to text first.
+    """
+    body = getattr(response, 'content', None)
+    if isinstance(body, (bytes, bytearray)):
+        return loads(body)
+    return response.json()
+
+
+def _get_with_retries(url: str, governor):
+    """
+    Sends a request through the governor and the active transport, retrying 429/5xx
+    responses with backoff.
+
+    Raises:
+        RateLimitedError: If the host still answers 429 or 5xx after the governor's retries.
+        requests.exceptions.RequestException: If there is a network or HTTP request error.
+    """
+    for attempt in range(governor.max_retries + 1):
+        with governor.slot():
+            started = time.perf_counter()
+            try:
+                response = get_transport().get(url)
+            except requests.exceptions.RequestException:
+                record_fetch(url=url, seconds=time.perf_counter() - started)
+                raise
+            record_fetch(url=url, seconds=time.perf_counter() - started, status_code=response.status_code)
+
+        if response.status_code == 429 or response.status_code >= 500:
+            delay = governor.record_throttle(status_code=response.status_code,
+                                             retry_after=_retry_after_seconds(response))
+            if attempt < governor.max_retries:
+                governor.record_retry()
+                time.sleep(delay)
+                continue
+            governor.record_failure()
+            raise RateLimitedError(status_code=response.status_code, url=url, attempts=attempt + 1)
+
+        # a 404 says nothing about how hard the host can be pushed, only real successes raise the rate
+        if response.status_code < 400:
+            governor.record_success()
+        return response
+
+
 def fetch_espn_data(url: str) -> dict:
     """
     Fetches data from the specified URL and returns it as a parsed dictionary.
 
+    Every request goes through the `HostGovernor` for the url's host, which applies the
+    host's concurrency cap and rate limit. Responses with a 429 or 5xx status slow the
+    whole host down and are retried with exponential backoff; once the retries run out the
+    failure is printed and None is returned. The request itself is sent by the active transport (see
+    `set_transport`), which is live http unless fixtures are being recorded or replayed,
+    and its latency is recorded by `record_fetch`. The body is parsed by the active
+    serializer (see `set_serializer`).
+
     Args:
         url (str): The URL from which to fetch the data.
 
@@ -54,18 +123,18 @@ def fetch_espn_data(url: str) -> dict:
 
     Raises:
         NoDataReturnedError: If the response contains no items or an unexpected response code is encountered.
-        requests.exceptions.RequestException: If there is a network or HTTP request error.
-        ValueError: If the response cannot be parsed as JSON.
+        API400Error: If the response contains an error code in the 400 range.
 
     Example:
         >>> url = "https://api.espn.com/v2/sports/football"
         >>> data = fetch_espn_data(url)
     """
+    governor = get_governor(url)
 
     try:
-        response = requests.get(url)
+        response = _get_with_retries(url=url, governor=governor)
 
-        content = response.json()  # Automatically parses JSON
+        content = _parse_body(response)
 
         check_response_code(content)
 
@@ -76,9 +145,39 @@ def fetch_espn_data(url: str) -> dict:
             raise NoDataReturnedError(code=content.get('status', {}).get('code'))
 
         return content
+    except RateLimitedError as e:
+        print(f"Request failed: {e}")
     except requests.exceptions.RequestException as e:
+        governor.record_failure()
         print(f"Request failed: {e}")
     except ValueError as ve:
         print(f"Data error: {ve}")
 
     return None  # Return None if there is an error
+
+
+def fetch_espn_json(url: str) -> dict:
+    """
+    Fetches and parses a document through the same governor, transport and serializer as
+    `fetch_espn_data`, but without its checks: ESPN error documents and empty item lists
+    are returned as they are, and network errors are raised rather than printed.
+
+    Args:
+        url (str): The URL from which to fetch the data.
+
+    Returns:
+        dict: The parsed JSON response.
+
+    Raises:
+        RateLimitedError: If the host still answers 429 or 5xx after the governor's retries
+            (an `API400Error`, so callers already catching that handle it).
+        requests.exceptions.RequestException: If there is a network or HTTP request error.
+        ValueError: If the response cannot be parsed as JSON.
+    """
+    governor = get_governor(url)
+    try:
+        response = _get_with_retries(url=url, governor=governor)
+    except requests.exceptions.RequestException:
+        governor.record_failure()
+        raise
+    return _parse_body(response)
@@ -0,0 +1,219 @@
+from contextlib import contextmanager
+from urllib.parse import urlparse
+import threading
+import time
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def url_pattern(url: str) -> str:
+    """
+    Collapses a url into the endpoint pattern it belongs to.
+
+    The scheme, host and query string are dropped and every numeric path segment is
+    replaced with `{id}`, so every event, athlete or page of the same endpoint is
+    counted together.
+
+    Args:
+        url (str): The url that was fetched.
+
+    Returns:
+        str: The endpoint pattern.
+
+    Example:
+        >>> url_pattern('http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/events/401671789/competitions/401671789/drives?page=2')
+        '/v2/sports/football/leagues/nfl/events/{id}/competitions/{id}/drives'
+    """
+    segments = urlparse(url).path.split('/')
+    return '/'.join('{id}' if segment.lstrip('-').isdigit() else segment for segment in segments)
+
+
+class FetchDiagnostics:
+    """
+    Collects request counts, latency histograms and cache hit/miss counts for one operation.
+
+    Requests are grouped by `url_pattern`. Each pattern keeps a count, an error count,
+    the total and slowest latency and a histogram over `LATENCY_BUCKETS`.
+
+    Attributes:
+        operation (str): The name of the operation being measured.
+    """
+
+    def __init__(self, operation: str):
+        """
+        Initializes a FetchDiagnostics instance.
+
+        Args:
+            operation (str): The name of the operation being measured, e.g. 'schedule'.
+        """
+        self.operation = operation
+        self._started = time.perf_counter()
+        self._endpoints = {}
+        self._caches = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the FetchDiagnostics instance.
+
+        Returns:
+            str: A formatted string with the operation name and request count.
+        """
+        return f"<FetchDiagnostics | {self.operation} {sum(e['count'] for e in self._endpoints.values())} requests>"
+
+    def record_request(self, url: str, seconds: float, status_code: int = None) -> None:
+        """
+        Records one request.
+
+        Args:
+            url (str): The url that was fetched.
+            seconds (float): How long the request took.
+            status_code (int, optional): The HTTP status, None if the request failed outright.
+        """
+        pattern = url_pattern(url)
+        bucket = next((index for index, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+        with self._lock:
+            endpoint = self._endpoints.get(pattern)
+            if endpoint is None:
+                endpoint = self._endpoints[pattern] = {
+                    'count': 0,
+                    'errors': 0,
+                    'total_seconds': 0.0,
+                    'max_seconds': 0.0,
+                    'buckets': [0] * (len(LATENCY_BUCKETS) + 1),
+                }
+            endpoint['count'] += 1
+            endpoint['total_seconds'] += seconds
+            endpoint['max_seconds'] = max(endpoint['max_seconds'], seconds)
+            endpoint['buckets'][bucket] += 1
+            if status_code is None or status_code >= 400:
+                endpoint['errors'] += 1
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """
+        Records a cache lookup.
+
+        Args:
+            cache (str): The name of the cache, e.g. 'season_stats'.
+            hit (bool): Whether the lookup was served from the cache.
+        """
+        with self._lock:
+            counts = self._caches.setdefault(cache, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+
+    def to_dict(self) -> dict:
+        """
+        Returns a JSON-serializable summary of everything recorded so far.
+
+        Endpoints are ordered by total time spent, slowest first.
+
+        Returns:
+            dict: The operation name, elapsed time, totals, per-endpoint stats and cache counts.
+        """
+        labels = [f'<={bound}s' for bound in LATENCY_BUCKETS] + [f'>{LATENCY_BUCKETS[-1]}s']
+        with self._lock:
+            endpoints = {
+                pattern: {
+                    'count': stats['count'],
+                    'errors': stats['errors'],
+                    'total_seconds': round(stats['total_seconds'], 4),
+                    'avg_seconds': round(stats['total_seconds'] / stats['count'], 4),
+                    'max_seconds': round(stats['max_seconds'], 4),
+                    'histogram': {label: count for label, count in zip(labels, stats['buckets']) if count},
+                }
+                for pattern, stats in sorted(self._endpoints.items(), key=lambda item: -item[1]['total_seconds'])
+            }
+            caches = {name: dict(counts) for name, counts in self._caches.items()}
+        return {
+            'operation': self.operation,
+            'elapsed_seconds': round(time.perf_counter() - self._started, 4),
+            'requests': sum(stats['count'] for stats in endpoints.values()),
+            'errors': sum(stats['errors'] for stats in endpoints.values()),
+            'request_seconds': round(sum(stats['total_seconds'] for stats in endpoints.values()), 4),
+            'endpoints': endpoints,
+            'cache': caches,
+        }
+
+
+_process_diagnostics = FetchDiagnostics('process')
+_active_operations = []
+_operations_lock = threading.Lock()
+
+
+def _collectors() -> list:
+    with _operations_lock:
+        return [_process_diagnostics] + _active_operations
+
+
+def record_fetch(url: str, seconds: float, status_code: int = None) -> None:
+    """
+    Records a request in the process-wide diagnostics and every operation being tracked.
+
+    Args:
+        url (str): The url that was fetched.
+        seconds (float): How long the request took.
+        status_code (int, optional): The HTTP status, None if the request failed outright.
+    """
+    for collector in _collectors():
+        collector.record_request(url=url, seconds=seconds, status_code=status_code)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """
+    Records a cache lookup in the process-wide diagnostics and every operation being tracked.
+
+    Args:
+        cache (str): The name of the cache.
+        hit (bool): Whether the lookup was served from the cache.
+    """
+    for collector in _collectors():
+        collector.record_cache(cache=cache, hit=hit)
+
+
+@contextmanager
+def track_operation(operation: str):
+    """
+    Collects diagnostics for every request made while the block runs.
+
+    Requests made on worker threads (e.g. the client's shared executor) are included,
+    so operations should not overlap if their numbers need to be kept apart.
+
+    Args:
+        operation (str): The name of the operation.
+
+    Yields:
+        FetchDiagnostics: The collector, call `to_dict()` on it once the block is done.
+
+    Example:
+        >>> with track_operation('schedule') as diagnostics:
+        >>>     espn.load_season_schedule(season=2024)
+        >>> diagnostics.to_dict()['requests']
+        342
+    """
+    collector = FetchDiagnostics(operation)
+    with _operations_lock:
+        _active_operations.append(collector)
+    try:
+        yield collector
+    finally:
+        with _operations_lock:
+            _active_operations.remove(collector)
+
+
+def get_fetch_diagnostics() -> dict:
+    """
+    Returns the diagnostics collected since the process started (or the last reset).
+
+    Returns:
+        dict: The same summary `FetchDiagnostics.to_dict` returns.
+    """
+    return _process_diagnostics.to_dict()
+
+
+def reset_fetch_diagnostics() -> None:
+    """
+    Clears the process-wide diagnostics.
+    """
+    global _process_diagnostics
+    with _operations_lock:
+        _process_diagnostics = FetchDiagnostics('process')
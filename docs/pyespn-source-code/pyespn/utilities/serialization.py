@@ -0,0 +1,152 @@
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # optional, pip install pyespn[fast]
+    orjson = None
+
+SERIALIZER_ENV = 'PYESPN_JSON'
+
+
+class StdlibSerializer:
+    """
+    Encodes and decodes JSON with the standard library.
+    """
+
+    name = 'json'
+
+    def __repr__(self) -> str:
+        return f"<Serializer | {self.name}>"
+
+    def loads(self, data):
+        """
+        Parses a JSON document.
+
+        Args:
+            data (bytes or str): The document, bytes are read as utf-8.
+
+        Returns:
+            dict or list: The parsed document.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+        """
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        """
+        Encodes a document as utf-8 JSON, keeping non-ascii characters as they are.
+
+        Args:
+            obj (dict or list): The document.
+
+        Returns:
+            bytes: The encoded document.
+        """
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+class OrjsonSerializer(StdlibSerializer):
+    """
+    Encodes and decodes JSON with orjson, which parses ESPN payloads several times faster.
+
+    Documents orjson cannot encode (integers wider than 64 bits, unsupported types) are
+    handed to the standard library instead.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        """
+        Initializes an OrjsonSerializer instance.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        if orjson is None:
+            raise ImportError("orjson is not installed, pip install pyespn[fast]")
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().dumps(obj)
+
+
+SERIALIZERS = {StdlibSerializer.name: StdlibSerializer, OrjsonSerializer.name: OrjsonSerializer}
+
+_serializer = None
+
+
+def _default_serializer():
+    name = os.environ.get(SERIALIZER_ENV, '').lower()
+    if name in SERIALIZERS:
+        return SERIALIZERS[name]()
+    return OrjsonSerializer() if orjson is not None else StdlibSerializer()
+
+
+def get_serializer():
+    """
+    Returns the serializer pyespn parses responses and writes files with.
+
+    Defaults to orjson when it is installed and the standard library otherwise. The
+    `PYESPN_JSON` environment variable ('json' or 'orjson') picks one explicitly.
+
+    Returns:
+        StdlibSerializer: The active serializer.
+    """
+    global _serializer
+    if _serializer is None:
+        _serializer = _default_serializer()
+    return _serializer
+
+
+def set_serializer(serializer=None) -> None:
+    """
+    Replaces the active serializer.
+
+    Args:
+        serializer (str or object, optional): 'json', 'orjson', or any object with `loads`
+            and `dumps` methods. None restores the default.
+
+    Raises:
+        ValueError: If the name is not a known serializer.
+    """
+    global _serializer
+    if isinstance(serializer, str):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"unknown serializer {serializer!r}, expected one of {sorted(SERIALIZERS)}")
+        serializer = SERIALIZERS[serializer]()
+    _serializer = serializer
+
+
+def loads(data):
+    """
+    Parses a JSON document with the active serializer.
+
+    Args:
+        data (bytes or str): The document.
+
+    Returns:
+        dict or list: The parsed document.
+    """
+    return get_serializer().loads(data)
+
+
+def dumps(obj) -> bytes:
+    """
+    Encodes a document as utf-8 JSON with the active serializer.
+
+    Args:
+        obj (dict or list): The document.
+
+    Returns:
+        bytes: The encoded document.
+    """
+    return get_serializer().dumps(obj)
@@ -0,0 +1,119 @@
+import os
+import tempfile
+from pyespn.utilities.serialization import dumps, loads
+
+CACHE_DIR_ENV = 'PYESPN_CACHE_DIR'
+
+
+def get_cache_dir() -> str:
+    """
+    Returns the directory pyespn persists data to between runs.
+
+    The directory is taken from the `PYESPN_CACHE_DIR` environment variable and
+    defaults to `~/.cache/pyespn`.
+
+    Returns:
+        str: The absolute path to the cache directory.
+    """
+    return os.path.abspath(os.path.expanduser(os.environ.get(CACHE_DIR_ENV) or os.path.join('~', '.cache', 'pyespn')))
+
+
+def cache_path(*parts) -> str:
+    """
+    Builds a path inside the cache directory.
+
+    Args:
+        *parts (str): The path components below the cache directory.
+
+    Returns:
+        str: The absolute path.
+
+    Example:
+        >>> cache_path('recruiting', 'college-football', '2024.json')
+        '/home/me/.cache/pyespn/recruiting/college-football/2024.json'
+    """
+    return os.path.join(get_cache_dir(), *[str(part) for part in parts])
+
+
+def read_json_file(path):
+    """
+    Reads a JSON document persisted by `write_json_file`.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        dict or list or None: The document, or None if the file is missing or unreadable.
+    """
+    try:
+        with open(path, 'rb') as file:
+            return loads(file.read())
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_file(path, data) -> None:
+    """
+    Atomically writes a JSON document, creating parent directories as needed.
+
+    The document is written to a temporary file in the same directory and then renamed
+    over the destination, so readers never see a partially written file.
+
+    Args:
+        path (str): The file path.
+        data (dict or list): The document to write.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(dumps(data))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def append_json_line(path, data) -> None:
+    """
+    Appends a JSON document as one line, creating parent directories as needed.
+
+    Used for checkpoints that grow with every batch, so each write costs the size of
+    the batch rather than the size of everything written so far.
+
+    Args:
+        path (str): The file path.
+        data (dict or list): The document to append.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'ab') as file:
+        file.write(dumps(data) + b'\n')
+
+
+def read_json_lines(path) -> list:
+    """
+    Reads the documents appended by `append_json_line`.
+
+    A line cut short by an interrupted write is skipped.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        list: The documents in the order they were appended, empty if the file is missing.
+    """
+    documents = []
+    try:
+        with open(path, 'rb') as file:
+            for line in file:
+                try:
+                    documents.append(loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return documents
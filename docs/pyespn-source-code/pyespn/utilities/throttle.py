@@ -0,0 +1,418 @@
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import urlparse
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket used to cap how many requests per second pyespn sends.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each call to
+    `acquire` takes one token, sleeping until one is available. The rate can be
+    changed while the limiter is in use, which is how `HostGovernor` backs off.
+
+    Attributes:
+        rate (float): The number of tokens added per second.
+        burst (int): The maximum number of tokens the bucket can hold.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        """
+        Initializes a RateLimiter instance.
+
+        Args:
+            rate (float): The sustained number of requests allowed per second.
+            burst (int, optional): The maximum burst size. Defaults to `rate` rounded up.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.burst = burst if burst else max(1, int(rate + 0.999))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the RateLimiter instance.
+
+        Returns:
+            str: A formatted string with the rate and burst size.
+        """
+        return f"<RateLimiter | {self.rate:.2f}/s burst {self.burst}>"
+
+    def _refill(self, now: float) -> None:
+        """
+        Adds the tokens accumulated since the last update. Must be called with the lock held.
+        """
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Changes the refill rate, keeping any tokens already accumulated.
+
+        Args:
+            rate (float): The new number of requests allowed per second.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            self._tokens = min(self._tokens, self.burst)
+
+    def acquire(self) -> float:
+        """
+        Takes a token from the bucket, blocking until one is available.
+
+        Returns:
+            float: The number of seconds spent waiting for a token.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class HostGovernor:
+    """
+    Controls every request pyespn sends to a single host.
+
+    A governor combines a concurrency cap (how many requests may be in flight at once),
+    an optional token bucket rate limit, and adaptive backoff. When the host answers
+    with 429 or a 5xx status the rate is cut in half and every thread talking to the
+    host pauses for the backoff delay; each success then raises the rate again
+    additively until it reaches the configured ceiling, so a crawl settles just under
+    the highest rate the host will sustain.
+
+    Attributes:
+        host (str): The host this governor controls.
+        requests_per_second (float or None): The configured ceiling, None for no fixed ceiling.
+        max_concurrency (int or None): The maximum number of requests in flight, None for no cap.
+        max_retries (int): How many times a throttled request is retried.
+        backoff_base (float): The initial backoff delay in seconds.
+        backoff_max (float): The longest backoff delay in seconds.
+        min_rate (float): The floor the adaptive rate will not drop below.
+    """
+
+    RATE_WINDOW = 2.0
+
+    def __init__(self, host: str,
+                 requests_per_second: float = None,
+                 burst: int = None,
+                 max_concurrency: int = None,
+                 max_retries: int = 4,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30.0,
+                 min_rate: float = 1.0):
+        """
+        Initializes a HostGovernor instance.
+
+        Args:
+            host (str): The host this governor controls.
+            requests_per_second (float, optional): The request rate ceiling. Defaults to None (adaptive only).
+            burst (int, optional): The token bucket burst size. Defaults to the rate rounded up.
+            max_concurrency (int, optional): The maximum requests in flight. Defaults to None (uncapped).
+            max_retries (int, optional): Retries for 429/5xx responses. Defaults to 4.
+            backoff_base (float, optional): The first backoff delay in seconds. Defaults to 0.5.
+            backoff_max (float, optional): The largest backoff delay in seconds. Defaults to 30.
+            min_rate (float, optional): The lowest rate backoff will fall to. Defaults to 1 request/second.
+        """
+        self.host = host
+        self.requests_per_second = requests_per_second
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.min_rate = min_rate
+        self._burst = burst
+        self._limiter = RateLimiter(rate=requests_per_second, burst=burst) if requests_per_second else None
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self._consecutive_failures = 0
+        self._recent = deque()
+        self._stats = self._empty_stats()
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the HostGovernor instance.
+
+        Returns:
+            str: A formatted string with the host, current rate and concurrency cap.
+        """
+        return f"<HostGovernor | {self.host} rate {self.current_rate} concurrency {self.max_concurrency}>"
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {
+            'requests': 0,
+            'successes': 0,
+            'throttled': 0,
+            'server_errors': 0,
+            'retries': 0,
+            'failures': 0,
+            'wait_seconds': 0.0,
+            'in_flight': 0,
+            'max_in_flight': 0,
+        }
+
+    @property
+    def current_rate(self):
+        """
+            float or None: the adaptive request rate currently enforced, None when unthrottled
+        """
+        return self._limiter.rate if self._limiter else None
+
+    @contextmanager
+    def slot(self):
+        """
+        Waits for any active backoff, a concurrency slot and a rate token, then holds the slot.
+
+        Example:
+            >>> with governor.slot():
+            >>>     response = requests.get(url)
+        """
+        started = time.monotonic()
+        blocked_for = self._blocked_until - started
+        if blocked_for > 0:
+            time.sleep(blocked_for)
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            limiter = self._limiter
+            if limiter is not None:
+                limiter.acquire()
+            now = time.monotonic()
+            with self._lock:
+                self._stats['requests'] += 1
+                self._stats['wait_seconds'] += now - started
+                self._stats['in_flight'] += 1
+                self._stats['max_in_flight'] = max(self._stats['max_in_flight'], self._stats['in_flight'])
+                self._recent.append(now)
+                while self._recent and now - self._recent[0] > self.RATE_WINDOW:
+                    self._recent.popleft()
+            yield
+        finally:
+            with self._lock:
+                self._stats['in_flight'] -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    def set_rate_limit(self, requests_per_second: float = None, burst: int = None) -> None:
+        """
+        Replaces the rate ceiling in place, keeping the host's counters and concurrency cap.
+
+        Args:
+            requests_per_second (float, optional): The new rate ceiling. `None` removes it.
+            burst (int, optional): The token bucket burst size. Defaults to the rate rounded up.
+        """
+        with self._lock:
+            self.requests_per_second = requests_per_second
+            self._burst = burst
+            self._limiter = RateLimiter(rate=requests_per_second, burst=burst) if requests_per_second else None
+
+    def record_success(self) -> None:
+        """
+        Records a successful response and additively raises the adaptive rate toward its ceiling.
+        """
+        with self._lock:
+            self._stats['successes'] += 1
+            self._consecutive_failures = 0
+            limiter = self._limiter
+            if limiter is None:
+                return
+            ceiling = self.requests_per_second
+            if ceiling and limiter.rate >= ceiling:
+                return
+            new_rate = limiter.rate + 1.0 / limiter.rate
+            limiter.set_rate(min(new_rate, ceiling) if ceiling else new_rate)
+
+    def record_throttle(self, status_code: int, retry_after: float = None) -> float:
+        """
+        Records a 429/5xx response, halves the rate and pauses the host.
+
+        Args:
+            status_code (int): The HTTP status the host responded with.
+            retry_after (float, optional): The delay the host asked for, in seconds.
+
+        Returns:
+            float: The number of seconds callers should wait before retrying.
+        """
+        with self._lock:
+            if status_code == 429:
+                self._stats['throttled'] += 1
+            else:
+                self._stats['server_errors'] += 1
+            self._consecutive_failures += 1
+
+            if self._limiter is None:
+                observed = len(self._recent) / self.RATE_WINDOW
+                self._limiter = RateLimiter(rate=max(self.min_rate, observed / 2), burst=self._burst or 1)
+            else:
+                self._limiter.set_rate(max(self.min_rate, self._limiter.rate / 2))
+
+            delay = min(self.backoff_max, self.backoff_base * 2 ** (self._consecutive_failures - 1))
+            if retry_after:
+                delay = max(delay, min(self.backoff_max, retry_after))
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            return delay
+
+    def record_retry(self) -> None:
+        """
+        Records that a throttled request is being retried.
+        """
+        with self._lock:
+            self._stats['retries'] += 1
+
+    def record_failure(self) -> None:
+        """
+        Records a request that failed for good (network error or retries exhausted).
+        """
+        with self._lock:
+            self._stats['failures'] += 1
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of this host's counters.
+
+        Returns:
+            dict: The request, success, throttle, retry and failure counts plus the current rate.
+        """
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot['current_rate'] = self.current_rate
+        return snapshot
+
+    def reset_stats(self) -> None:
+        """
+        Zeroes this host's counters without touching the adaptive rate.
+        """
+        with self._lock:
+            in_flight = self._stats['in_flight']
+            self._stats = self._empty_stats()
+            self._stats['in_flight'] = in_flight
+
+
+DEFAULT_HOST_SETTINGS = {
+    'max_concurrency': 32,
+}
+
+_governors = {}
+_host_settings = {}
+_default_settings = dict(DEFAULT_HOST_SETTINGS)
+_registry_lock = threading.Lock()
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def configure_host(host: str, **settings) -> HostGovernor:
+    """
+    Sets the rate limit, concurrency cap and backoff policy for one host.
+
+    Any setting accepted by `HostGovernor` can be given. The host's counters are reset.
+
+    Args:
+        host (str): The host name, e.g. 'sports.core.api.espn.com'.
+        **settings: `requests_per_second`, `burst`, `max_concurrency`, `max_retries`,
+            `backoff_base`, `backoff_max` or `min_rate`.
+
+    Returns:
+        HostGovernor: The governor now used for the host.
+
+    Example:
+        >>> configure_host('sports.core.api.espn.com', requests_per_second=40, max_concurrency=16)
+    """
+    host = host.lower()
+    with _registry_lock:
+        _host_settings[host] = dict(settings)
+        governor = HostGovernor(host=host, **{**_default_settings, **settings})
+        _governors[host] = governor
+    return governor
+
+
+def get_governor(url: str) -> HostGovernor:
+    """
+    Returns the governor for the host of the given url, creating it from the defaults if needed.
+
+    Args:
+        url (str): A url (or bare host) that pyespn is about to fetch.
+
+    Returns:
+        HostGovernor: The governor for that host.
+    """
+    host = _host_of(url) if '://' in url else url.lower()
+    governor = _governors.get(host)
+    if governor is None:
+        with _registry_lock:
+            governor = _governors.get(host)
+            if governor is None:
+                governor = HostGovernor(host=host, **{**_default_settings, **_host_settings.get(host, {})})
+                _governors[host] = governor
+    return governor
+
+
+def set_rate_limit(requests_per_second: float = None, burst: int = None) -> None:
+    """
+    Sets (or clears) the default rate limit for every host without its own `configure_host` settings.
+
+    The limit is process wide: it applies to every client, and stays until it is set again.
+    Governors already created keep their counters.
+
+    Args:
+        requests_per_second (float, optional): The sustained request rate. `None` or 0 removes the limit.
+        burst (int, optional): The maximum number of requests allowed in a burst.
+    """
+    with _registry_lock:
+        _default_settings['requests_per_second'] = requests_per_second or None
+        _default_settings['burst'] = burst
+        for host, governor in _governors.items():
+            if host not in _host_settings:
+                governor.set_rate_limit(requests_per_second=requests_per_second or None, burst=burst)
+
+
+def get_rate_limiter(url: str = 'sports.core.api.espn.com') -> RateLimiter:
+    """
+    Returns the rate limiter currently applied to a host.
+
+    Args:
+        url (str, optional): A url or host. Defaults to the ESPN core api host.
+
+    Returns:
+        RateLimiter or None: The active limiter, or None if requests to the host are unthrottled.
+    """
+    return get_governor(url)._limiter
+
+
+def get_fetch_stats() -> dict:
+    """
+    Returns the fetch counters for every host pyespn has talked to.
+
+    Returns:
+        dict: A mapping of host to that host's counters.
+
+    Example:
+        >>> get_fetch_stats()['sports.core.api.espn.com']['throttled']
+        0
+    """
+    return {host: governor.stats() for host, governor in list(_governors.items())}
+
+
+def reset_fetch_stats() -> None:
+    """
+    Zeroes the fetch counters for every host.
+    """
+    for governor in list(_governors.values()):
+        governor.reset_stats()
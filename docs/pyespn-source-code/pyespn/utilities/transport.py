@@ -0,0 +1,344 @@
+from contextlib import contextmanager
+from urllib.parse import urlparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import requests
+from pyespn.utilities.serialization import loads
+
+
+class TransportResponse:
+    """
+    A minimal stand-in for `requests.Response` built from a stored fixture.
+
+    Attributes:
+        status_code (int): The HTTP status of the recorded response.
+        headers (dict): The recorded response headers.
+        text (str): The recorded response body.
+        url (str): The url the response was recorded for.
+    """
+
+    def __init__(self, status_code: int, text: str, headers: dict = None, url: str = None):
+        """
+        Initializes a TransportResponse instance.
+
+        Args:
+            status_code (int): The HTTP status.
+            text (str): The response body.
+            headers (dict, optional): The response headers.
+            url (str, optional): The url the response belongs to.
+        """
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.url = url
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the TransportResponse instance.
+
+        Returns:
+            str: A formatted string with the status code and url.
+        """
+        return f"<TransportResponse | {self.status_code} {self.url}>"
+
+    @property
+    def content(self):
+        """
+            bytes: the response body encoded as utf-8
+        """
+        return self.text.encode('utf-8')
+
+    def json(self):
+        """
+        Parses the response body as JSON.
+
+        Returns:
+            dict: The parsed body.
+        """
+        return loads(self.text)
+
+
+class FixtureStore:
+    """
+    A directory of recorded ESPN responses, one JSON file per url.
+
+    Urls are keyed without their scheme, because pyespn builds both http and https
+    urls for the same core api documents.
+
+    Attributes:
+        path (str): The directory the fixtures live in.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes a FixtureStore instance.
+
+        Args:
+            path (str): The directory to read fixtures from and record them to.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the FixtureStore instance.
+
+        Returns:
+            str: A formatted string with the store's path.
+        """
+        return f"<FixtureStore | {self.path}>"
+
+    @staticmethod
+    def key(url: str) -> str:
+        """
+        Builds the fixture key for a url.
+
+        Args:
+            url (str): The url.
+
+        Returns:
+            str: The hex digest identifying the url's fixture file.
+        """
+        parts = urlparse(url)
+        normalized = f'{parts.netloc.lower()}{parts.path}?{parts.query}'
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+    def _file(self, url: str) -> str:
+        key = self.key(url)
+        return os.path.join(self.path, key[:2], f'{key}.json')
+
+    def get(self, url: str):
+        """
+        Looks up the recorded response for a url.
+
+        Args:
+            url (str): The url.
+
+        Returns:
+            TransportResponse or None: The recorded response, or None if the url was never recorded.
+        """
+        try:
+            with open(self._file(url), 'r', encoding='utf-8') as file:
+                fixture = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return TransportResponse(status_code=fixture['status'],
+                                 text=fixture['body'],
+                                 headers=fixture.get('headers'),
+                                 url=fixture.get('url', url))
+
+    def put(self, url: str, response) -> None:
+        """
+        Records a response for a url, replacing any earlier recording.
+
+        Args:
+            url (str): The url that was fetched.
+            response (requests.Response): The response to record.
+        """
+        path = self._file(url)
+        fixture = {
+            'url': url,
+            'status': response.status_code,
+            'headers': {name: value for name, value in response.headers.items()
+                        if name.lower() in ('content-type', 'retry-after', 'etag', 'last-modified')},
+            'body': response.text,
+        }
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f'{path}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(fixture, file, ensure_ascii=False)
+            os.replace(temp_path, path)
+
+    def __len__(self) -> int:
+        """
+        Counts the recorded fixtures.
+
+        Returns:
+            int: The number of fixture files in the store.
+        """
+        if not os.path.isdir(self.path):
+            return 0
+        return sum(len([name for name in names if name.endswith('.json')]) for _, _, names in os.walk(self.path))
+
+
+class HttpTransport:
+    """
+    The default transport, sending every request to ESPN with `requests`.
+
+    Attributes:
+        requests (int): The number of requests sent.
+    """
+
+    def __init__(self):
+        """
+        Initializes an HttpTransport instance.
+        """
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<HttpTransport | {self.requests} requests>"
+
+    def get(self, url: str):
+        """
+        Sends a GET request.
+
+        Args:
+            url (str): The url to fetch.
+
+        Returns:
+            requests.Response: The response.
+        """
+        with self._lock:
+            self.requests += 1
+        return requests.get(url)
+
+
+class RecordingTransport(HttpTransport):
+    """
+    Sends requests to ESPN and records every response into a `FixtureStore`.
+
+    Example:
+        >>> with use_transport(RecordingTransport(FixtureStore('fixtures/nfl'))):
+        >>>     espn = PYESPN('nfl')
+    """
+
+    def __init__(self, store: FixtureStore):
+        """
+        Initializes a RecordingTransport instance.
+
+        Args:
+            store (FixtureStore): Where the responses are recorded.
+        """
+        super().__init__()
+        self.store = store
+
+    def __repr__(self) -> str:
+        return f"<RecordingTransport | {self.store.path} {self.requests} requests>"
+
+    def get(self, url: str):
+        """
+        Sends a GET request and records the response.
+
+        Args:
+            url (str): The url to fetch.
+
+        Returns:
+            requests.Response: The response.
+        """
+        response = super().get(url)
+        self.store.put(url, response)
+        return response
+
+
+class ReplayTransport:
+    """
+    Serves recorded responses from a `FixtureStore` without touching the network.
+
+    A fixed latency (plus optional random jitter) can be injected per request so that
+    concurrency and batching changes show up in wall time the way they would live.
+    Urls that were never recorded are answered the way ESPN answers unknown documents,
+    with a 404 error body, and counted in `misses`.
+
+    Attributes:
+        store (FixtureStore): The recorded responses.
+        latency (float): Seconds added to every request.
+        jitter (float): The maximum extra random seconds added to every request.
+        requests (int): The number of requests served.
+        misses (list[str]): The urls that had no recording.
+    """
+
+    def __init__(self, store: FixtureStore, latency: float = 0.0, jitter: float = 0.0, seed: int = None):
+        """
+        Initializes a ReplayTransport instance.
+
+        Args:
+            store (FixtureStore): The recorded responses.
+            latency (float, optional): Seconds added to every request. Defaults to 0.
+            jitter (float, optional): The maximum extra random seconds per request. Defaults to 0.
+            seed (int, optional): Seeds the jitter so runs are repeatable.
+        """
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self.misses = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<ReplayTransport | {self.store.path} {self.requests} requests, {len(self.misses)} misses>"
+
+    def get(self, url: str):
+        """
+        Serves the recorded response for a url.
+
+        Args:
+            url (str): The url to fetch.
+
+        Returns:
+            TransportResponse: The recorded response, or a 404 error response if there is none.
+        """
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = self.store.get(url)
+        if response is None:
+            with self._lock:
+                self.misses.append(url)
+            response = TransportResponse(status_code=404,
+                                         text=json.dumps({'error': {'code': 404, 'message': 'no recorded response'}}),
+                                         url=url)
+        return response
+
+
+_transport = HttpTransport()
+
+
+def get_transport():
+    """
+    Returns the transport `fetch_espn_data` currently sends requests through.
+
+    Returns:
+        HttpTransport or RecordingTransport or ReplayTransport: The active transport.
+    """
+    return _transport
+
+
+def set_transport(transport=None) -> None:
+    """
+    Replaces the transport `fetch_espn_data` sends requests through.
+
+    Args:
+        transport (optional): Any object with a `get(url)` method returning a response. `None` restores live http.
+    """
+    global _transport
+    _transport = transport if transport is not None else HttpTransport()
+
+
+@contextmanager
+def use_transport(transport):
+    """
+    Temporarily routes every `fetch_espn_data` call through a transport.
+
+    Args:
+        transport: The transport to use inside the block.
+
+    Example:
+        >>> with use_transport(ReplayTransport(FixtureStore('fixtures/nfl'), latency=0.05)):
+        >>>     espn = PYESPN('nfl')
+    """
+    previous = _transport
+    set_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_transport(previous)
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import pytest
+
+
+class FakeClient:
+    """
+    Stands in for a PYESPN client in the core tests: a real executor plus the league and
+    teams the loaders read from the client. Tests of one feature add that feature's state
+    in their own fixtures.
+    """
+
+    league_abbv = 'nfl'
+
+    def __init__(self, max_workers=4):
+        self._max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.league = mock.Mock(season={'year': 2024})
+        self.teams = [mock.Mock(team_id='1'), mock.Mock(team_id='2')]
+
+
+class FakeFetch:
+    """
+    Stands in for fetch_espn_data: records every url it is called with and answers with respond(url).
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.calls = []
+
+    def __call__(self, url):
+        self.calls.append(url)
+        return self.respond(url)
+
+
+@pytest.fixture
+def fake_client():
+    client = FakeClient()
+    yield client
+    client.executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def fake_fetch():
+    return FakeFetch
@@ -0,0 +1,103 @@
+from pyespn.core import get_player_ids_core, load_athlete_directory_core
+import pyespn.core.orchestration as orchestration
+import pyespn.core.players as players
+from unittest import mock
+import os
+import pytest
+
+ATHLETES_URL = 'http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/athletes'
+
+
+def directory(athlete_ids, page_size=2, failing=()):
+    def respond(url):
+        if '/athletes?' in url:
+            page = int(url.split('page=')[1]) if 'page=' in url else 1
+            page_ids = athlete_ids[(page - 1) * page_size:page * page_size]
+            return {'pageCount': -(-len(athlete_ids) // page_size),
+                    'items': [{'$ref': f'{ATHLETES_URL}/{athlete_id}?lang=en&region=us'} for athlete_id in page_ids]}
+        athlete_id = url.split('/athletes/')[1].split('?')[0]
+        if athlete_id in failing:
+            return None
+        return {'$ref': url, 'id': athlete_id, 'fullName': f'Player {athlete_id}', 'jersey': '1',
+                'position': {'abbreviation': 'QB'},
+                'team': {'$ref': 'http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/2024/teams/12'}}
+    return respond
+
+
+def athlete_calls(calls):
+    return [url for url in calls if '/athletes?' not in url]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('PYESPN_CACHE_DIR', str(tmp_path))
+
+
+def test_directory_indexes_every_athlete_across_pages(fake_client, fake_fetch):
+    fetch = fake_fetch(directory(['1', '2', '3']))
+    with mock.patch.object(orchestration, 'fetch_espn_data', fetch):
+        athletes = load_athlete_directory_core(league_abbv='nfl', espn_instance=fake_client)
+
+    assert sorted(athletes) == ['1', '2', '3']
+    assert athletes['3']['name'] == 'Player 3'
+    assert athletes['3']['position'] == 'QB'
+    assert athletes['3']['team_id'] == 12
+    assert len(athlete_calls(fetch.calls)) == 3
+
+
+def test_later_runs_only_fetch_new_or_missing_athletes(fake_client, fake_fetch):
+    with mock.patch.object(orchestration, 'fetch_espn_data', fake_fetch(directory(['1', '2', '3'], failing=('2',)))):
+        first = load_athlete_directory_core(league_abbv='nfl', espn_instance=fake_client)
+    assert sorted(first) == ['1', '3']
+
+    fetch = fake_fetch(directory(['1', '2', '3', '4']))
+    with mock.patch.object(orchestration, 'fetch_espn_data', fetch):
+        ids = get_player_ids_core(league_abbv='nfl', espn_instance=fake_client)
+
+    assert sorted(athlete_calls(fetch.calls)) == [f'{ATHLETES_URL}/2?lang=en&region=us', f'{ATHLETES_URL}/4?lang=en&region=us']
+    assert sorted(athlete['id'] for athlete in ids) == ['1', '2', '3', '4']
+
+
+def test_directory_is_written_once_with_batches_checkpointed(fake_client, fake_fetch):
+    with mock.patch.object(players, 'ATHLETE_DIRECTORY_CHECKPOINT', 2), \
+            mock.patch.object(players, 'write_json_file', wraps=players.write_json_file) as write, \
+            mock.patch.object(players, 'append_json_line', wraps=players.append_json_line) as append, \
+            mock.patch.object(orchestration, 'fetch_espn_data', fake_fetch(directory(['1', '2', '3', '4', '5']))):
+        load_athlete_directory_core(league_abbv='nfl', espn_instance=fake_client)
+
+    assert append.call_count == 3
+    assert write.call_count == 1
+    assert not os.path.exists(players._athlete_checkpoint_path('nfl'))
+
+
+def test_interrupted_build_resumes_from_the_checkpoint(fake_client, fake_fetch):
+    fetch_all = players.fetch_all_core
+    batches = []
+
+    def interrupt_second_batch(urls, espn_instance):
+        batches.append(urls)
+        if len(batches) == 2:
+            raise KeyboardInterrupt
+        return fetch_all(urls=urls, espn_instance=espn_instance)
+
+    with mock.patch.object(players, 'ATHLETE_DIRECTORY_CHECKPOINT', 2), \
+            mock.patch.object(players, 'fetch_all_core', interrupt_second_batch), \
+            mock.patch.object(orchestration, 'fetch_espn_data', fake_fetch(directory(['1', '2', '3', '4']))):
+        with pytest.raises(KeyboardInterrupt):
+            load_athlete_directory_core(league_abbv='nfl', espn_instance=fake_client)
+
+    fetch = fake_fetch(directory(['1', '2', '3', '4']))
+    with mock.patch.object(orchestration, 'fetch_espn_data', fetch):
+        athletes = load_athlete_directory_core(league_abbv='nfl', espn_instance=fake_client)
+
+    assert sorted(athletes) == ['1', '2', '3', '4']
+    assert len(athlete_calls(fetch.calls)) == 2
+
+
+def test_player_ids_build_a_client_when_none_is_given(fake_client, fake_fetch):
+    with mock.patch('pyespn.core.client.PYESPN', return_value=fake_client) as client, \
+            mock.patch.object(orchestration, 'fetch_espn_data', fake_fetch(directory(['1']))):
+        ids = get_player_ids_core(league_abbv='nfl')
+
+    client.assert_called_once_with(sport_league='nfl', load_teams=False)
+    assert ids == [{'id': '1', 'name': 'Player 1'}]
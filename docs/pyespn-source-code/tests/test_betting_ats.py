@@ -0,0 +1,72 @@
+from pyespn import PYESPN
+from pyespn.core import get_league_year_ats_core, get_team_year_ats_home_underdog_core
+from pyespn.data.betting import ATS_TYPES
+import pyespn.core.betting as betting
+import pyespn.core.orchestration as orchestration
+from unittest import mock
+import threading
+import types
+import pytest
+
+
+@pytest.fixture
+def ats_client(fake_client):
+    fake_client._ats = {}
+    fake_client._ats_lock = threading.Lock()
+    fake_client.get_league_year_ats = types.MethodType(PYESPN.get_league_year_ats, fake_client)
+    fake_client.get_team_year_ats = types.MethodType(PYESPN.get_team_year_ats, fake_client)
+    return fake_client
+
+
+def respond(url):
+    team_id = url.split('/teams/')[1].split('/')[0]
+    return {'items': [{'type': {'name': ats_type}, 'wins': int(team_id), 'losses': index}
+                      for index, ats_type in enumerate(ATS_TYPES)]}
+
+
+def test_league_ats_fetches_each_team_once(fake_client, fake_fetch):
+    fetch = fake_fetch(respond)
+    with mock.patch.object(orchestration, 'fetch_espn_data', fetch):
+        ats = get_league_year_ats_core(season=2024, espn_instance=fake_client)
+
+    assert len(fetch.calls) == 2
+    assert sorted(ats) == ['1', '2']
+    assert sorted(ats['2']) == sorted(ATS_TYPES)
+    assert ats['2']['atsHomeUnderdog'] == {'type': {'name': 'atsHomeUnderdog'}, 'wins': 2, 'losses': 7}
+
+
+def test_single_split_uses_the_indexed_document(fake_fetch):
+    fetch = fake_fetch(respond)
+    with mock.patch.object(betting, 'fetch_espn_data', fetch):
+        split = get_team_year_ats_home_underdog_core(team_id=1, season=2024, league_abbv='nfl')
+
+    assert len(fetch.calls) == 1
+    assert split['losses'] == 7
+
+
+def test_client_memoizes_ats_per_team_season(ats_client, fake_fetch):
+    fetch = fake_fetch(respond)
+    with mock.patch.object(orchestration, 'fetch_espn_data', fetch):
+        ats_client.get_league_year_ats(season=2024)
+        assert ats_client.get_team_year_ats(team_id='1', season=2024, ats_type='atsAway')['losses'] == 3
+        assert len(fetch.calls) == 2
+
+        ats_client.get_team_year_ats(team_id='1', season=2024, refresh=True)
+        assert len(fetch.calls) == 3
+
+
+def test_client_refetches_teams_that_failed_and_normalizes_the_season(ats_client, fake_fetch):
+    failing = {'2'}
+
+    def flaky(url):
+        team_id = url.split('/teams/')[1].split('/')[0]
+        return None if team_id in failing else respond(url)
+
+    fetch = fake_fetch(flaky)
+    with mock.patch.object(orchestration, 'fetch_espn_data', fetch):
+        assert ats_client.get_league_year_ats(season=2024)['2'] == {}
+        failing.clear()
+
+        ats = ats_client.get_league_year_ats(season='2024')
+        assert ats['2']['atsOverall']['wins'] == 2
+        assert len(fetch.calls) == 3
@@ -0,0 +1,24 @@
+from pyespn.utilities import ReplayTransport, FixtureStore, fetch_espn_data, track_operation, url_pattern, use_transport
+from pyespn.exceptions import API400Error
+import pytest
+
+
+def test_url_pattern_collapses_ids_and_query():
+    url = 'http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/events/401671789/competitions/401671789/drives?page=2'
+    assert url_pattern(url) == '/v2/sports/football/leagues/nfl/events/{id}/competitions/{id}/drives'
+
+
+def test_track_operation_groups_requests_by_endpoint(tmp_path):
+    with use_transport(ReplayTransport(FixtureStore(str(tmp_path)))):
+        with track_operation('game') as diagnostics:
+            for event_id in (1, 2):
+                with pytest.raises(API400Error):
+                    fetch_espn_data(f'http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/events/{event_id}')
+            diagnostics.record_cache(cache='events', hit=True)
+
+    summary = diagnostics.to_dict()
+    endpoint = summary['endpoints']['/v2/sports/football/leagues/nfl/events/{id}']
+    assert summary['operation'] == 'game'
+    assert summary['requests'] == 2 and summary['errors'] == 2
+    assert endpoint['count'] == 2 and sum(endpoint['histogram'].values()) == 2
+    assert summary['cache'] == {'events': {'hits': 1, 'misses': 0}}
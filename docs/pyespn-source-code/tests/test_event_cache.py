@@ -0,0 +1,143 @@
+from pyespn.core import get_event_core, clear_event_cache_core
+import pyespn.core.games as games
+from unittest import mock
+import threading
+import time
+import pytest
+
+
+@pytest.fixture
+def client(fake_client):
+    fake_client._events = {}
+    fake_client._events_lock = threading.Lock()
+    return fake_client
+
+
+class FakeEvent:
+    built = 0
+    states = []
+    refresh_seconds = 0
+
+    def __init__(self, event_json, espn_instance, load_game_odds=False, load_play_by_play=False):
+        FakeEvent.built += 1
+        self.event_json = event_json
+        self.refreshed = 0
+        self.odds = 'odds' if load_game_odds else None
+        self.drives = None
+        self.plays = None
+        self.known_state = event_json.get('state')
+
+    def fetch_state(self):
+        return FakeEvent.states.pop(0)
+
+    def refresh(self):
+        self.refreshed += 1
+        time.sleep(FakeEvent.refresh_seconds)
+
+    def load_betting_odds(self):
+        self.odds = 'odds'
+
+
+def get(client, event_id='401', state='pre', **kwargs):
+    return get_event_core(event_id=event_id, espn_instance=client, event_json={'id': event_id, 'state': state}, **kwargs)
+
+
+def setup_function():
+    FakeEvent.built = 0
+    FakeEvent.states = []
+    FakeEvent.refresh_seconds = 0
+
+
+def test_loaders_share_one_instance_per_event(client):
+    with mock.patch.object(games, 'Event', FakeEvent):
+        first = get(client)
+        second = get(client, load_game_odds=True)
+        other = get(client, event_id='402')
+
+    assert first is second
+    assert first is not other
+    assert FakeEvent.built == 2
+    assert first.odds == 'odds'
+
+
+def test_finished_games_are_never_checked_again(client):
+    FakeEvent.states = ['post']
+    with mock.patch.object(games, 'Event', FakeEvent), mock.patch.object(games.time, 'monotonic', side_effect=[0, 1000, 5000, 9000]):
+        event = get(client, state='post')
+        get(client)
+        get(client)
+        get(client)
+
+    # a game that is final when it is built is never reloaded or even status checked
+    assert event.refreshed == 0
+    assert FakeEvent.states == ['post']
+
+
+def test_unknown_state_is_resolved_on_the_next_lookup(client):
+    FakeEvent.states = ['post']
+    with mock.patch.object(games, 'Event', FakeEvent), \
+            mock.patch.object(games.time, 'monotonic', side_effect=[0, 10, 10, 9000]):
+        event = get(client, state=None)
+        # building the event spends no request on its status
+        assert FakeEvent.states == ['post']
+        get(client)
+        get(client)
+
+    # the freshly built final game is not reloaded, and is never checked again
+    assert event.refreshed == 0
+    assert FakeEvent.states == []
+
+
+def test_unknown_state_reloads_an_event_built_too_long_ago(client):
+    FakeEvent.states = ['in']
+    with mock.patch.object(games, 'Event', FakeEvent), mock.patch.object(games.time, 'monotonic', side_effect=[0, 1000, 1000]):
+        event = get(client, state=None)
+        get(client)
+
+    assert event.refreshed == 1
+    assert FakeEvent.states == []
+
+
+def test_in_progress_games_refresh_once_stale(client):
+    FakeEvent.states = ['in', 'pre']
+    with mock.patch.object(games, 'Event', FakeEvent), \
+            mock.patch.object(games.time, 'monotonic', side_effect=[0, 1000, 1000, 1010, 2000, 2000]):
+        event = get(client, state='in')
+        get(client)
+        get(client)
+        get(client)
+
+    # stale in progress -> reload, fresh hit, stale again -> scheduled games are only status checked
+    assert event.refreshed == 1
+    assert FakeEvent.states == []
+
+
+def test_concurrent_lookups_revalidate_a_stale_event_once(client):
+    FakeEvent.states = ['in', 'in']
+    FakeEvent.refresh_seconds = 0.2
+    with mock.patch.object(games, 'Event', FakeEvent), mock.patch.dict(games.EVENT_MAX_AGE, {'in': 0}):
+        event = get(client, state='in')
+        time.sleep(0.01)
+        barrier = threading.Barrier(2)
+
+        def lookup():
+            barrier.wait()
+            get(client)
+
+        threads = [threading.Thread(target=lookup) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert event.refreshed == 1
+    assert FakeEvent.states == ['in']
+
+
+def test_clear_event_cache(client):
+    with mock.patch.object(games, 'Event', FakeEvent):
+        get(client)
+        clear_event_cache_core(espn_instance=client)
+        get(client)
+
+    assert FakeEvent.built == 2
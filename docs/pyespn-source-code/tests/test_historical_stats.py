@@ -0,0 +1,26 @@
+from pyespn.core import get_many_players_historical_stats_core, clear_season_stats_cache_core
+import pyespn.core.orchestration as orchestration
+import pyespn.core.players as players
+from unittest import mock
+
+
+def respond(url):
+    if 'statisticslog' in url:
+        player_id = url.split('/athletes/')[1].split('/')[0]
+        return {'entries': [{'statistics': [{'statistics': {'$ref': f'http://stats.test/seasons/{year}/types/2/athletes/{player_id}/statistics'}}]}
+                            for year in (2022, 2023, 2024)]}
+    return {'splits': {'categories': [{'name': 'passing', 'stats': [{'name': 'passingYards', 'value': 1}]}]}}
+
+
+def test_historical_stats_batch_caches_finished_seasons(fake_client, fake_fetch):
+    clear_season_stats_cache_core()
+    fetch = fake_fetch(respond)
+    with mock.patch.object(orchestration, 'fetch_espn_data', fetch), \
+            mock.patch.object(players, 'fetch_espn_data', fetch):
+        stats = get_many_players_historical_stats_core(player_ids=['1', '2'], league_abbv='nfl', espn_instance=fake_client)
+        assert sorted(stats['1']) == [2022, 2023, 2024]
+        assert len(fetch.calls) == 8
+
+        fetch.calls.clear()
+        get_many_players_historical_stats_core(player_ids=['1'], league_abbv='nfl', espn_instance=fake_client)
+        assert [url for url in fetch.calls if 'statisticslog' not in url] == ['http://stats.test/seasons/2024/types/2/athletes/1/statistics']
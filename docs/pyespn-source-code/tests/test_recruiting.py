@@ -0,0 +1,36 @@
+from pyespn.core import get_recruiting_rankings_core, iter_recruiting_rankings_core
+import pyespn.core.recruiting as recruiting
+from unittest import mock
+import pytest
+
+
+def respond(url, page_count=4, per_page=3):
+    page = int(url.split('page=')[1]) if 'page=' in url else 1
+    return {'pageCount': page_count,
+            'items': [{'athlete': {'id': str(rank)}, 'attributes': [{'name': 'rank', 'displayValue': str(rank)}]}
+                      for rank in range((page - 1) * per_page + 1, page * per_page + 1)]}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('PYESPN_CACHE_DIR', str(tmp_path))
+
+
+def test_recruits_stream_in_rank_order_with_max_pages(fake_client, fake_fetch):
+    fetch = fake_fetch(respond)
+    with mock.patch.object(recruiting, 'fetch_espn_data', fetch):
+        recruits = list(iter_recruiting_rankings_core(season=2020, league_abbv='cfb', espn_instance=fake_client, max_pages=3))
+
+    assert [recruit.rank for recruit in recruits] == list(range(1, 10))
+    assert len(fetch.calls) == 3
+
+
+def test_finished_class_is_read_from_disk(fake_client, fake_fetch):
+    fetch = fake_fetch(respond)
+    with mock.patch.object(recruiting, 'fetch_espn_data', fetch):
+        first = get_recruiting_rankings_core(season=2020, league_abbv='cfb', espn_instance=fake_client)
+        fetch.calls.clear()
+        second = get_recruiting_rankings_core(season=2020, league_abbv='cfb', espn_instance=fake_client)
+
+    assert fetch.calls == []
+    assert [recruit._id for recruit in second] == [recruit._id for recruit in first]
@@ -0,0 +1,68 @@
+from pyespn.utilities import fetch_espn_data, get_serializer, read_json_file, set_serializer, write_json_file
+import pyespn.utilities.serialization as serialization
+import pyespn.utilities.transport as transport
+from unittest import mock
+import pytest
+
+DOCUMENT = {'id': '401', 'name': 'Señor Stadium', 'items': [{'$ref': 'http://x'}], 'score': 1.5}
+
+
+class BytesResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, content):
+        self.content = content
+
+    @property
+    def text(self):
+        raise AssertionError('the body should be parsed from bytes')
+
+
+@pytest.fixture(autouse=True)
+def restore_serializer():
+    yield
+    set_serializer(None)
+
+
+@pytest.mark.parametrize('name', ['json', 'orjson'])
+def test_backends_round_trip(name):
+    if name == 'orjson' and serialization.orjson is None:
+        pytest.skip('orjson is not installed')
+    set_serializer(name)
+
+    encoded = get_serializer().dumps(DOCUMENT)
+
+    assert isinstance(encoded, bytes)
+    assert 'Señor'.encode('utf-8') in encoded
+    assert get_serializer().loads(encoded) == DOCUMENT
+    assert get_serializer().loads(memoryview(encoded)) == DOCUMENT
+
+
+def test_falls_back_to_the_standard_library_without_orjson(monkeypatch):
+    monkeypatch.delenv(serialization.SERIALIZER_ENV, raising=False)
+    with mock.patch.object(serialization, 'orjson', None):
+        set_serializer(None)
+        assert get_serializer().name == 'json'
+        with pytest.raises(ImportError):
+            set_serializer('orjson')
+
+
+def test_unknown_serializer_is_rejected():
+    with pytest.raises(ValueError):
+        set_serializer('yaml')
+
+
+def test_fetch_parses_response_bytes():
+    body = serialization.StdlibSerializer().dumps(DOCUMENT)
+    with mock.patch.object(transport.requests, 'get', return_value=BytesResponse(body)):
+        assert fetch_espn_data('http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/events/401') == DOCUMENT
+
+
+def test_json_files_use_the_serializer(tmp_path):
+    path = str(tmp_path / 'nested' / 'doc.json')
+    set_serializer('json')
+    write_json_file(path, DOCUMENT)
+
+    assert read_json_file(path) == DOCUMENT
+    assert read_json_file(str(tmp_path / 'missing.json')) is None
@@ -0,0 +1,109 @@
+from pyespn.exceptions import API400Error, RateLimitedError
+from pyespn.utilities import HostGovernor, RateLimiter, configure_host, get_fetch_stats, set_rate_limit
+import pyespn.utilities.api as api
+from unittest import mock
+import pytest
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._content = content or {}
+
+    def json(self):
+        return self._content
+
+
+def test_rate_limiter_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_rate_limiter_allows_burst_without_waiting():
+    limiter = RateLimiter(rate=100, burst=5)
+    assert sum(limiter.acquire() for _ in range(5)) == 0
+
+
+def test_governor_halves_rate_on_throttle_and_recovers():
+    governor = HostGovernor(host='example.test', requests_per_second=8, backoff_base=0)
+    governor.record_throttle(status_code=429)
+    assert governor.current_rate == 4
+    governor.record_success()
+    assert 4 < governor.current_rate <= 8
+    for _ in range(100):
+        governor.record_success()
+    assert governor.current_rate == 8
+
+
+def test_governor_never_drops_below_min_rate():
+    governor = HostGovernor(host='example.test', requests_per_second=2, min_rate=1.5, backoff_base=0)
+    for _ in range(5):
+        governor.record_throttle(status_code=503)
+    assert governor.current_rate == 1.5
+    assert governor.stats()['server_errors'] == 5
+
+
+def test_fetch_retries_throttled_responses():
+    configure_host('retry.test', backoff_base=0, min_rate=100)
+    responses = iter([FakeResponse(429), FakeResponse(502), FakeResponse(200, {'id': '1'})])
+
+    with mock.patch.object(api.requests, 'get', side_effect=lambda url: next(responses)):
+        content = api.fetch_espn_data('http://retry.test/v2/thing')
+
+    stats = get_fetch_stats()['retry.test']
+    assert content == {'id': '1'}
+    assert stats['requests'] == 3
+    assert stats['throttled'] == 1
+    assert stats['server_errors'] == 1
+    assert stats['retries'] == 2
+
+
+def test_fetch_gives_up_after_max_retries():
+    configure_host('give-up.test', backoff_base=0, max_retries=1)
+
+    with mock.patch.object(api.requests, 'get', return_value=FakeResponse(429)) as get:
+        assert api.fetch_espn_data('http://give-up.test/v2/thing') is None
+
+    assert get.call_count == 2
+    assert get_fetch_stats()['give-up.test']['failures'] == 1
+
+
+def test_fetch_json_raises_an_api400_error_after_max_retries():
+    configure_host('give-up-json.test', backoff_base=0, max_retries=1)
+
+    with mock.patch.object(api.requests, 'get', return_value=FakeResponse(503)):
+        with pytest.raises(API400Error) as raised:
+            api.fetch_espn_json('http://give-up-json.test/v2/thing')
+
+    assert isinstance(raised.value, RateLimitedError)
+    assert raised.value.status_code == 503
+    assert raised.value.attempts == 2
+    assert get_fetch_stats()['give-up-json.test']['failures'] == 1
+
+
+def test_client_errors_do_not_raise_the_rate():
+    configure_host('missing.test', requests_per_second=8, backoff_base=0)
+    governor = api.get_governor('http://missing.test/v2/thing')
+    governor.record_throttle(status_code=429)
+    not_found = FakeResponse(404, {'error': {'code': 404, 'message': 'Not Found'}})
+
+    with mock.patch.object(api.requests, 'get', return_value=not_found):
+        with pytest.raises(API400Error):
+            api.fetch_espn_data('http://missing.test/v2/thing')
+
+    assert governor.current_rate == 4
+    assert governor.stats()['successes'] == 0
+
+
+def test_set_rate_limit_keeps_existing_governors_and_their_counters():
+    governor = api.get_governor('http://default-rate.test/v2/thing')
+    governor.record_success()
+    try:
+        set_rate_limit(requests_per_second=5)
+        assert api.get_governor('http://default-rate.test/v2/thing') is governor
+        assert governor.current_rate == 5
+        assert governor.stats()['successes'] == 1
+    finally:
+        set_rate_limit(None)
+    assert governor.current_rate is None
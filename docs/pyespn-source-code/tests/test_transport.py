@@ -0,0 +1,48 @@
+from pyespn.exceptions import API400Error
+from pyespn.utilities import FixtureStore, RecordingTransport, ReplayTransport, fetch_espn_data, fetch_espn_json, use_transport
+import pyespn.utilities.transport as transport
+from unittest import mock
+import json
+import pytest
+import time
+
+
+class FakeResponse:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.headers = {'Content-Type': 'application/json'}
+        self.text = json.dumps(content)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def test_recorded_responses_replay_without_network(tmp_path):
+    store = FixtureStore(str(tmp_path))
+    with mock.patch.object(transport.requests, 'get', return_value=FakeResponse(200, {'id': '22'})):
+        with use_transport(RecordingTransport(store)):
+            recorded = fetch_espn_data('http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams/22')
+
+    with mock.patch.object(transport.requests, 'get', side_effect=AssertionError('network used')):
+        with use_transport(ReplayTransport(store)) as replay:
+            replayed = fetch_espn_data('https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams/22')
+
+    assert recorded == replayed == {'id': '22'}
+    assert replay.requests == 1 and replay.misses == []
+
+
+def test_replay_injects_latency_and_reports_misses(tmp_path):
+    with use_transport(ReplayTransport(FixtureStore(str(tmp_path)), latency=0.05)) as replay:
+        started = time.perf_counter()
+        with pytest.raises(API400Error):
+            fetch_espn_data('http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams/99')
+
+    assert time.perf_counter() - started >= 0.05
+    assert replay.misses == ['http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams/99']
+
+
+def test_fetch_espn_json_returns_error_documents_as_they_are(tmp_path):
+    with use_transport(ReplayTransport(FixtureStore(str(tmp_path)))):
+        content = fetch_espn_json('http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/athletes/99')
+
+    assert content['error']['code'] == 404
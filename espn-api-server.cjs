@@ -1,4 +1,5 @@
 const { spawn } = require('child_process');
+const os = require('os');
 const path = require('path');
 const express = require('express');
 const cors = require('cors');
@@ -9,76 +10,516 @@ const PORT = 3001;
 app.use(cors());
 app.use(express.json());
 
-function createCache(ttlMs) {
-  const store = new Map();
+function createMetrics() {
+  const counters = new Map();
+  const gauges = new Map();
+  const histograms = new Map();
+  const help = new Map();
+
+  const labelKey = labels =>
+    Object.keys(labels)
+      .sort()
+      .map(name => `${name}="${String(labels[name]).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n')}"`)
+      .join(',');
+
+  const series = (store, name) => {
+    if (!store.has(name)) {
+      store.set(name, new Map());
+    }
+    return store.get(name);
+  };
+
   return {
+    describe(name, type, text) {
+      help.set(name, { type, text });
+    },
+    inc(name, labels = {}, value = 1) {
+      const values = series(counters, name);
+      const key = labelKey(labels);
+      values.set(key, (values.get(key) || 0) + value);
+    },
+    set(name, labels = {}, value) {
+      series(gauges, name).set(labelKey(labels), value);
+    },
+    observe(name, labels = {}, value, buckets) {
+      const values = series(histograms, name);
+      const key = labelKey(labels);
+      let entry = values.get(key);
+      if (!entry) {
+        entry = { buckets, counts: new Array(buckets.length).fill(0), sum: 0, count: 0 };
+        values.set(key, entry);
+      }
+      entry.buckets.forEach((bound, index) => {
+        if (value <= bound) {
+          entry.counts[index] += 1;
+        }
+      });
+      entry.sum += value;
+      entry.count += 1;
+    },
+    render(collectors = []) {
+      collectors.forEach(collect => collect());
+      const lines = [];
+      const header = name => {
+        const info = help.get(name);
+        if (info) {
+          lines.push(`# HELP ${name} ${info.text}`);
+          lines.push(`# TYPE ${name} ${info.type}`);
+        }
+      };
+      const withLabels = (key, extra) => {
+        const joined = [key, extra].filter(Boolean).join(',');
+        return joined ? `{${joined}}` : '';
+      };
+      for (const [name, values] of [...counters, ...gauges]) {
+        header(name);
+        for (const [key, value] of values) {
+          lines.push(`${name}${withLabels(key)} ${value}`);
+        }
+      }
+      for (const [name, values] of histograms) {
+        header(name);
+        for (const [key, entry] of values) {
+          entry.buckets.forEach((bound, index) => {
+            lines.push(`${name}_bucket${withLabels(key, `le="${bound}"`)} ${entry.counts[index]}`);
+          });
+          lines.push(`${name}_bucket${withLabels(key, 'le="+Inf"')} ${entry.count}`);
+          lines.push(`${name}_sum${withLabels(key)} ${entry.sum}`);
+          lines.push(`${name}_count${withLabels(key)} ${entry.count}`);
+        }
+      }
+      return `${lines.join('\n')}\n`;
+    },
+  };
+}
+
+const metrics = createMetrics();
+const DURATION_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120];
+const SIZE_BUCKETS = [1024, 8192, 32768, 131072, 524288, 2097152, 8388608];
+
+metrics.describe('espn_api_cache_lookups_total', 'counter', 'Cache lookups by cache and result (hit, miss, expired).');
+metrics.describe('espn_api_cache_entries', 'gauge', 'Entries currently held by each cache.');
+metrics.describe('espn_api_python_spawns_total', 'counter', 'Python script runs by script and outcome.');
+metrics.describe('espn_api_python_duration_seconds', 'histogram', 'Wall time of Python script runs.');
+metrics.describe('espn_api_python_in_flight', 'gauge', 'Python processes currently running.');
+metrics.describe('espn_api_http_requests_total', 'counter', 'HTTP responses by route and status code.');
+metrics.describe('espn_api_http_duration_seconds', 'histogram', 'HTTP response time by route.');
+metrics.describe('espn_api_response_bytes', 'histogram', 'HTTP response body size by route.');
+
+metrics.describe('espn_api_cache_bytes', 'gauge', 'Approximate bytes held by each cache.');
+metrics.describe('espn_api_cache_evictions_total', 'counter', 'Cache entries dropped by cache and reason (expired, entries, bytes).');
+
+const caches = [];
+const CACHE_SWEEP_INTERVAL_MS = 60 * 1000;
+
+// Least-recently-used cache bounded by entry count and approximate size. Map keeps
+// insertion order, so re-inserting on every hit leaves the coldest entry first.
+function createCache(name, { ttlMs, maxEntries = 500, maxBytes = 64 * 1024 * 1024 }) {
+  const store = new Map();
+  let bytes = 0;
+
+  const remove = (key, reason) => {
+    const entry = store.get(key);
+    if (!entry) {
+      return;
+    }
+    store.delete(key);
+    bytes -= entry.bytes;
+    metrics.inc('espn_api_cache_evictions_total', { cache: name, reason });
+  };
+
+  const cache = {
+    name,
+    ttlMs,
     get(key) {
       const entry = store.get(key);
       if (!entry) {
+        metrics.inc('espn_api_cache_lookups_total', { cache: name, result: 'miss' });
         return null;
       }
-      if (Date.now() - entry.timestamp > ttlMs) {
-        store.delete(key);
+      if (Date.now() > entry.expiresAt) {
+        remove(key, 'expired');
+        metrics.inc('espn_api_cache_lookups_total', { cache: name, result: 'expired' });
         return null;
       }
+      store.delete(key);
+      store.set(key, entry);
+      metrics.inc('espn_api_cache_lookups_total', { cache: name, result: 'hit' });
       return entry.value;
     },
-    set(key, value) {
-      store.set(key, { value, timestamp: Date.now() });
+    set(key, value, { size, ttlMs: entryTtlMs = ttlMs } = {}) {
+      const entryBytes = size ?? Buffer.byteLength(JSON.stringify(value) ?? '');
+      if (store.has(key)) {
+        bytes -= store.get(key).bytes;
+        store.delete(key);
+      }
+      if (entryBytes > maxBytes) {
+        metrics.inc('espn_api_cache_evictions_total', { cache: name, reason: 'bytes' });
+        return;
+      }
+      store.set(key, { value, bytes: entryBytes, expiresAt: Date.now() + entryTtlMs });
+      bytes += entryBytes;
+      for (const oldest of store.keys()) {
+        if (store.size <= maxEntries && bytes <= maxBytes) {
+          break;
+        }
+        remove(oldest, store.size > maxEntries ? 'entries' : 'bytes');
+      }
+    },
+    sweep() {
+      const now = Date.now();
+      for (const [key, entry] of store) {
+        if (now > entry.expiresAt) {
+          remove(key, 'expired');
+        }
+      }
+    },
+    get size() {
+      return store.size;
+    },
+    get bytes() {
+      return bytes;
     },
   };
+  caches.push(cache);
+  return cache;
 }
 
-const scheduleCache = createCache(5 * 60 * 1000);
-const gameCache = createCache(30 * 1000);
-const pbpCache = createCache(10 * 1000);
-const playerCache = createCache(60 * 60 * 1000);
+const scheduleCache = createCache('schedule', { ttlMs: 5 * 60 * 1000, maxEntries: 200, maxBytes: 32 * 1024 * 1024 });
+const gameCache = createCache('game', { ttlMs: 30 * 1000, maxEntries: 200, maxBytes: 64 * 1024 * 1024 });
+const pbpCache = createCache('pbp', { ttlMs: 10 * 1000, maxEntries: 64, maxBytes: 128 * 1024 * 1024 });
+const playerCache = createCache('player', { ttlMs: 60 * 60 * 1000, maxEntries: 5000, maxBytes: 32 * 1024 * 1024 });
+const playerIndexCache = createCache('player_index', { ttlMs: 60 * 60 * 1000, maxEntries: 20000, maxBytes: 16 * 1024 * 1024 });
 
-function runPy(script, args = []) {
-  return new Promise((resolve, reject) => {
-    const scriptName = path.basename(script);
-    const proc = spawn('python', [script, ...args], {
-      stdio: ['ignore', 'pipe', 'pipe'],
-    });
+setInterval(() => caches.forEach(cache => cache.sweep()), CACHE_SWEEP_INTERVAL_MS).unref();
 
-    let stdout = '';
-    let stderr = '';
+// Game data is cached by the state of the games it covers, mirroring py/espn_schedule.py:
+// finished games never expire, games not yet started are kept until kickoff (capped), and
+// games in progress use the cache's live TTL. Anything unrecognised gets the cache default.
+// Finished schedule weeks are the exception: their season meta (default week, week lists)
+// moves on every week, so they are kept for SCHEDULE_FINAL_TTL_MS.
+const UPCOMING_TTL_MAX_MS = 6 * 60 * 60 * 1000;
+const SCHEDULE_LIVE_TTL_MS = 60 * 1000;
+const SCHEDULE_FINAL_TTL_MS = 60 * 60 * 1000;
 
-    proc.stdout.on('data', chunk => {
-      stdout += chunk.toString();
-    });
+function statusValue(status) {
+  if (typeof status === 'string') {
+    return status;
+  }
+  const type = status && typeof status === 'object' ? status.type : null;
+  if (typeof type === 'string') {
+    return type;
+  }
+  return type ? type.state || type.description || type.detail || null : null;
+}
 
-    proc.stderr.on('data', chunk => {
-      const text = chunk.toString();
-      stderr += text;
-      const lines = text.split(/\r?\n/).filter(Boolean);
-      lines.forEach(line => {
-        console.error(`[pyespn:${scriptName}] ${line}`);
-      });
-    });
+function gameState(status) {
+  const value = String(statusValue(status) ?? '').toLowerCase();
+  if (value === 'post' || value.includes('final')) {
+    return 'post';
+  }
+  if (value === 'pre' || value.includes('scheduled')) {
+    return 'pre';
+  }
+  if (value === 'in' || ['progress', 'halftime', 'delayed', 'end of'].some(marker => value.includes(marker))) {
+    return 'in';
+  }
+  return null;
+}
+
+function statusTtlMs(games, { liveMs, defaultMs, finalMs = Infinity }) {
+  if (!games.length) {
+    return defaultMs;
+  }
+  const now = Date.now();
+  const ttlMs = games.reduce((ttl, { status, date }) => {
+    const state = gameState(status);
+    if (state === 'post') {
+      return ttl;
+    }
+    if (state === 'in') {
+      return Math.min(ttl, liveMs);
+    }
+    const kickoff = state === 'pre' ? Date.parse(date) : NaN;
+    if (Number.isNaN(kickoff)) {
+      return Math.min(ttl, defaultMs);
+    }
+    return Math.min(ttl, Math.min(Math.max(kickoff - now, liveMs), UPCOMING_TTL_MAX_MS));
+  }, Infinity);
+  return ttlMs === Infinity ? finalMs : ttlMs;
+}
+
+function scheduleTtlMs(payload) {
+  const entries = Array.isArray(payload.entries) ? payload.entries : [];
+  return statusTtlMs(entries, {
+    liveMs: SCHEDULE_LIVE_TTL_MS,
+    defaultMs: scheduleCache.ttlMs,
+    finalMs: SCHEDULE_FINAL_TTL_MS,
+  });
+}
+
+function eventTtlMs(cache, payload) {
+  const competition = Array.isArray(payload?.competitions) ? payload.competitions[0] : null;
+  const status = competition?.status ?? payload?.status;
+  if (!payload || !status) {
+    return cache.ttlMs;
+  }
+  return statusTtlMs([{ status, date: payload.date ?? competition?.date }], {
+    liveMs: cache.ttlMs,
+    defaultMs: cache.ttlMs,
+  });
+}
+
+metrics.describe('espn_api_python_queue_depth', 'gauge', 'Python jobs waiting for a free slot, by priority.');
+metrics.describe('espn_api_python_queue_wait_seconds', 'histogram', 'Time Python jobs spent queued before spawning.');
+
+// Python work goes through a bounded priority queue: at most PY_MAX_CONCURRENCY children
+// run at once, lower priority numbers start first, and jobs beyond PY_MAX_QUEUE are
+// rejected so an overloaded server answers 503 instead of forking without limit.
+const PY_MAX_CONCURRENCY = Number(process.env.ESPN_PY_CONCURRENCY) || Math.max(2, os.cpus().length);
+const PY_MAX_QUEUE = Number(process.env.ESPN_PY_MAX_QUEUE) || 100;
+const PY_TIMEOUT_MS = Number(process.env.ESPN_PY_TIMEOUT_MS) || 120 * 1000;
+const PY_KILL_GRACE_MS = 5 * 1000;
+const PY_PRIORITY = { pbp: 0, game: 1, schedule: 2, player: 3, background: 4 };
+
+let pythonInFlight = 0;
+const pythonQueue = [];
+
+function collectGauges() {
+  caches.forEach(cache => {
+    metrics.set('espn_api_cache_entries', { cache: cache.name }, cache.size);
+    metrics.set('espn_api_cache_bytes', { cache: cache.name }, cache.bytes);
+  });
+  metrics.set('espn_api_python_in_flight', {}, pythonInFlight);
+  Object.values(PY_PRIORITY).forEach(priority => {
+    const depth = pythonQueue.filter(job => job.priority === priority).length;
+    metrics.set('espn_api_python_queue_depth', { priority }, depth);
+  });
+}
+
+// The py/ scripts attach pyespn fetch diagnostics under meta.diagnostics when asked to;
+// they are logged here and stripped before responses are cached or returned.
+const PY_DIAGNOSTICS_ENABLED = process.env.PYESPN_DIAGNOSTICS !== '0';
+
+function formatDiagnostics(route, diagnostics) {
+  const endpoints = Object.entries(diagnostics.endpoints || {})
+    .slice(0, 3)
+    .map(([pattern, stats]) => `${pattern} x${stats.count} ${stats.total_seconds}s (max ${stats.max_seconds}s)`);
+  const caches = Object.entries(diagnostics.cache || {}).map(
+    ([name, counts]) => `${name} ${counts.hits}/${counts.hits + counts.misses} hit`,
+  );
+  const parts = [
+    `${diagnostics.requests} requests (${diagnostics.errors} errors)`,
+    `${diagnostics.request_seconds}s fetching in ${diagnostics.elapsed_seconds}s`,
+  ];
+  if (endpoints.length) {
+    parts.push(`slowest: ${endpoints.join(', ')}`);
+  }
+  if (caches.length) {
+    parts.push(`cache: ${caches.join(', ')}`);
+  }
+  return `[pyespn:${route}] ${parts.join('; ')}`;
+}
 
-    proc.on('close', code => {
-      if (code === 0) {
-        resolve(stdout);
-      } else {
-        reject(new Error(stderr || `python process exited with code ${code}`));
+function takeDiagnostics(route, data) {
+  if (!data || typeof data !== 'object' || Array.isArray(data)) {
+    return data;
+  }
+  const meta = data.meta;
+  if (!meta || typeof meta !== 'object' || !meta.diagnostics) {
+    return data;
+  }
+  const { diagnostics } = meta;
+  delete meta.diagnostics;
+  if (Object.keys(meta).length === 0) {
+    delete data.meta;
+  }
+  try {
+    console.log(formatDiagnostics(route, diagnostics));
+  } catch (err) {
+    console.error(`[pyespn:${route}] failed to log diagnostics`, err);
+  }
+  return data;
+}
+
+class PythonQueueFullError extends Error {
+  constructor(scriptName) {
+    super(`python queue is full (${PY_MAX_QUEUE} jobs waiting), rejected ${scriptName}`);
+    this.name = 'PythonQueueFullError';
+  }
+}
+
+function spawnPy(job) {
+  const { script, args, scriptName, resolve, reject } = job;
+  const started = process.hrtime.bigint();
+  let finished = false;
+  let released = false;
+  pythonInFlight += 1;
+  metrics.observe(
+    'espn_api_python_queue_wait_seconds',
+    { script: scriptName },
+    Number(started - job.enqueuedAt) / 1e9,
+    DURATION_BUCKETS,
+  );
+  const finish = outcome => {
+    if (finished) {
+      return false;
+    }
+    finished = true;
+    clearTimeout(timeout);
+    const seconds = Number(process.hrtime.bigint() - started) / 1e9;
+    metrics.inc('espn_api_python_spawns_total', { script: scriptName, outcome });
+    metrics.observe('espn_api_python_duration_seconds', { script: scriptName }, seconds, DURATION_BUCKETS);
+    return true;
+  };
+  // the concurrency slot is held until the process is gone, not just until the job settles:
+  // a timed out job is rejected right away but its process may take PY_KILL_GRACE_MS to exit
+  const release = () => {
+    if (released) {
+      return;
+    }
+    released = true;
+    pythonInFlight -= 1;
+    drainPythonQueue();
+  };
+  const proc = spawn('python', [script, ...args], {
+    stdio: ['ignore', 'pipe', 'pipe'],
+    env: { ...process.env, PYESPN_DIAGNOSTICS: PY_DIAGNOSTICS_ENABLED ? '1' : '0' },
+  });
+
+  const timeout = setTimeout(() => {
+    console.error(`[pyespn:${scriptName}] timed out after ${PY_TIMEOUT_MS}ms, killing pid ${proc.pid}`);
+    proc.kill('SIGTERM');
+    setTimeout(() => {
+      if (proc.exitCode === null && proc.signalCode === null) {
+        proc.kill('SIGKILL');
       }
+    }, PY_KILL_GRACE_MS).unref();
+    if (finish('timeout')) {
+      reject(new Error(`python process timed out after ${PY_TIMEOUT_MS}ms`));
+    }
+  }, PY_TIMEOUT_MS);
+
+  // kept as raw chunks and decoded once, so multi-byte characters split across chunks survive
+  const stdout = [];
+  let stderr = '';
+
+  proc.stdout.on('data', chunk => {
+    stdout.push(chunk);
+  });
+
+  proc.stderr.on('data', chunk => {
+    const text = chunk.toString();
+    stderr += text;
+    const lines = text.split(/\r?\n/).filter(Boolean);
+    lines.forEach(line => {
+      console.error(`[pyespn:${scriptName}] ${line}`);
     });
+  });
 
-    proc.on('error', err => {
-      console.error(`[pyespn:${scriptName}] failed to spawn python process`, err);
+  proc.on('close', code => {
+    release();
+    if (code === 0) {
+      if (finish('success')) {
+        resolve(Buffer.concat(stdout));
+      }
+    } else if (finish('error')) {
+      reject(new Error(stderr || `python process exited with code ${code}`));
+    }
+  });
+
+  proc.on('error', err => {
+    console.error(`[pyespn:${scriptName}] failed to spawn python process`, err);
+    // a process that never started won't emit close
+    if (proc.pid === undefined) {
+      release();
+    }
+    if (finish('spawn_error')) {
       reject(err);
-    });
+    }
   });
 }
 
+function drainPythonQueue() {
+  while (pythonInFlight < PY_MAX_CONCURRENCY && pythonQueue.length) {
+    spawnPy(pythonQueue.shift());
+  }
+}
+
+function runPy(script, args = [], { priority = PY_PRIORITY.player } = {}) {
+  return new Promise((resolve, reject) => {
+    const scriptName = path.basename(script);
+    if (pythonQueue.length >= PY_MAX_QUEUE) {
+      metrics.inc('espn_api_python_spawns_total', { script: scriptName, outcome: 'rejected' });
+      reject(new PythonQueueFullError(scriptName));
+      return;
+    }
+    const job = { script, args, scriptName, priority, resolve, reject, enqueuedAt: process.hrtime.bigint() };
+    // keep the queue ordered by priority, first come first served within a priority
+    const index = pythonQueue.findIndex(queued => queued.priority > priority);
+    pythonQueue.splice(index === -1 ? pythonQueue.length : index, 0, job);
+    drainPythonQueue();
+  });
+}
+
+// scripts print one JSON document; an empty buffer means the script had nothing to report
+function parsePyJson(raw) {
+  return raw.length ? JSON.parse(raw.toString('utf8')) : {};
+}
+
+function pyErrorStatus(err) {
+  return err instanceof PythonQueueFullError ? 503 : 500;
+}
+
 const router = express.Router();
 
+router.use((req, res, next) => {
+  const started = process.hrtime.bigint();
+  res.on('finish', () => {
+    const route = req.route ? req.route.path : 'unmatched';
+    const seconds = Number(process.hrtime.bigint() - started) / 1e9;
+    const bytes = Number(res.getHeader('content-length')) || 0;
+    metrics.inc('espn_api_http_requests_total', { route, status: res.statusCode });
+    metrics.observe('espn_api_http_duration_seconds', { route }, seconds, DURATION_BUCKETS);
+    metrics.observe('espn_api_response_bytes', { route }, bytes, SIZE_BUCKETS);
+  });
+  next();
+});
+
+// Mirrors SEASON_TYPE_ALIASES in py/espn_schedule.py. Schedule weeks are cached under the
+// normalized season:type:week key the script uses, so /schedule/preseason/2024/1, a range
+// request and the warmer all share one entry.
+const SEASON_TYPE_ALIASES = {
+  preseason: 'pre',
+  'pre-season': 'pre',
+  pre: 'pre',
+  regular: 'regular',
+  regularseason: 'regular',
+  regular_season: 'regular',
+  post: 'post',
+  postseason: 'post',
+  'post-season': 'post',
+  playoff: 'post',
+  playoffs: 'post',
+  playin: 'playin',
+  play_in: 'playin',
+  'play-in': 'playin',
+};
+
+function normalizeSeasonType(seasonType) {
+  const key = String(seasonType).toLowerCase();
+  return Object.prototype.hasOwnProperty.call(SEASON_TYPE_ALIASES, key) ? SEASON_TYPE_ALIASES[key] : key;
+}
+
+function scheduleCacheKey(season, seasonType, week) {
+  return `${season}:${normalizeSeasonType(seasonType)}:${week}`;
+}
+
 router.get('/schedule/:seasonType/:season/:week', async (req, res) => {
   const { seasonType, season, week } = req.params;
   const forceRefresh =
     req.query.force === 'true' || req.query.force === '1' || req.query.force === 'refresh';
-  const cacheKey = `${seasonType}:${season}:${week}`.toLowerCase();
+  const cacheKey = scheduleCacheKey(season, seasonType, week);
   try {
     if (!forceRefresh) {
       const cached = scheduleCache.get(cacheKey);
@@ -92,17 +533,126 @@ router.get('/schedule/:seasonType/:season/:week', async (req, res) => {
     if (forceRefresh) {
       args.push('--force');
     }
-    const raw = await runPy(script, args);
-    const parsed = JSON.parse(raw || '{}');
+    const raw = await runPy(script, args, { priority: PY_PRIORITY.schedule });
+    const parsed = takeDiagnostics('schedule', parsePyJson(raw));
     const normalized =
       parsed && typeof parsed === 'object' && !Array.isArray(parsed)
         ? parsed
         : { entries: Array.isArray(parsed) ? parsed : [], meta: null };
-    scheduleCache.set(cacheKey, normalized);
+    scheduleCache.set(cacheKey, normalized, {
+      size: raw.length,
+      ttlMs: scheduleTtlMs(normalized),
+    });
     res.json(normalized);
   } catch (err) {
     console.error('Failed to fetch ESPN schedule', err);
-    res.status(500).json({ error: 'Failed to fetch schedule from PyESPN' });
+    res.status(pyErrorStatus(err)).json({ error: 'Failed to fetch schedule from PyESPN' });
+  }
+});
+
+// Range queries (/schedule/regular/2024?weeks=1-18, /schedule/all/2022-2024) are answered by
+// one espn_schedule.py --range run. Each week is cached under its single-week key, and the
+// season summaries are sent once per season rather than once per week.
+const SCHEDULE_RANGE_MAX_SEASONS = 10;
+const SEASON_RANGE_PATTERN = /^\d{4}(-\d{4})?$/;
+const WEEK_RANGE_PATTERN = /^\d{1,2}(-\d{1,2})?$/;
+const SEASON_META_FIELDS = ['season_types', 'week_to_season_type', 'default_week', 'default_season_type'];
+
+function expandNumberRange(value) {
+  const [start, end = start] = value.split('-').map(Number);
+  const numbers = [];
+  for (let number = Math.min(start, end); number <= Math.max(start, end); number += 1) {
+    numbers.push(number);
+  }
+  return numbers;
+}
+
+function compactScheduleWeek(payload, season, seasonType, week) {
+  return {
+    season,
+    season_type: seasonType,
+    resolved_season_type: payload.meta?.resolved_season_type ?? seasonType,
+    week,
+    generated_at: payload.meta?.generated_at ?? null,
+    entries: payload.entries || [],
+  };
+}
+
+function expandScheduleWeek(item, seasonMeta = {}) {
+  return {
+    entries: item.entries || [],
+    meta: {
+      season: item.season,
+      requested_season_type: item.season_type,
+      resolved_season_type: item.resolved_season_type,
+      requested_week: item.week,
+      ...Object.fromEntries(SEASON_META_FIELDS.map(field => [field, seasonMeta[field] ?? null])),
+      generated_at: item.generated_at,
+    },
+  };
+}
+
+function cachedScheduleRange(seasonType, seasons, weeks) {
+  const items = [];
+  const seasonMetas = {};
+  const normalizedType = normalizeSeasonType(seasonType);
+  for (const season of seasons) {
+    for (const week of weeks) {
+      const cached = scheduleCache.get(scheduleCacheKey(season, normalizedType, week));
+      if (!cached || !cached.meta) {
+        return null;
+      }
+      items.push(compactScheduleWeek(cached, season, normalizedType, week));
+      seasonMetas[season] = Object.fromEntries(SEASON_META_FIELDS.map(field => [field, cached.meta[field] ?? null]));
+    }
+  }
+  return { weeks: items, meta: { season_type: seasonType, seasons: seasonMetas, rebuilt: [] } };
+}
+
+router.get('/schedule/:seasonType/:seasons', async (req, res) => {
+  const seasonType = req.params.seasonType.toLowerCase();
+  const { seasons } = req.params;
+  const weeks = req.query.weeks === undefined ? null : String(req.query.weeks);
+  if (!SEASON_RANGE_PATTERN.test(seasons) || (weeks !== null && !WEEK_RANGE_PATTERN.test(weeks))) {
+    res.status(400).json({ error: 'Expected seasons like 2024 or 2022-2024 and weeks like 7 or 1-18' });
+    return;
+  }
+  const seasonList = expandNumberRange(seasons);
+  if (seasonList.length > SCHEDULE_RANGE_MAX_SEASONS) {
+    res.status(400).json({ error: `At most ${SCHEDULE_RANGE_MAX_SEASONS} seasons can be requested at once` });
+    return;
+  }
+  const forceRefresh =
+    req.query.force === 'true' || req.query.force === '1' || req.query.force === 'refresh';
+  try {
+    if (!forceRefresh && weeks !== null && seasonType !== 'all') {
+      const cached = cachedScheduleRange(seasonType, seasonList, expandNumberRange(weeks));
+      if (cached) {
+        res.json(cached);
+        return;
+      }
+    }
+    const script = path.join(process.cwd(), 'py/espn_schedule.py');
+    const args = ['--range', seasonType, seasons];
+    if (weeks !== null) {
+      args.push(weeks);
+    }
+    if (forceRefresh) {
+      args.push('--force');
+    }
+    const raw = await runPy(script, args, { priority: PY_PRIORITY.schedule });
+    const data = takeDiagnostics('schedule', parsePyJson(raw));
+    const seasonMetas = data.meta?.seasons || {};
+    (data.weeks || []).forEach(item => {
+      const payload = expandScheduleWeek(item, seasonMetas[String(item.season)]);
+      scheduleCache.set(scheduleCacheKey(item.season, item.season_type, item.week), payload, {
+        ttlMs: scheduleTtlMs(payload),
+      });
+    });
+    res.json({ weeks: data.weeks || [], meta: data.meta ?? null });
+  } catch (err) {
+    console.error('Failed to fetch ESPN schedule range', err);
+    res.status(pyErrorStatus(err)).json({ error: 'Failed to fetch schedule range from PyESPN' });
   }
 });
 
@@ -120,13 +670,16 @@ router.get('/game/:eventId', async (req, res) => {
       }
     }
     const script = path.join(process.cwd(), 'py/espn_game.py');
-    const raw = await runPy(script, [eventId]);
-    const data = JSON.parse(raw || '{}');
-    gameCache.set(cacheKey, data);
+    const raw = await runPy(script, [eventId], { priority: PY_PRIORITY.game });
+    const data = takeDiagnostics('game', parsePyJson(raw));
+    gameCache.set(cacheKey, data, {
+      size: raw.length,
+      ttlMs: eventTtlMs(gameCache, data),
+    });
     res.json(data);
   } catch (err) {
     console.error('Failed to fetch ESPN game info', err);
-    res.status(500).json({ error: 'Failed to fetch game from PyESPN' });
+    res.status(pyErrorStatus(err)).json({ error: 'Failed to fetch game from PyESPN' });
   }
 });
 
@@ -144,13 +697,185 @@ router.get('/game/:eventId/pbp', async (req, res) => {
       }
     }
     const script = path.join(process.cwd(), 'py/espn_pbp.py');
-    const raw = await runPy(script, [eventId]);
-    const data = JSON.parse(raw || '{}');
-    pbpCache.set(cacheKey, data);
+    const raw = await runPy(script, [eventId], { priority: PY_PRIORITY.pbp });
+    const data = takeDiagnostics('pbp', parsePyJson(raw));
+    pbpCache.set(cacheKey, data, {
+      size: raw.length,
+      ttlMs: eventTtlMs(pbpCache, data),
+    });
     res.json(data);
   } catch (err) {
     console.error('Failed to fetch ESPN play-by-play', err);
-    res.status(500).json({ error: 'Failed to fetch play-by-play from PyESPN' });
+    res.status(pyErrorStatus(err)).json({ error: 'Failed to fetch play-by-play from PyESPN' });
+  }
+});
+
+// Background warmer: espn_schedule.py --warm rebuilds the current, previous and next week
+// shortly before they expire and the results are stored under their schedule route keys.
+// Runs are chained one after another, timed from the earliest expiry and jittered.
+const SCHEDULE_WARMER_ENABLED = process.env.ESPN_SCHEDULE_WARMER !== '0';
+const SCHEDULE_WARM_MIN_DELAY_MS = 30 * 1000;
+const SCHEDULE_WARM_MAX_DELAY_MS = 10 * 60 * 1000;
+const SCHEDULE_WARM_LEAD_MS = 20 * 1000;
+const SCHEDULE_WARM_JITTER_MS = 10 * 1000;
+
+function scheduleWarmDelay(expiresInMs) {
+  const target = Math.min(expiresInMs - SCHEDULE_WARM_LEAD_MS, SCHEDULE_WARM_MAX_DELAY_MS);
+  return Math.max(target - Math.random() * SCHEDULE_WARM_JITTER_MS, SCHEDULE_WARM_MIN_DELAY_MS);
+}
+
+async function warmSchedule() {
+  const script = path.join(process.cwd(), 'py/espn_schedule.py');
+  const margin = Math.ceil((SCHEDULE_WARM_LEAD_MS + SCHEDULE_WARM_JITTER_MS) / 1000);
+  const raw = await runPy(script, ['--warm', '--margin', String(margin)], { priority: PY_PRIORITY.background });
+  const data = takeDiagnostics('schedule', parsePyJson(raw));
+  const expiresIn = data.meta?.expires_in || {};
+  let nextExpiryMs = Infinity;
+  Object.entries(data.weeks || {}).forEach(([key, payload]) => {
+    const seconds = expiresIn[key];
+    const ttlMs = typeof seconds === 'number' ? seconds * 1000 : scheduleTtlMs(payload);
+    scheduleCache.set(key, payload, { ttlMs });
+    nextExpiryMs = Math.min(nextExpiryMs, ttlMs);
+  });
+  return nextExpiryMs;
+}
+
+function startScheduleWarmer() {
+  const run = () => {
+    warmSchedule()
+      .catch(err => {
+        console.error('Failed to warm ESPN schedule cache', err);
+        return SCHEDULE_WARM_MAX_DELAY_MS;
+      })
+      .then(expiresInMs => {
+        setTimeout(run, scheduleWarmDelay(expiresInMs)).unref();
+      });
+  };
+  setTimeout(run, Math.random() * SCHEDULE_WARM_JITTER_MS).unref();
+}
+
+// Batch player lookups are answered from the on-disk player index kept by py/espn_players.py.
+// Entries the index reports as stale are served as-is and refreshed after the response.
+const PLAYER_BATCH_LIMIT = 100;
+const playerIndexRefreshes = new Set();
+// Ids ESPN has no player for are remembered briefly, so a live view that keeps asking for a
+// retired or unknown id doesn't spawn espn_players.py on every request.
+const PLAYER_MISSING = Object.freeze({ missing: true });
+const PLAYER_MISSING_TTL_MS = 10 * 60 * 1000;
+// The index is seeded from pyespn's athlete directory in the background, later builds only
+// fetch athletes the directory hasn't seen. An interrupted build resumes from its checkpoint.
+const PLAYER_INDEX_BUILD_ENABLED = process.env.ESPN_PLAYER_INDEX_BUILD !== '0';
+const PLAYER_INDEX_BUILD_DELAY_MS = 30 * 1000;
+const PLAYER_INDEX_BUILD_INTERVAL_MS = 24 * 60 * 60 * 1000;
+const PLAYER_INDEX_BUILD_RETRY_MS = 60 * 60 * 1000;
+
+function parseIdList(value) {
+  const values = Array.isArray(value) ? value : [value];
+  const ids = new Set();
+  values.forEach(item => {
+    String(item ?? '')
+      .split(',')
+      .map(part => part.trim())
+      .filter(part => /^\d+$/.test(part))
+      .forEach(part => ids.add(part));
+  });
+  return Array.from(ids);
+}
+
+function storePlayerIndexEntries(players) {
+  Object.entries(players || {}).forEach(([id, entry]) => {
+    if (entry) {
+      playerIndexCache.set(id, entry);
+    } else {
+      playerIndexCache.set(id, PLAYER_MISSING, { size: id.length, ttlMs: PLAYER_MISSING_TTL_MS });
+    }
+  });
+}
+
+function buildPlayerIndex() {
+  const script = path.join(process.cwd(), 'py/espn_players.py');
+  return runPy(script, ['--build'], { priority: PY_PRIORITY.background }).then(raw => {
+    takeDiagnostics('players', parsePyJson(raw));
+  });
+}
+
+function startPlayerIndexBuilder() {
+  const run = () => {
+    buildPlayerIndex()
+      .then(() => PLAYER_INDEX_BUILD_INTERVAL_MS)
+      .catch(err => {
+        console.error('Failed to build ESPN player index', err);
+        return PLAYER_INDEX_BUILD_RETRY_MS;
+      })
+      .then(delayMs => {
+        setTimeout(run, delayMs).unref();
+      });
+  };
+  setTimeout(run, PLAYER_INDEX_BUILD_DELAY_MS).unref();
+}
+
+function refreshPlayerIndexInBackground(ids) {
+  const pending = ids.filter(id => !playerIndexRefreshes.has(id));
+  if (!pending.length) {
+    return;
+  }
+  pending.forEach(id => playerIndexRefreshes.add(id));
+  const script = path.join(process.cwd(), 'py/espn_players.py');
+  runPy(script, [...pending, '--refresh'], { priority: PY_PRIORITY.background })
+    .then(raw => {
+      const data = takeDiagnostics('players', parsePyJson(raw));
+      storePlayerIndexEntries(data.players);
+    })
+    .catch(err => {
+      console.error('Failed to refresh ESPN player index', err);
+    })
+    .finally(() => {
+      pending.forEach(id => playerIndexRefreshes.delete(id));
+    });
+}
+
+router.get('/players', async (req, res) => {
+  const ids = parseIdList(req.query.ids);
+  if (!ids.length) {
+    res.status(400).json({ error: 'Expected one or more numeric ids in the ids query parameter' });
+    return;
+  }
+  if (ids.length > PLAYER_BATCH_LIMIT) {
+    res.status(400).json({ error: `At most ${PLAYER_BATCH_LIMIT} ids can be requested at once` });
+    return;
+  }
+  const forceRefresh =
+    req.query.force === 'true' || req.query.force === '1' || req.query.force === 'refresh';
+  const players = {};
+  const missing = [];
+  ids.forEach(id => {
+    const cached = forceRefresh ? null : playerIndexCache.get(id);
+    if (cached) {
+      players[id] = cached === PLAYER_MISSING ? null : cached;
+    } else {
+      missing.push(id);
+    }
+  });
+  try {
+    if (missing.length) {
+      const script = path.join(process.cwd(), 'py/espn_players.py');
+      const args = forceRefresh ? [...missing, '--refresh'] : missing;
+      const raw = await runPy(script, args, { priority: PY_PRIORITY.player });
+      const data = takeDiagnostics('players', parsePyJson(raw));
+      const found = data.players || {};
+      missing.forEach(id => {
+        players[id] = found[id] ?? null;
+      });
+      storePlayerIndexEntries(Object.fromEntries(missing.map(id => [id, players[id]])));
+      const stale = Array.isArray(data.meta?.stale) ? data.meta.stale.map(String) : [];
+      if (stale.length) {
+        refreshPlayerIndexInBackground(stale);
+      }
+    }
+    res.json({ players });
+  } catch (err) {
+    console.error('Failed to fetch ESPN players', err);
+    res.status(pyErrorStatus(err)).json({ error: 'Failed to fetch players from PyESPN' });
   }
 });
 
@@ -168,18 +893,34 @@ router.get('/player/:playerId', async (req, res) => {
       }
     }
     const script = path.join(process.cwd(), 'py/espn_player.py');
-    const raw = await runPy(script, [playerId]);
-    const data = JSON.parse(raw || '{}');
-    playerCache.set(cacheKey, data);
+    const raw = await runPy(script, [playerId], { priority: PY_PRIORITY.player });
+    const data = takeDiagnostics('player', parsePyJson(raw));
+    playerCache.set(cacheKey, data, { size: raw.length });
     res.json(data);
   } catch (err) {
     console.error('Failed to fetch ESPN player info', err);
-    res.status(500).json({ error: 'Failed to fetch player from PyESPN' });
+    res.status(pyErrorStatus(err)).json({ error: 'Failed to fetch player from PyESPN' });
   }
 });
 
 app.use('/api/espn', router);
 
-app.listen(PORT, () => {
-  console.log(`ESPN API server running on port ${PORT}`);
+app.get('/metrics', (req, res) => {
+  res.set('Content-Type', 'text/plain; version=0.0.4; charset=utf-8');
+  res.send(metrics.render([collectGauges]));
 });
+
+// Required as a module (by the cache and queue tests) the server doesn't listen or warm anything.
+if (require.main === module) {
+  app.listen(PORT, () => {
+    console.log(`ESPN API server running on port ${PORT}`);
+    if (SCHEDULE_WARMER_ENABLED) {
+      startScheduleWarmer();
+    }
+    if (PLAYER_INDEX_BUILD_ENABLED) {
+      startPlayerIndexBuilder();
+    }
+  });
+}
+
+module.exports = { createCache, runPy, pyErrorStatus, PythonQueueFullError, PY_PRIORITY, metrics };
@@ -1,5 +1,7 @@
-import argparse, os, time, urllib.parse, requests
-from bs4 import BeautifulSoup
+import argparse, json, os, re, threading, time, urllib.parse, requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html import unescape
+from requests.adapters import HTTPAdapter
 
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36",
@@ -8,62 +10,191 @@ DEFAULT_HEADERS = {
     "Referer": "https://gridiron-uniforms.com/",
 }
 
-def discover(year, category, size, team_filter):
-    url = f"https://gridiron-uniforms.com/fields/controller/controller.php?action=view-year-all&year={year}"
-    r = requests.get(url, headers=DEFAULT_HEADERS, timeout=30)
+YEAR_PAGE = "https://gridiron-uniforms.com/fields/controller/controller.php?action=view-year-all&year={year}"
+INDEX_MAX_AGE = 24 * 3600  # the current season's page still gains fields; older years are final
+HREF_RE = re.compile(r"""<a\b[^>]*?\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+
+def parse_year_page(html):
+    """Extracts every field image on a year page as {category, team, size, url} records."""
+    out = set()
+    for m in HREF_RE.finditer(html):
+        href = unescape(m.group(1) or m.group(2) or m.group(3) or "")
+        if "action=view-single-field" not in href or "image_path=" not in href:
+            continue
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
+        path = urllib.parse.unquote(params.get("image_path", [""])[0])
+        if not path:
+            continue
+        if path.startswith("http://"):
+            path = "https://" + path.split("://", 1)[1]
+        if path.startswith("/"):
+            path = "https://gridiron-uniforms.com" + path
+        segs = urllib.parse.urlparse(path).path.split("/")
+        if len(segs) < 7:
+            continue
+        out.add((segs[3], segs[4], segs[5], path))
+    return [{"category": c, "team": t, "size": sz, "url": u} for c, t, sz, u in sorted(out)]
+
+def load_index(year, index_dir, refresh=False, session=None, limiter=None):
+    """Returns the discovery index for a year, fetching the year page only when the stored index is missing or stale."""
+    fp = os.path.join(index_dir, f"{year}.json")
+    if not refresh and os.path.exists(fp):
+        age = time.time() - os.path.getmtime(fp)
+        if int(year) < time.localtime().tm_year or age < INDEX_MAX_AGE:
+            try:
+                with open(fp, encoding="utf-8") as f:
+                    return json.load(f)["fields"]
+            except (OSError, ValueError, KeyError):
+                pass
+    url = YEAR_PAGE.format(year=year)
+    if limiter:
+        limiter.wait(url)
+    r = (session or requests).get(url, headers=DEFAULT_HEADERS, timeout=30)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
-    out = []
-    for a in soup.find_all("a", href=True):
-        if "action=view-single-field" in a["href"] and "image_path=" in a["href"]:
-            q = urllib.parse.urlparse(a["href"]).query
-            params = urllib.parse.parse_qs(q)
-            path = urllib.parse.unquote(params.get("image_path", [""])[0])
-            if not path:
-                continue
-            if path.startswith("http://"):
-                path = "https://" + path.split("://", 1)[1]
-            if path.startswith("/"):
-                path = "https://gridiron-uniforms.com" + path
-            parts = urllib.parse.urlparse(path)
-            segs = parts.path.split("/")
-            if len(segs) < 7:
-                continue
-            cat = segs[3]
-            team = segs[4]
-            sz = segs[5]
-            if cat != category or sz != size:
-                continue
-            if team_filter and team not in team_filter:
-                continue
-            out.append((team, path))
+    fields = parse_year_page(r.text)
+    os.makedirs(index_dir, exist_ok=True)
+    with open(fp + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"year": str(year), "fetched": int(time.time()), "fields": fields}, f, indent=1)
+    os.replace(fp + ".tmp", fp)
+    return fields
+
+def discover(fields, category, size, team_filter):
+    """Picks the (team, url) pairs of one category and size out of a year's index."""
+    out = [(f["team"], f["url"]) for f in fields
+           if f["category"] == category and f["size"] == size and (not team_filter or f["team"] in team_filter)]
     return sorted(set(out))
 
-def download(items, outdir, delay):
+MANIFEST_NAME = ".manifest.json"
+
+class HostRateLimiter:
+    """Spaces request starts to each host at least `interval` seconds apart, across all workers."""
+    def __init__(self, interval):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_slot = {}
+
+    def wait(self, url):
+        host = urllib.parse.urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def make_session(workers):
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(workers, 1))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def load_manifest(outdir):
+    try:
+        with open(os.path.join(outdir, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(outdir, manifest):
+    fp = os.path.join(outdir, MANIFEST_NAME)
+    with open(fp + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+    os.replace(fp + ".tmp", fp)
+
+def fetch_one(session, limiter, url, fp, entry, revalidate):
+    """Downloads url to fp via a temp file. Returns the new manifest entry, or the old one if unchanged."""
+    complete = entry and entry.get("url") == url and os.path.exists(fp) and os.path.getsize(fp) == entry.get("size")
+    if complete and not revalidate:
+        return entry, "skipped"
+    headers = {}
+    if complete and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if complete and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    limiter.wait(url)
+    with session.get(url, headers=headers, stream=True, timeout=60) as r:
+        if r.status_code == 304:
+            return entry, "skipped"
+        if r.status_code != 200:
+            return None, f"http {r.status_code}"
+        tmp = fp + ".part"
+        size = 0
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in r.iter_content(1 << 16):
+                    if chunk:
+                        f.write(chunk)
+                        size += len(chunk)
+            expected = r.headers.get("Content-Length")
+            if expected and int(expected) != size and not r.headers.get("Content-Encoding"):
+                raise IOError(f"short read {size}/{expected} bytes")
+            os.replace(tmp, fp)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return {"url": url, "size": size, "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified")}, "downloaded"
+
+def download(items, outdir, session, limiter, workers=4, revalidate=False):
+    """Downloads items concurrently, resuming from the manifest in outdir. Returns counts per outcome."""
     os.makedirs(outdir, exist_ok=True)
+    manifest = load_manifest(outdir)
+    lock = threading.Lock()
+    counts = {"downloaded": 0, "skipped": 0, "failed": 0}
+    jobs = {}
     for team, url in items:
         fname = url.rsplit("/", 1)[-1]
         ddir = os.path.join(outdir, team)
         os.makedirs(ddir, exist_ok=True)
-        fp = os.path.join(ddir, fname)
-        if not os.path.exists(fp):
-            with requests.get(url, headers=DEFAULT_HEADERS, stream=True, timeout=60) as r:
-                if r.status_code == 200:
-                    with open(fp, "wb") as f:
-                        for chunk in r.iter_content(1 << 16):
-                            if chunk:
-                                f.write(chunk)
-            time.sleep(delay)
+        jobs[f"{team}/{fname}"] = (url, os.path.join(ddir, fname))
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        futures = {pool.submit(fetch_one, session, limiter, url, fp, manifest.get(key), revalidate): key
+                   for key, (url, fp) in jobs.items()}
+        try:
+            for fut in as_completed(futures):
+                key = futures[fut]
+                try:
+                    entry, outcome = fut.result()
+                except (requests.RequestException, OSError) as e:
+                    entry, outcome = None, str(e)
+                with lock:
+                    if entry:
+                        manifest[key] = entry
+                    if outcome in counts:
+                        counts[outcome] += 1
+                    else:
+                        counts["failed"] += 1
+                        print(f"failed {jobs[key][0]}: {outcome}")
+        finally:
+            save_manifest(outdir, manifest)
+    return counts
 
 if __name__ == "__main__":
     p = argparse.ArgumentParser()
-    p.add_argument("--year", required=True)
-    p.add_argument("--category", default="regular-season")
-    p.add_argument("--size", default="r1024")
+    p.add_argument("--year", required=True, action="append", help="repeat for several years")
+    p.add_argument("--category", action="append", help="repeat for several categories (default regular-season)")
+    p.add_argument("--size", action="append", help="repeat for several sizes (default r1024)")
     p.add_argument("--team", action="append")
     p.add_argument("--out", default="gud_fields")
-    p.add_argument("--delay", type=float, default=0.3)
+    p.add_argument("--index-dir", help="where year discovery indexes are kept (default OUT/.index)")
+    p.add_argument("--refresh", action="store_true", help="refetch the year pages instead of using stored indexes")
+    p.add_argument("--delay", type=float, default=0.3, help="minimum seconds between requests to the same host")
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--revalidate", action="store_true", help="re-check files already in the manifest with conditional requests")
     args = p.parse_args()
-    items = discover(args.year, args.category, args.size, set(args.team) if args.team else None)
-    download(items, os.path.join(args.out, f"{args.category}_{args.year}_{args.size}"), args.delay)
-    print(f"downloaded {len(items)} files")
+    index_dir = args.index_dir or os.path.join(args.out, ".index")
+    teams = set(args.team) if args.team else None
+    # one session and limiter for the year pages and the images, so every request is pooled and spaced
+    limiter = HostRateLimiter(args.delay)
+    with make_session(args.workers) as session:
+        for year in args.year:
+            fields = load_index(year, index_dir, args.refresh, session, limiter)
+            for category in args.category or ["regular-season"]:
+                for size in args.size or ["r1024"]:
+                    items = discover(fields, category, size, teams)
+                    counts = download(items, os.path.join(args.out, f"{category}_{year}_{size}"), session, limiter,
+                                      workers=args.workers, revalidate=args.revalidate)
+                    print(f"{category}_{year}_{size}: downloaded {counts['downloaded']} files, "
+                          f"{counts['skipped']} unchanged, {counts['failed']} failed")
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from collections import deque
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 import numpy as np
 from PIL import Image
@@ -28,161 +32,127 @@ TOP_PADDING = 5
 BOTTOM_PADDING = 5
 SEARCH_MARGIN = 180
 
+MANIFEST_PATH = OUTPUT_ROOT / ".split_manifest.json"
 
-def _grey_ratio(row: np.ndarray) -> float:
-    colors = row[:, :3]
-    diff = np.abs(colors - np.array(GREY_RGB))
-    mask = np.all(diff <= GREY_TOLERANCE, axis=1)
-    return float(mask.mean())
+
+def _white_mask(rgb: np.ndarray) -> np.ndarray:
+    return np.all(rgb >= WHITE_THRESHOLD, axis=-1)
+
+
+def _outline_mask(rgb: np.ndarray) -> np.ndarray:
+    diff = np.abs(rgb.astype(np.int16) - np.array(GREY_RGB, dtype=np.int16))
+    return np.all(diff <= GREY_TOLERANCE, axis=-1)
+
+
+def _column_counts(mask: np.ndarray) -> np.ndarray:
+    """Prefix sums along each row so any column span can be counted in O(1)."""
+    counts = np.zeros((mask.shape[0], mask.shape[1] + 1), dtype=np.int32)
+    np.cumsum(mask, axis=1, out=counts[:, 1:])
+    return counts
+
+
+def find_vertical_bounds_many(image_array: np.ndarray, boxes: Sequence[Tuple[int, int, int, int]]) -> List[Tuple[int, int]]:
+    """Adjust the vertical slice of several crops at once so grey jersey borders are preserved.
+
+    The white and grey masks are computed once for the rows every box can search, then
+    each box reads its per-row background flags and grey ratios from column prefix sums.
+    """
+    height, width = image_array.shape[:2]
+    clamped = [(max(0, x0), max(0, y0), min(width, x1), min(height, y1)) for x0, y0, x1, y1 in boxes]
+    if not clamped:
+        return []
+
+    band_start = max(0, min(y0 for _, y0, _, _ in clamped) - SEARCH_MARGIN)
+    band_stop = min(height, max(y1 for _, _, _, y1 in clamped) + SEARCH_MARGIN)
+    band = image_array[band_start:band_stop, :, :3]
+    not_white = _column_counts(~_white_mask(band))
+    grey = _column_counts(_outline_mask(band))
+
+    bounds = []
+    for x0, y0, x1, y1 in clamped:
+        span = max(0, x1 - x0)
+        background = (not_white[:, x1] - not_white[:, x0]) == 0 if span else np.ones(band.shape[0], dtype=bool)
+        grey_ratio = (grey[:, x1] - grey[:, x0]) / span if span else np.zeros(band.shape[0])
+
+        # Top border: scan upward from the starting guess, skipping white rows
+        top_limit = max(0, y0 - SEARCH_MARGIN)
+        rows = np.arange(y0, top_limit - 1, -1)
+        content = rows[~background[rows - band_start]]
+        bordered = content[grey_ratio[content - band_start] >= GREY_RATIO_THRESHOLD]
+        if bordered.size:
+            top = max(0, int(bordered[0]) - TOP_PADDING)
+        else:
+            top = max(0, (int(content[-1]) if content.size else y0) - TOP_PADDING)
+
+        # Bottom border: the first non-white row at or below the starting guess
+        bottom_limit = min(height, y1 + SEARCH_MARGIN)
+        rows = np.arange(y1 - 1, bottom_limit)
+        content = rows[~background[rows - band_start]]
+        bottom = min(height, int(content[0]) + 1 + BOTTOM_PADDING) if content.size else y1
+
+        bounds.append((y0, y1) if bottom <= top else (top, bottom))
+
+    return bounds
 
 
 def find_vertical_bounds(image_array: np.ndarray, x0: int, y0: int, x1: int, y1: int) -> Tuple[int, int]:
     """Dynamically adjust vertical slice so grey jersey borders are preserved."""
-    height = image_array.shape[0]
-    x0 = max(0, x0)
-    y0 = max(0, y0)
-    x1 = min(image_array.shape[1], x1)
-    y1 = min(height, y1)
-
-    def row_is_background(y: int) -> bool:
-        row = image_array[y, x0:x1, :3]
-        return np.all(row >= WHITE_THRESHOLD)
-
-    # Locate top border (scan upward from the starting guess)
-    top = y0
-    top_limit = max(0, y0 - SEARCH_MARGIN)
-    fallback_top = top
-    for y in range(y0, top_limit - 1, -1):
-        ratio = _grey_ratio(image_array[y, x0:x1])
-        if row_is_background(y):
-            continue
-        fallback_top = y
-        if ratio >= GREY_RATIO_THRESHOLD:
-            top = max(0, y - TOP_PADDING)
-            break
-    else:
-        top = max(0, fallback_top - TOP_PADDING)
-
-    # Locate bottom border
-    bottom = y1
-    bottom_limit = min(height, y1 + SEARCH_MARGIN)
-    for y in range(y1 - 1, bottom_limit):
-        if y >= height:
-            break
-        ratio = _grey_ratio(image_array[y, x0:x1])
-        if row_is_background(y):
-            continue
-        bottom = min(height, y + 1 + BOTTOM_PADDING)
-        if ratio >= GREY_RATIO_THRESHOLD:
-            break
-        break
-
-    if bottom <= top:
-        return y0, y1
-
-    return top, bottom
+    return find_vertical_bounds_many(image_array, [(x0, y0, x1, y1)])[0]
+
+
+def _spread_along_rows(reached: np.ndarray, passable: np.ndarray) -> np.ndarray:
+    """Mark every horizontal run of passable pixels that already contains a reached pixel."""
+    starts = passable.copy()
+    starts[:, 1:] &= ~passable[:, :-1]
+    run_ids = np.cumsum(starts.ravel()).reshape(passable.shape)
+    hit = np.zeros(int(run_ids[-1, -1]) + 1, dtype=bool)
+    hit[run_ids[reached & passable]] = True
+    return passable & hit[run_ids]
+
+
+def _border_connected(passable: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+    """Connected components of `passable` (4-connectivity) that touch a seed pixel.
+
+    Reached runs are grown alternately along rows and columns until nothing changes,
+    which yields exactly the set a breadth-first flood fill from the seeds visits.
+    """
+    reached = seeds & passable
+    passable_t = np.ascontiguousarray(passable.T)
+    while True:
+        grown = _spread_along_rows(reached, passable)
+        grown = _spread_along_rows(np.ascontiguousarray(grown.T), passable_t).T
+        if np.array_equal(grown, reached):
+            return reached
+        reached = grown
+
+
+def background_mask(rgb: np.ndarray) -> np.ndarray:
+    """Boolean mask of the white backdrop reachable from the image borders without crossing grey outlines."""
+    height, width = rgb.shape[:2]
+    white = _white_mask(rgb)
+    outline = _outline_mask(rgb)
+
+    # Border pixels only seed the fill when no outline sits within OUTLINE_SEARCH_DEPTH of that edge
+    depth_rows = min(OUTLINE_SEARCH_DEPTH, height)
+    depth_cols = min(OUTLINE_SEARCH_DEPTH, width)
+    seeds = np.zeros_like(white)
+    seeds[0, :] |= ~outline[:depth_rows, :].any(axis=0)
+    seeds[-1, :] |= ~outline[height - depth_rows:, :].any(axis=0)
+    seeds[:, 0] |= ~outline[:, :depth_cols].any(axis=1)
+    seeds[:, -1] |= ~outline[:, width - depth_cols:].any(axis=1)
+
+    return _border_connected(white & ~outline, seeds)
 
 
 def remove_white_background(image: Image.Image) -> Image.Image:
     """Flood-fill from the borders and erase only the white backdrop, stopping at grey outlines."""
-    rgba = image.convert("RGBA")
-    pixels = rgba.load()
-    width, height = rgba.size
-
-    def is_candidate(x: int, y: int) -> bool:
-        r, g, b, _ = pixels[x, y]
-        return r >= WHITE_THRESHOLD and g >= WHITE_THRESHOLD and b >= WHITE_THRESHOLD
-
-    def is_outline(x: int, y: int) -> bool:
-        r, g, b, _ = pixels[x, y]
-        return all(abs(component - anchor) <= GREY_TOLERANCE for component, anchor in zip((r, g, b), GREY_RGB))
-
-    visited = [[False] * height for _ in range(width)]
-    queue: deque[Tuple[int, int]] = deque()
-
-    top_outline = [False] * width
-    bottom_outline = [False] * width
-    left_outline = [False] * height
-    right_outline = [False] * height
-
-    max_top_depth = min(OUTLINE_SEARCH_DEPTH, height)
-    max_side_depth = min(OUTLINE_SEARCH_DEPTH, width)
-
-    for x in range(width):
-        for dy in range(max_top_depth):
-            if is_outline(x, dy):
-                top_outline[x] = True
-                break
-    for x in range(width):
-        for dy in range(max_top_depth):
-            y = height - 1 - dy
-            if is_outline(x, y):
-                bottom_outline[x] = True
-                break
-    for y in range(height):
-        for dx in range(max_side_depth):
-            if is_outline(dx, y):
-                left_outline[y] = True
-                break
-    for y in range(height):
-        for dx in range(max_side_depth):
-            x = width - 1 - dx
-            if is_outline(x, y):
-                right_outline[y] = True
-                break
-
-    for x in range(width):
-        if top_outline[x]:
-            continue
-        y = 0
-        if is_candidate(x, y) and not visited[x][y]:
-            visited[x][y] = True
-            queue.append((x, y))
-
-    y = height - 1
-    for x in range(width):
-        if bottom_outline[x]:
-            continue
-        if is_candidate(x, y) and not visited[x][y]:
-            visited[x][y] = True
-            queue.append((x, y))
-
-    for y in range(height):
-        if left_outline[y]:
-            continue
-        x = 0
-        if is_candidate(x, y) and not visited[x][y]:
-            visited[x][y] = True
-            queue.append((x, y))
-
-    x = width - 1
-    for y in range(height):
-        if right_outline[y]:
-            continue
-        if is_candidate(x, y) and not visited[x][y]:
-            visited[x][y] = True
-            queue.append((x, y))
-
-    # Flood fill through connected background pixels until outlines are reached
-    while queue:
-        x, y = queue.popleft()
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < width and 0 <= ny < height:
-                if not visited[nx][ny] and is_candidate(nx, ny) and not is_outline(nx, ny):
-                    visited[nx][ny] = True
-                    queue.append((nx, ny))
-
-    for x in range(width):
-        for y in range(height):
-            if visited[x][y]:
-                r, g, b, _ = pixels[x, y]
-                pixels[x, y] = (r, g, b, 0)
-
-    return rgba
+    data = np.array(image.convert("RGBA"))
+    if data.size:
+        data[background_mask(data[..., :3]), 3] = 0
+    return Image.fromarray(data, "RGBA")
 
 
-def split_uniform(uniform_path: Path) -> None:
+def _output_dir(uniform_path: Path) -> Path:
     relative_parts = uniform_path.relative_to(SOURCE_ROOT)
     if len(relative_parts.parts) < 3:
         raise ValueError(f"Unexpected uniform path structure: {uniform_path}")
@@ -190,23 +160,86 @@ def split_uniform(uniform_path: Path) -> None:
     season = relative_parts.parts[0]
     team = relative_parts.parts[1]
     style = uniform_path.stem  # e.g. "A"
+    return OUTPUT_ROOT / season / team / style
 
-    output_dir = OUTPUT_ROOT / season / team / style
+
+def _output_paths(uniform_path: Path) -> List[Path]:
+    output_dir = _output_dir(uniform_path)
+    return [output_dir / f"{uniform_path.stem}_{label}.png" for label, _ in BOUNDING_BOXES]
+
+
+def split_uniform(uniform_path: Path) -> None:
+    output_dir = _output_dir(uniform_path)
     output_dir.mkdir(parents=True, exist_ok=True)
+    style = uniform_path.stem
 
     with Image.open(uniform_path).convert("RGBA") as image:
         image_array = np.array(image)
+        jersey_boxes = [box for label, box in BOUNDING_BOXES if "jersey" in label]
+        jersey_bounds = dict(zip(jersey_boxes, find_vertical_bounds_many(image_array, jersey_boxes)))
         for label, box in BOUNDING_BOXES:
             x0, y0, x1, y1 = box
             if "jersey" in label:
-                y0, y1 = find_vertical_bounds(image_array, x0, y0, x1, y1)
+                y0, y1 = jersey_bounds[box]
             cropped = image.crop((x0, y0, x1, y1))
             destination = output_dir / f"{style}_{label}.png"
             processed = remove_white_background(cropped)
             processed.save(destination)
 
 
+def processing_parameters() -> Dict[str, object]:
+    """Every setting that affects the output; a change to any of them invalidates the manifest."""
+    return {
+        "bounding_boxes": [[label, list(box)] for label, box in BOUNDING_BOXES],
+        "white_threshold": WHITE_THRESHOLD,
+        "grey_rgb": list(GREY_RGB),
+        "grey_tolerance": GREY_TOLERANCE,
+        "outline_search_depth": OUTLINE_SEARCH_DEPTH,
+        "grey_ratio_threshold": GREY_RATIO_THRESHOLD,
+        "top_padding": TOP_PADDING,
+        "bottom_padding": BOTTOM_PADDING,
+        "search_margin": SEARCH_MARGIN,
+    }
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Dict[str, object]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"parameters": None, "sources": {}}
+    if manifest.get("parameters") != processing_parameters():
+        # Different boxes or thresholds: every output is stale
+        return {"parameters": None, "sources": {}}
+    return manifest
+
+
+def save_manifest(sources: Dict[str, str], path: Path = MANIFEST_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    payload = {"parameters": processing_parameters(), "sources": dict(sorted(sources.items()))}
+    temp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Split uniform sheets into helmet and jersey parts.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="reprocess every uniform, ignoring the manifest")
+    return parser.parse_args()
+
+
 def main() -> None:
+    args = parse_args()
     if not SOURCE_ROOT.exists():
         raise SystemExit(f"Source directory not found: {SOURCE_ROOT}")
 
@@ -214,10 +247,40 @@ def main() -> None:
     if not png_files:
         raise SystemExit(f"No uniform PNG files found under {SOURCE_ROOT}")
 
+    manifest = {"parameters": None, "sources": {}} if args.force else load_manifest()
+    known: Dict[str, str] = manifest["sources"]
+    sources: Dict[str, str] = {}
+    pending: Dict[str, Path] = {}
+    digests: Dict[str, str] = {}
     for uniform_path in png_files:
-        split_uniform(uniform_path)
-
-    print(f"Processed {len(png_files)} uniform images into {OUTPUT_ROOT}")
+        key = uniform_path.relative_to(SOURCE_ROOT).as_posix()
+        digest = file_digest(uniform_path)
+        if known.get(key) == digest and all(path.exists() for path in _output_paths(uniform_path)):
+            sources[key] = digest
+        else:
+            pending[key] = uniform_path
+            digests[key] = digest
+
+    failures = 0
+    if pending:
+        workers = max(1, min(args.workers, len(pending)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(split_uniform, uniform_path): key for key, uniform_path in pending.items()}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:  # keep going; the file stays out of the manifest and is retried next run
+                    failures += 1
+                    print(f"Failed to split {pending[key]}: {exc}")
+                    continue
+                sources[key] = digests[key]
+
+    save_manifest(sources)
+    skipped = len(png_files) - len(pending)
+    print(f"Processed {len(pending) - failures} uniform images into {OUTPUT_ROOT} ({skipped} unchanged, skipped)")
+    if failures:
+        raise SystemExit(f"{failures} uniform images failed to split")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+import contextlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows, where updates go unlocked
+    fcntl = None
+
+# File layout: MAGIC, the offset and length of the index as little-endian uint64s, the blobs
+# back to back, then the index as JSON: {"meta": {...}, "entries": {key: [offset, length, info]}}.
+# Readers map the file and parse only the index, so serving one entry costs the size of that
+# entry rather than the size of the file.
+MAGIC = b"ESPNBLB1"
+_HEADER = struct.Struct("<8sQQ")
+
+_STORES: Dict[Path, "BlobStore"] = {}
+
+
+def _file_identity(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class BlobStore:
+    """Read-only view of a blob file; entries are memoryview slices of the mapped file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.meta: Dict[str, Any] = {}
+        self.entries: Dict[str, Any] = {}
+        self.identity = None
+        self._map: Optional[mmap.mmap] = None
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("rb") as handle:
+                stat = os.fstat(handle.fileno())
+                if stat.st_size < _HEADER.size:
+                    return
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        magic, index_offset, index_length = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or index_offset + index_length > len(mapped):
+            mapped.close()
+            return
+        try:
+            index = json.loads(mapped[index_offset:index_offset + index_length])
+        except ValueError:
+            mapped.close()
+            return
+        self._map = mapped
+        self.meta = index.get("meta") or {}
+        self.entries = index.get("entries") or {}
+        self.identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def keys(self) -> Iterable[str]:
+        return list(self.entries)
+
+    def get(self, key: str) -> Optional[memoryview]:
+        entry = self.entries.get(key)
+        if entry is None or self._map is None:
+            return None
+        offset, length = entry[0], entry[1]
+        return memoryview(self._map)[offset:offset + length]
+
+    def info(self, key: str) -> Any:
+        entry = self.entries.get(key)
+        return entry[2] if entry is not None and len(entry) > 2 else None
+
+
+def open_store(path: Path) -> BlobStore:
+    """Return the store for path, re-mapping it only when the file was replaced."""
+    path = Path(path)
+    store = _STORES.get(path)
+    if store is None or store.identity != _file_identity(path):
+        store = BlobStore(path)
+        _STORES[path] = store
+    return store
+
+
+def write_store(path: Path, blobs: Dict[str, Tuple[Any, Any]], meta: Optional[Dict[str, Any]] = None,
+                read_only: bool = False) -> None:
+    """Atomically replace path with the given {key: (bytes, info)} blobs."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp")
+    entries: Dict[str, Any] = {}
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, 0, 0))
+        offset = _HEADER.size
+        for key, (data, info) in blobs.items():
+            handle.write(data)
+            entries[key] = [offset, len(data), info]
+            offset += len(data)
+        index = json.dumps({"meta": meta or {}, "entries": entries}, separators=(",", ":")).encode("utf-8")
+        handle.write(index)
+        handle.seek(0)
+        handle.write(_HEADER.pack(MAGIC, offset, len(index)))
+    if read_only:
+        os.chmod(temp_path, 0o444)
+    os.replace(temp_path, path)
+    _STORES.pop(path, None)
+
+
+@contextlib.contextmanager
+def locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on path's sidecar lock file, so writers of path take turns."""
+    path = Path(path)
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def update_store(path: Path, updates: Dict[str, Tuple[Any, Any]],
+                 keep: Optional[Callable[[str, Any], bool]] = None) -> None:
+    """Rewrite path with updates applied, copying the other entries' bytes without decoding them.
+
+    Entries for which keep(key, info) is false are dropped along the way. The read and the
+    rewrite happen under locked(path), so concurrent writers don't drop each other's entries.
+    """
+    with locked(path):
+        store = open_store(path)
+        blobs: Dict[str, Tuple[Any, Any]] = {}
+        for key in store.keys():
+            if key in updates or (keep is not None and not keep(key, store.info(key))):
+                continue
+            blobs[key] = (store.get(key), store.info(key))
+        blobs.update(updates)
+        write_store(path, blobs, store.meta)
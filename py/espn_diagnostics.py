@@ -0,0 +1,75 @@
+import importlib
+import importlib.util
+import os
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+DIAGNOSTICS_FLAG = "--diagnostics"
+_TRUTHY = {"1", "true", "yes", "on"}
+
+_TRACK_OPERATION = None
+_RECORD_CACHE_LOOKUP = None
+_DEPENDENCIES_CHECKED = False
+
+
+def diagnostics_requested(argv=None) -> bool:
+    argv = sys.argv if argv is None else argv
+    if DIAGNOSTICS_FLAG in argv:
+        return True
+    return os.environ.get("PYESPN_DIAGNOSTICS", "").lower() in _TRUTHY
+
+
+def strip_flag(argv):
+    return [arg for arg in argv if arg != DIAGNOSTICS_FLAG]
+
+
+def _hydrate_dependencies():
+    global _TRACK_OPERATION, _RECORD_CACHE_LOOKUP, _DEPENDENCIES_CHECKED
+    if _DEPENDENCIES_CHECKED:
+        return
+    try:
+        utilities_spec = importlib.util.find_spec("pyespn.utilities")
+    except ModuleNotFoundError:
+        utilities_spec = None
+    if utilities_spec is not None:
+        utilities_module = importlib.import_module("pyespn.utilities")
+        _TRACK_OPERATION = getattr(utilities_module, "track_operation", None)
+        _RECORD_CACHE_LOOKUP = getattr(utilities_module, "record_cache_lookup", None)
+    _DEPENDENCIES_CHECKED = True
+
+
+@contextmanager
+def track(operation: str, enabled: Optional[bool] = None):
+    """Collect pyespn fetch diagnostics for the block; yields None when unavailable or not requested."""
+    if enabled is None:
+        enabled = diagnostics_requested()
+    if enabled:
+        _hydrate_dependencies()
+    if not enabled or _TRACK_OPERATION is None:
+        yield None
+        return
+    with _TRACK_OPERATION(operation) as collector:
+        yield collector
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    _hydrate_dependencies()
+    if _RECORD_CACHE_LOOKUP is not None:
+        _RECORD_CACHE_LOOKUP(cache=cache, hit=hit)
+
+
+def attach(payload: Any, collector) -> Any:
+    """Add the collector's summary under payload["meta"]["diagnostics"]."""
+    if collector is None or not isinstance(payload, dict):
+        return payload
+    meta = payload.get("meta")
+    if meta is None and "meta" in payload:
+        # an explicit null meta is part of the response shape; leave it alone
+        return payload
+    if not isinstance(meta, dict):
+        meta = {}
+        payload["meta"] = meta
+    summary: Dict[str, Any] = collector.to_dict()
+    meta["diagnostics"] = summary
+    return payload
@@ -1,24 +1,32 @@
-import json
 import sys
 from pyespn import PYESPN
 
+import espn_diagnostics
+import espn_json
 
-def main():
-    if len(sys.argv) < 2:
-        print("{}")
-        return
+
+def build_response(argv):
+    if len(argv) < 2:
+        return {}
     try:
-        event_id = int(sys.argv[1])
+        event_id = int(argv[1])
     except ValueError:
-        print("{}")
-        return
+        return {}
     espn = PYESPN('nfl')
     event = espn.get_game_info(event_id=event_id)
     try:
         payload = event.to_dict(load_play_by_play=False)
     except TypeError:
         payload = event.to_dict()
-    print(json.dumps(payload, ensure_ascii=False))
+    return payload
+
+
+def main():
+    argv = espn_diagnostics.strip_flag(sys.argv)
+    with espn_diagnostics.track("game") as diagnostics:
+        payload = build_response(argv)
+    espn_diagnostics.attach(payload, diagnostics)
+    espn_json.emit(payload)
 
 
 if __name__ == "__main__":
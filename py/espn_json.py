@@ -0,0 +1,58 @@
+import importlib
+import importlib.util
+import json
+import sys
+from typing import Any
+
+_SERIALIZER = None
+_DEPENDENCIES_CHECKED = False
+
+
+class _StdlibSerializer:
+    name = "json"
+
+    def loads(self, data: Any) -> Any:
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(self, payload: Any) -> bytes:
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _serializer():
+    """pyespn's active serializer (orjson when installed), or the standard library on older pyespn."""
+    global _SERIALIZER, _DEPENDENCIES_CHECKED
+    if not _DEPENDENCIES_CHECKED:
+        try:
+            serialization_spec = importlib.util.find_spec("pyespn.utilities.serialization")
+        except ModuleNotFoundError:
+            serialization_spec = None
+        if serialization_spec is not None:
+            serialization_module = importlib.import_module("pyespn.utilities.serialization")
+            get_serializer = getattr(serialization_module, "get_serializer", None)
+            _SERIALIZER = get_serializer() if get_serializer is not None else None
+        _DEPENDENCIES_CHECKED = True
+    if _SERIALIZER is None:
+        _SERIALIZER = _StdlibSerializer()
+    return _SERIALIZER
+
+
+def loads(data: Any) -> Any:
+    return _serializer().loads(data)
+
+
+def dumps(payload: Any) -> bytes:
+    return _serializer().dumps(payload)
+
+
+def emit_raw(data: Any) -> None:
+    """Write an already encoded document to stdout as one line, without decoding it."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
+def emit(payload: Any) -> None:
+    emit_raw(dumps(payload))
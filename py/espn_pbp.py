@@ -1,7 +1,9 @@
-import json
 import sys
 from pyespn import PYESPN
 
+import espn_diagnostics
+import espn_json
+
 
 def _normalize_sequence(items):
     normalized = []
@@ -17,15 +19,13 @@ def _normalize_sequence(items):
     return normalized
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("{}")
-        return
+def build_response(argv):
+    if len(argv) < 2:
+        return {}
     try:
-        event_id = int(sys.argv[1])
+        event_id = int(argv[1])
     except ValueError:
-        print("{}")
-        return
+        return {}
     espn = PYESPN('nfl')
     event = espn.get_game_info(event_id=event_id)
     event.load_play_by_play()
@@ -39,7 +39,15 @@ def main():
         payload["drives"] = _normalize_sequence(drives)
     if plays:
         payload["plays"] = _normalize_sequence(plays)
-    print(json.dumps(payload, ensure_ascii=False))
+    return payload
+
+
+def main():
+    argv = espn_diagnostics.strip_flag(sys.argv)
+    with espn_diagnostics.track("pbp") as diagnostics:
+        payload = build_response(argv)
+    espn_diagnostics.attach(payload, diagnostics)
+    espn_json.emit(payload)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,28 @@
-import json
 import sys
 from pyespn import PYESPN
 
+import espn_diagnostics
+import espn_json
 
-def main():
-    if len(sys.argv) < 2:
-        print("{}")
-        return
+
+def build_response(argv):
+    if len(argv) < 2:
+        return {}
     try:
-        player_id = int(sys.argv[1])
+        player_id = int(argv[1])
     except ValueError:
-        print("{}")
-        return
+        return {}
     espn = PYESPN('nfl')
     player = espn.get_player_info(player_id=player_id)
-    print(json.dumps(player.to_dict(), ensure_ascii=False))
+    return player.to_dict()
+
+
+def main():
+    argv = espn_diagnostics.strip_flag(sys.argv)
+    with espn_diagnostics.track("player") as diagnostics:
+        payload = build_response(argv)
+    espn_diagnostics.attach(payload, diagnostics)
+    espn_json.emit(payload)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,235 @@
+import importlib
+import importlib.util
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from pyespn import PYESPN
+
+import espn_blobstore
+import espn_diagnostics
+import espn_json
+
+INDEX_DIR = Path(os.environ.get("PYESPN_CACHE_DIR", Path(__file__).resolve().parent / ".cache"))
+INDEX_FILE = INDEX_DIR / "espn_player_index.json"
+# entries older than this are still served, but reported as stale so the caller can refresh them
+INDEX_STALE_SECONDS = int(os.environ.get("PYESPN_PLAYER_INDEX_TTL", str(7 * 24 * 60 * 60)))
+_INDEX_DISABLED_ENV = os.environ.get("PYESPN_PLAYER_INDEX_DISABLED", "")
+INDEX_ENABLED = _INDEX_DISABLED_ENV.lower() not in {"1", "true", "yes", "on"}
+if os.environ.get("PYESPN_FAKE_STATE_PATH"):
+    INDEX_ENABLED = False
+
+MAX_FETCH_WORKERS = 8
+TEAM_REF_RE = re.compile(r"/teams/(\d+)")
+
+_TEAMS_BY_ID: Optional[Dict[int, Dict[str, Any]]] = None
+
+
+def _team_mapping() -> Dict[int, Dict[str, Any]]:
+    global _TEAMS_BY_ID
+    if _TEAMS_BY_ID is not None:
+        return _TEAMS_BY_ID
+    _TEAMS_BY_ID = {}
+    try:
+        teams_spec = importlib.util.find_spec("pyespn.data.teams")
+    except ModuleNotFoundError:
+        teams_spec = None
+    if teams_spec is not None:
+        teams_module = importlib.import_module("pyespn.data.teams")
+        for team in getattr(teams_module, "LEAGUE_TEAMS_MAPPING", {}).get("nfl", []):
+            _TEAMS_BY_ID[int(team["team_id"])] = team
+    return _TEAMS_BY_ID
+
+
+def load_index() -> Dict[str, Any]:
+    if not INDEX_ENABLED:
+        return {}
+    try:
+        data = espn_json.loads(INDEX_FILE.read_bytes())
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_index(entries: Dict[str, Any]) -> None:
+    """Merge entries into the index on disk.
+
+    The index is re-read and replaced under a lock on INDEX_FILE, so concurrent runs (a
+    --refresh next to a --build) don't drop each other's work.
+    """
+    if not INDEX_ENABLED or not entries:
+        return
+    temp_path = None
+    try:
+        with espn_blobstore.locked(INDEX_FILE):
+            index = load_index()
+            index.update(entries)
+            fd, temp_path = tempfile.mkstemp(dir=INDEX_DIR, prefix=".players-", suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(espn_json.dumps(index))
+            os.replace(temp_path, INDEX_FILE)
+            temp_path = None
+    except OSError as exc:
+        print(f"Failed to save the player index: {exc}", file=sys.stderr)
+    finally:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+def _team_summary(team: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(team, dict):
+        return None
+    if team.get("abbreviation") or team.get("displayName"):
+        return {
+            "id": str(team.get("id")) if team.get("id") is not None else None,
+            "abbreviation": team.get("abbreviation"),
+            "displayName": team.get("displayName") or team.get("name"),
+        }
+    match = TEAM_REF_RE.search(str(team.get("$ref") or ""))
+    if not match:
+        return None
+    team_id = int(match.group(1))
+    known = _team_mapping().get(team_id)
+    if not known:
+        return {"id": str(team_id), "abbreviation": None, "displayName": None}
+    return {
+        "id": str(team_id),
+        "abbreviation": known.get("team_abbv"),
+        "displayName": f"{known.get('team_city')} {known.get('team_name')}",
+    }
+
+
+def build_entry(raw: Dict[str, Any], team: Any = None) -> Dict[str, Any]:
+    position = raw.get("position")
+    if isinstance(position, dict):
+        position = position.get("abbreviation")
+    headshot = raw.get("headshot")
+    if isinstance(headshot, dict):
+        headshot = headshot.get("href")
+    return {
+        "id": str(raw.get("id")),
+        "fullName": raw.get("fullName"),
+        "displayName": raw.get("displayName") or raw.get("fullName"),
+        "position": position,
+        "jersey": raw.get("jersey"),
+        "headshot": headshot,
+        "team": _team_summary(raw.get("team") if team is None else team),
+        "fetched_at": time.time(),
+    }
+
+
+def fetch_entries(player_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    player_ids = list(player_ids)
+    if not player_ids:
+        return {}
+    espn = PYESPN("nfl", load_teams=False)
+
+    def fetch(player_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            payload = espn.get_player_info(player_id=int(player_id)).to_dict()
+        except Exception as exc:
+            print(f"Failed to load player {player_id}: {exc}", file=sys.stderr)
+            return None
+        if not isinstance(payload, dict) or payload.get("id") is None:
+            return None
+        return build_entry(payload)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(player_ids))) as executor:
+        return dict(zip(player_ids, executor.map(fetch, player_ids)))
+
+
+def build_from_directory() -> Dict[str, Any]:
+    """Seed the index from pyespn's athlete directory, when the installed pyespn has one."""
+    espn = PYESPN("nfl", load_teams=False)
+    load_directory = getattr(espn, "load_athlete_directory", None)
+    if load_directory is None:
+        return {}
+    entries = {}
+    for athlete in load_directory().values():
+        team_id = athlete.get("team_id")
+        entry = build_entry(
+            {
+                "id": athlete.get("id"),
+                "fullName": athlete.get("name"),
+                "position": athlete.get("position"),
+                "jersey": athlete.get("jersey"),
+                "headshot": athlete.get("headshot"),
+            },
+            team={"$ref": f"/teams/{team_id}"} if team_id is not None else None,
+        )
+        entry["fetched_at"] = athlete.get("fetched_at") or entry["fetched_at"]
+        entries[entry["id"]] = entry
+    return entries
+
+
+def _normalize_ids(args: List[str]) -> List[str]:
+    ids: List[str] = []
+    for arg in args:
+        for part in arg.split(","):
+            part = part.strip()
+            if part.isdigit() and part not in ids:
+                ids.append(part)
+    return ids
+
+
+def build_response(argv):
+    refresh = "--refresh" in argv
+    build = "--build" in argv
+    player_ids = _normalize_ids([arg for arg in argv[1:] if not arg.startswith("--")])
+
+    updates: Dict[str, Any] = build_from_directory() if build else {}
+    index = load_index()
+    index.update(updates)
+
+    now = time.time()
+    players: Dict[str, Optional[Dict[str, Any]]] = {}
+    stale: List[str] = []
+    to_fetch: List[str] = []
+    for player_id in player_ids:
+        entry = index.get(player_id)
+        espn_diagnostics.record_cache("player_index", entry is not None and not refresh)
+        if entry is None or refresh:
+            to_fetch.append(player_id)
+            continue
+        players[player_id] = entry
+        if now - float(entry.get("fetched_at") or 0) > INDEX_STALE_SECONDS:
+            stale.append(player_id)
+
+    fetched = fetch_entries(to_fetch)
+    for player_id in to_fetch:
+        entry = fetched.get(player_id)
+        if entry is None and refresh:
+            # keep serving what we had if ESPN fails during a background refresh
+            entry = index.get(player_id)
+        elif entry is not None:
+            updates[player_id] = entry
+        players[player_id] = entry
+
+    save_index(updates)
+    return {
+        "players": players,
+        "meta": {
+            "stale": stale,
+            "missing": [player_id for player_id in player_ids if players.get(player_id) is None],
+        },
+    }
+
+
+def main():
+    argv = espn_diagnostics.strip_flag(sys.argv)
+    with espn_diagnostics.track("players") as diagnostics:
+        payload = build_response(argv)
+    espn_diagnostics.attach(payload, diagnostics)
+    espn_json.emit(payload)
+
+
+if __name__ == "__main__":
+    main()
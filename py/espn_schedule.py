@@ -1,7 +1,6 @@
 import importlib
 import importlib.util
 import inspect
-import json
 import os
 import sys
 import time
@@ -11,6 +10,10 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from pyespn import PYESPN
 
+import espn_blobstore
+import espn_diagnostics
+import espn_json
+
 SEASON_TYPE_ALIASES = {
     "preseason": "pre",
     "pre-season": "pre",
@@ -43,8 +46,23 @@ SEASON_TYPE_LABELS = {
 }
 
 CACHE_DIR = Path(os.environ.get("PYESPN_CACHE_DIR", Path(__file__).resolve().parent / ".cache"))
-CACHE_FILE = CACHE_DIR / "espn_schedule_cache.json"
+CACHE_FILE = CACHE_DIR / "espn_schedule_cache.bin"
+# the JSON cache used before the blob file; its live entries are carried over once, then it is removed
+LEGACY_CACHE_FILE = CACHE_DIR / "espn_schedule_cache.json"
 CACHE_TTL_SECONDS = int(os.environ.get("PYESPN_SCHEDULE_CACHE_TTL", "300"))
+# Weeks are cached by the state of their games: weeks with games still to play are kept until
+# the next kickoff (capped), and weeks with a game in progress get the short live TTL. Finished
+# weeks still carry season meta that moves every week (default week, week lists), so they are
+# capped too; only frozen snapshots never expire. CACHE_TTL_SECONDS covers weeks whose status
+# can't be read.
+LIVE_CACHE_TTL_SECONDS = int(os.environ.get("PYESPN_SCHEDULE_LIVE_TTL", "60"))
+UPCOMING_CACHE_TTL_SECONDS = int(os.environ.get("PYESPN_SCHEDULE_UPCOMING_TTL", str(6 * 60 * 60)))
+FINAL_CACHE_TTL_SECONDS = int(os.environ.get("PYESPN_SCHEDULE_FINAL_TTL", str(60 * 60)))
+# --warm rebuilds weeks that expire within this many seconds; which weeks to warm is re-derived
+# from the season summary at most every WARM_TARGETS_TTL_SECONDS.
+WARM_MARGIN_SECONDS = int(os.environ.get("PYESPN_SCHEDULE_WARM_MARGIN", "120"))
+WARM_TARGETS_TTL_SECONDS = 60 * 60
+MAX_RANGE_SEASONS = 10
 _CACHE_DISABLED_ENV = os.environ.get("PYESPN_SCHEDULE_CACHE_DISABLED", "")
 _CACHE_DISABLED = CACHE_TTL_SECONDS <= 0 or _CACHE_DISABLED_ENV.lower() in {"1", "true", "yes", "on"}
 if os.environ.get("PYESPN_FAKE_STATE_PATH"):
@@ -53,7 +71,12 @@ CACHE_ENABLED = not _CACHE_DISABLED
 if not CACHE_ENABLED:
     CACHE_TTL_SECONDS = 0
 
-_CACHE_STATE: Optional[Dict[str, Any]] = None
+# Completed seasons can be frozen (--freeze) into a read-only snapshot file that is served
+# ahead of the cache and never expires.
+SNAPSHOT_DIR = CACHE_DIR / "snapshots"
+SNAPSHOT_VERSION = 2
+SNAPSHOTS_ENABLED = not os.environ.get("PYESPN_FAKE_STATE_PATH")
+
 
 _SCHEDULE_CLASS = None
 _FETCH_ESPN_DATA = None
@@ -62,52 +85,95 @@ _API_VERSION = None
 _DEPENDENCIES_CHECKED = False
 
 
-def _ensure_cache_loaded() -> Dict[str, Any]:
-    global _CACHE_STATE
+def _migrate_legacy_cache() -> None:
+    """Move the unexpired weeks of the old JSON cache into the blob file and delete it."""
+    with espn_blobstore.locked(CACHE_FILE):
+        try:
+            legacy = espn_json.loads(LEGACY_CACHE_FILE.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            legacy = None
+        updates = {}
+        for key, entry in (legacy.items() if isinstance(legacy, dict) else ()):
+            if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+                continue
+            ts = entry.get("ts")
+            if not isinstance(ts, (int, float)):
+                continue
+            # entries written before expiries were stored lived for the default TTL
+            info = {"ts": ts, "expires": entry["expires"] if "expires" in entry else ts + CACHE_TTL_SECONDS}
+            if _expires_in(info) > 0:
+                updates[key] = (espn_json.dumps(entry["data"]), info)
+        try:
+            if updates:
+                store = espn_blobstore.open_store(CACHE_FILE)
+                # weeks already in the blob file are newer than the legacy copies
+                updates = {key: update for key, update in updates.items() if key not in store}
+                blobs = {key: (store.get(key), store.info(key)) for key in store.keys()}
+                blobs.update(updates)
+                espn_blobstore.write_store(CACHE_FILE, blobs, store.meta)
+            LEGACY_CACHE_FILE.unlink()
+        except OSError:
+            pass
+
+
+def _cache_store() -> Optional[espn_blobstore.BlobStore]:
     if not CACHE_ENABLED:
-        _CACHE_STATE = {}
-        return _CACHE_STATE
-    if _CACHE_STATE is not None:
-        return _CACHE_STATE
-    try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    except Exception:
-        pass
-    try:
-        with CACHE_FILE.open("r", encoding="utf-8") as handle:
-            _CACHE_STATE = json.load(handle)
-    except Exception:
-        _CACHE_STATE = {}
-    return _CACHE_STATE
+        return None
+    if LEGACY_CACHE_FILE.exists():
+        _migrate_legacy_cache()
+    return espn_blobstore.open_store(CACHE_FILE)
 
 
-def _read_cache(key: str) -> Optional[Dict[str, Any]]:
-    if not CACHE_ENABLED:
-        return None
-    cache = _ensure_cache_loaded()
-    entry = cache.get(key)
-    if not isinstance(entry, dict):
-        return None
-    ts = entry.get("ts")
-    if not isinstance(ts, (int, float)):
+def _expires_in(info: Any) -> float:
+    """Seconds until an entry expires, 0 when it has."""
+    if not isinstance(info, dict) or "expires" not in info:
+        return 0
+    expires = info["expires"]
+    if expires is None:
+        # written before finished weeks were capped, when they never expired
+        expires = float(info.get("ts") or 0) + FINAL_CACHE_TTL_SECONDS
+    return max(expires - time.time(), 0)
+
+
+def _read_cache_bytes(key: str) -> Optional[memoryview]:
+    store = _cache_store()
+    if store is None or key not in store or _expires_in(store.info(key)) == 0:
         return None
-    if CACHE_TTL_SECONDS > 0 and time.time() - ts > CACHE_TTL_SECONDS:
+    return store.get(key)
+
+
+def _read_cache(key: str) -> Optional[Dict[str, Any]]:
+    raw = _read_cache_bytes(key)
+    if raw is None:
         return None
-    data = entry.get("data")
-    if not isinstance(data, dict):
+    try:
+        data = espn_json.loads(raw)
+    except ValueError:
         return None
-    return data
+    return data if isinstance(data, dict) else None
 
 
-def _write_cache(key: str, value: Dict[str, Any]) -> None:
+def _cache_expires_in(key: str) -> float:
+    """Seconds until a cached entry expires, 0 when missing or expired."""
+    store = _cache_store()
+    if store is None:
+        return 0
+    return _expires_in(store.info(key))
+
+
+def _write_cache(key: str, value: Dict[str, Any], ttl: Any = "status") -> None:
     if not CACHE_ENABLED:
         return
-    cache = _ensure_cache_loaded()
-    cache[key] = {"data": value, "ts": time.time()}
+    now = time.time()
+    if ttl == "status":
+        ttl = cache_ttl_for_entries(value.get("entries") or [], now)
+    # stored exactly as main() prints it, so hits can be written to stdout untouched
+    data = espn_json.dumps(value)
+    info = {"ts": now, "expires": now + ttl}
     try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with CACHE_FILE.open("w", encoding="utf-8") as handle:
-            json.dump(cache, handle, ensure_ascii=False)
+        espn_blobstore.update_store(CACHE_FILE, {key: (data, info)}, keep=lambda _, old: _expires_in(old) != 0)
     except Exception:
         pass
 
@@ -316,6 +382,57 @@ def extract_status(status: Any) -> Optional[str]:
     return status.get("type") if isinstance(status.get("type"), str) else None
 
 
+def classify_status(status: Optional[str]) -> Optional[str]:
+    """Reduce an extract_status value to ESPN's 'pre', 'in' or 'post' state, or None if unknown."""
+    if not status:
+        return None
+    value = str(status).lower()
+    if value == "post" or "final" in value:
+        return "post"
+    if value == "pre" or "scheduled" in value:
+        return "pre"
+    if value == "in" or any(marker in value for marker in ("progress", "halftime", "delayed", "end of")):
+        return "in"
+    return None
+
+
+def parse_kickoff(value: Any) -> Optional[float]:
+    if not isinstance(value, str) or not value:
+        return None
+    for pattern in ("%Y-%m-%dT%H:%MZ", "%Y-%m-%dT%H:%M:%SZ"):
+        try:
+            return datetime.strptime(value, pattern).replace(tzinfo=timezone.utc).timestamp()
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def cache_ttl_for_entries(entries: Iterable[Dict[str, Any]], now: Optional[float] = None) -> float:
+    """Seconds a week's payload stays fresh."""
+    now = time.time() if now is None else now
+    ttls: List[float] = []
+    seen = False
+    for entry in entries:
+        seen = True
+        state = classify_status(entry.get("status"))
+        if state == "post":
+            continue
+        if state == "in":
+            ttls.append(LIVE_CACHE_TTL_SECONDS)
+            continue
+        kickoff = parse_kickoff(entry.get("date")) if state == "pre" else None
+        if kickoff is None:
+            ttls.append(CACHE_TTL_SECONDS)
+            continue
+        ttls.append(min(max(kickoff - now, LIVE_CACHE_TTL_SECONDS), UPCOMING_CACHE_TTL_SECONDS))
+    if not seen:
+        return CACHE_TTL_SECONDS
+    return min(ttls) if ttls else FINAL_CACHE_TTL_SECONDS
+
+
 def gather_week_numbers(schedule: Any) -> List[int]:
     weeks: List[int] = []
     week_iterable = getattr(schedule, "weeks", None)
@@ -417,41 +534,123 @@ def build_payload(events: Iterable[Any], week: int, season: int, season_type: st
     return payload
 
 
-def main():
-    if len(sys.argv) < 4:
-        print(json.dumps({"entries": [], "meta": None}, ensure_ascii=False))
-        return
-    season_type = sys.argv[1]
-    normalized_type = normalize_season_type(season_type)
-    try:
-        season = int(sys.argv[2])
-        week = int(sys.argv[3])
-    except ValueError:
-        print(json.dumps({"entries": [], "meta": None}, ensure_ascii=False))
-        return
-    extra_args = sys.argv[4:]
-    force_refresh = False
-    for arg in extra_args:
-        lowered = arg.lower()
-        if lowered in {"--force", "force", "refresh", "--refresh", "true"}:
-            force_refresh = True
-    cache_key = f"{season}:{normalized_type}:{week}"
-    if not force_refresh:
-        cached = _read_cache(cache_key)
-        if cached is not None:
-            print(json.dumps(cached, ensure_ascii=False))
-            return
-    espn = PYESPN("nfl")
-    summaries, week_to_type, schedules, default_week, default_type = build_season_summary(espn, season)
-    resolved_type = normalized_type
+def _snapshot_path(season: int) -> Path:
+    return SNAPSHOT_DIR / f"schedule-{season}.bin"
+
+
+def load_snapshot(season: int) -> Optional[espn_blobstore.BlobStore]:
+    if not SNAPSHOTS_ENABLED:
+        return None
+    snapshot = espn_blobstore.open_store(_snapshot_path(season))
+    if snapshot.meta.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def snapshot_week_bytes(snapshot: espn_blobstore.BlobStore, normalized_type: str, week: int) -> Optional[Any]:
+    """A frozen week's payload as stored, decoded only when the request names a week by another type."""
+    raw = snapshot.get(f"{normalized_type}:{week}")
+    if raw is not None:
+        return raw
+    resolved = resolve_season_type(normalized_type, week, snapshot.meta["summary"]["week_to_season_type"])
+    raw = snapshot.get(f"{resolved}:{week}")
+    if raw is None:
+        return None
+    response = espn_json.loads(raw)
+    response["meta"]["requested_season_type"] = normalized_type
+    return espn_json.dumps(response)
+
+
+def snapshot_week_response(snapshot: espn_blobstore.BlobStore, normalized_type: str, week: int) -> Optional[Dict[str, Any]]:
+    raw = snapshot_week_bytes(snapshot, normalized_type, week)
+    return espn_json.loads(raw) if raw is not None else None
+
+
+def build_snapshot(espn: PYESPN, season: int) -> Tuple[Dict[str, Any], Dict[str, Any], int]:
+    """Materialize every week of a season.
+
+    Returns the encoded week payloads keyed by "<season_type>:<week>", the snapshot metadata
+    and the number of games that are not final yet.
+    """
+    season_data = build_season_summary(espn, season)
+    summaries, week_to_type, _, default_week, default_type = season_data
+    frozen_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    blobs: Dict[str, Any] = {}
+    unfinished = 0
+    games = 0
+    for season_type, info in summaries.items():
+        for week in info.get("weeks", []):
+            response = build_week_response(espn, season_data, season, season_type, week, cache=False)
+            response["meta"]["generated_at"] = frozen_at
+            for entry in response["entries"]:
+                games += 1
+                if classify_status(entry.get("status")) != "post":
+                    unfinished += 1
+            blobs[f"{season_type}:{week}"] = (espn_json.dumps(response), None)
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "season": season,
+        "frozen_at": frozen_at,
+        "games": games,
+        "summary": {
+            "default_week": default_week,
+            "default_season_type": default_type,
+            "season_types": list(summaries.values()),
+            "week_to_season_type": week_to_type,
+        },
+    }
+    return blobs, meta, unfinished
+
+
+def build_freeze_response(argv: List[str]) -> Dict[str, Any]:
+    """Freeze a completed season: espn_schedule.py --freeze <season> [--force].
+
+    Seasons with any game that is not final are refused. An existing snapshot is kept
+    unless --force is passed.
+    """
+    args = [arg for arg in argv[1:] if arg != "--freeze"]
+    seasons = [int(arg) for arg in args if arg.isdigit()]
+    if not seasons:
+        return {"frozen": False, "season": None, "reason": "expected a season"}
+    season = seasons[0]
+    if not SNAPSHOTS_ENABLED:
+        return {"frozen": False, "season": season, "reason": "snapshots are disabled"}
+    path = _snapshot_path(season)
+    if load_snapshot(season) is not None and "--force" not in args:
+        return {"frozen": True, "season": season, "path": str(path), "created": False}
+    blobs, meta, unfinished = build_snapshot(PYESPN("nfl"), season)
+    if not meta["games"]:
+        return {"frozen": False, "season": season, "reason": "no games found"}
+    if unfinished:
+        return {"frozen": False, "season": season, "reason": f"{unfinished} games not final yet"}
+    espn_blobstore.write_store(path, blobs, meta, read_only=True)
+    return {
+        "frozen": True,
+        "season": season,
+        "path": str(path),
+        "created": True,
+        "weeks": len(blobs),
+        "games": meta["games"],
+    }
+
+
+def resolve_season_type(normalized_type: str, week: int, week_to_type: Dict[str, str]) -> str:
     if normalized_type == "regular":
-        resolved_type = week_to_type.get(str(week), normalized_type)
-    elif normalized_type not in {"pre", "post", "playin"}:
+        return week_to_type.get(str(week), normalized_type)
+    if normalized_type not in {"pre", "post", "playin"}:
         fallback_type = week_to_type.get(str(week))
         if fallback_type in {"pre", "regular", "post", "playin"}:
-            resolved_type = fallback_type
-        else:
-            resolved_type = "regular"
+            return fallback_type
+        return "regular"
+    return normalized_type
+
+
+def build_week_response(
+    espn: PYESPN, season_data: Tuple, season: int, normalized_type: str, week: int, cache: bool = True
+) -> Dict[str, Any]:
+    """Build and cache one week's payload from an already loaded season summary."""
+    summaries, week_to_type, schedules, default_week, default_type = season_data
+    resolved_type = resolve_season_type(normalized_type, week, week_to_type)
     schedule = schedules.get(resolved_type)
     if schedule is None:
         schedule = load_schedule(espn, resolved_type, season)
@@ -475,8 +674,269 @@ def main():
         "generated_at": generated_at,
     }
     response = {"entries": entries, "meta": meta}
-    _write_cache(cache_key, response)
-    print(json.dumps(response, ensure_ascii=False))
+    if cache:
+        _write_cache(f"{season}:{normalized_type}:{week}", response)
+    return response
+
+
+def parse_week_request(argv: List[str]) -> Optional[Tuple[str, int, int, bool]]:
+    if len(argv) < 4:
+        return None
+    normalized_type = normalize_season_type(argv[1])
+    try:
+        season = int(argv[2])
+        week = int(argv[3])
+    except ValueError:
+        return None
+    force_refresh = False
+    for arg in argv[4:]:
+        lowered = arg.lower()
+        if lowered in {"--force", "force", "refresh", "--refresh", "true"}:
+            force_refresh = True
+    return normalized_type, season, week, force_refresh
+
+
+def stored_response_bytes(argv: List[str]) -> Optional[Any]:
+    """A week's payload straight from its snapshot or the cache, as stored and without decoding it."""
+    request = parse_week_request(argv)
+    if request is None:
+        return None
+    normalized_type, season, week, force_refresh = request
+    snapshot = load_snapshot(season)
+    espn_diagnostics.record_cache("schedule_snapshot", snapshot is not None)
+    if snapshot is not None:
+        raw = snapshot_week_bytes(snapshot, normalized_type, week)
+        return raw if raw is not None else espn_json.dumps({"entries": [], "meta": None})
+    if force_refresh or not CACHE_ENABLED:
+        return None
+    raw = _read_cache_bytes(f"{season}:{normalized_type}:{week}")
+    espn_diagnostics.record_cache("schedule_file", raw is not None)
+    return raw
+
+
+def build_response(argv: List[str]) -> Dict[str, Any]:
+    request = parse_week_request(argv)
+    if request is None:
+        return {"entries": [], "meta": None}
+    normalized_type, season, week, _ = request
+    espn = PYESPN("nfl")
+    return build_week_response(espn, build_season_summary(espn, season), season, normalized_type, week)
+
+
+def parse_number_list(value: str) -> List[int]:
+    """Parse '7', '1-18' or '1,3,5-7' into a sorted list of numbers."""
+    numbers = set()
+    for part in value.split(","):
+        bounds = part.strip().split("-")
+        try:
+            start, end = int(bounds[0]), int(bounds[-1])
+        except ValueError:
+            continue
+        numbers.update(range(min(start, end), max(start, end) + 1))
+    return sorted(numbers)
+
+
+def _cached_season_meta(season: int) -> Optional[Dict[str, Any]]:
+    """Season summary from any fresh cached week of the season, so ranges can skip the crawl."""
+    if not CACHE_ENABLED:
+        return None
+    for key in _cache_store().keys():
+        if not key.startswith(f"{season}:"):
+            continue
+        cached = _read_cache(key)
+        meta = cached.get("meta") if cached else None
+        if isinstance(meta, dict) and meta.get("season_types"):
+            return meta
+    return None
+
+
+def compact_week(response: Dict[str, Any], season: int, season_type: str, week: int) -> Dict[str, Any]:
+    meta = response.get("meta") or {}
+    return {
+        "season": season,
+        "season_type": season_type,
+        "resolved_season_type": meta.get("resolved_season_type", season_type),
+        "week": week,
+        "generated_at": meta.get("generated_at"),
+        "entries": response.get("entries") or [],
+    }
+
+
+def build_range_response(argv: List[str]) -> Dict[str, Any]:
+    """Serve several weeks, optionally across seasons, from one client and one crawl per season.
+
+    Usage: espn_schedule.py --range <season_type|all> <seasons> [weeks] [--force], where seasons
+    and weeks accept '2024', '2022-2024' or '1,3-5'. Every week is read from and written to the
+    cache under its single-week key; the season summaries are returned once per season instead
+    of being repeated in every week.
+    """
+    args = [arg for arg in argv[1:] if arg != "--range"]
+    force = "--force" in args
+    positional = [arg for arg in args if not arg.startswith("--")]
+    if len(positional) < 2:
+        return {"weeks": [], "meta": None}
+    requested_type = positional[0].lower()
+    season_types = list(SEASON_TYPE_IDS) if requested_type == "all" else [normalize_season_type(requested_type)]
+    seasons = parse_number_list(positional[1])[:MAX_RANGE_SEASONS]
+    requested_weeks = parse_number_list(positional[2]) if len(positional) > 2 else None
+    if not seasons or requested_weeks == []:
+        return {"weeks": [], "meta": None}
+
+    espn: Optional[PYESPN] = None
+    weeks: List[Dict[str, Any]] = []
+    season_metas: Dict[str, Any] = {}
+    rebuilt: List[str] = []
+    for season in seasons:
+        snapshot = load_snapshot(season)
+        if snapshot is not None:
+            season_metas[str(season)] = snapshot.meta["summary"]
+            for key in snapshot.keys():
+                season_type, week = key.split(":")
+                if season_type in season_types and (requested_weeks is None or int(week) in requested_weeks):
+                    response = snapshot_week_response(snapshot, season_type, int(week))
+                    weeks.append(compact_week(response, season, season_type, int(week)))
+            continue
+        season_data = None
+        meta = None if force else _cached_season_meta(season)
+        if meta is None:
+            espn = espn or PYESPN("nfl")
+            season_data = build_season_summary(espn, season)
+            summaries, week_to_type, _, default_week, default_type = season_data
+            meta = {
+                "season_types": list(summaries.values()),
+                "week_to_season_type": week_to_type,
+                "default_week": default_week,
+                "default_season_type": default_type,
+            }
+        season_metas[str(season)] = {
+            field: meta.get(field)
+            for field in ("season_types", "week_to_season_type", "default_week", "default_season_type")
+        }
+        type_weeks = {info.get("id"): info.get("weeks") or [] for info in meta.get("season_types") or []}
+        for season_type in season_types:
+            for week in type_weeks.get(season_type, []):
+                if requested_weeks is not None and week not in requested_weeks:
+                    continue
+                key = f"{season}:{season_type}:{week}"
+                response = None if force else _read_cache(key)
+                espn_diagnostics.record_cache("schedule_file", response is not None)
+                if response is None:
+                    if season_data is None:
+                        espn = espn or PYESPN("nfl")
+                        season_data = build_season_summary(espn, season)
+                    response = build_week_response(espn, season_data, season, season_type, week)
+                    rebuilt.append(key)
+                weeks.append(compact_week(response, season, season_type, week))
+    return {
+        "weeks": weeks,
+        "meta": {
+            "season_type": requested_type,
+            "seasons": season_metas,
+            "rebuilt": rebuilt,
+        },
+    }
+
+
+def current_season(now: Optional[datetime] = None) -> int:
+    """The NFL season in progress; January and February belong to the previous year's season."""
+    now = now or datetime.now(timezone.utc)
+    return now.year if now.month >= 3 else now.year - 1
+
+
+def warm_targets(summaries: Dict[str, Any], default_week: Optional[int], default_type: Optional[str]) -> List[Tuple[str, int]]:
+    """The current week plus the weeks either side of it, within the current season type."""
+    if default_week is None or default_type is None:
+        return []
+    weeks = summaries.get(default_type, {}).get("weeks") or []
+    if default_week not in weeks:
+        return [(default_type, default_week)]
+    index = weeks.index(default_week)
+    return [(default_type, week) for week in weeks[max(index - 1, 0):index + 2]]
+
+
+def build_warm_response(argv: List[str]) -> Dict[str, Any]:
+    """Rebuild the cached payloads around the current week before they expire.
+
+    Weeks that stay fresh for longer than the margin are served from the cache as they are;
+    the season summary is only crawled when a week needs rebuilding or the target list is stale.
+    """
+    force = False
+    margin = WARM_MARGIN_SECONDS
+    season = current_season()
+    args = iter(argv[1:])
+    for arg in args:
+        if arg == "--force":
+            force = True
+        elif arg == "--margin":
+            margin = int(next(args, margin))
+        elif arg.isdigit():
+            season = int(arg)
+
+    targets_key = f"warm:{season}"
+    stored = None if force else _read_cache(targets_key)
+    targets = [(item[0], int(item[1])) for item in stored["targets"]] if stored else None
+
+    def needs_rebuild(key: str) -> bool:
+        expires_in = _cache_expires_in(key)
+        return force or expires_in <= margin
+
+    loaded: Dict[str, Any] = {}
+
+    def season_data() -> Tuple:
+        if not loaded:
+            loaded["espn"] = PYESPN("nfl")
+            loaded["season"] = build_season_summary(loaded["espn"], season)
+        return loaded["season"]
+
+    if targets is None or any(needs_rebuild(f"{season}:{season_type}:{week}") for season_type, week in targets):
+        summaries, _, _, default_week, default_type = season_data()
+        targets = warm_targets(summaries, default_week, default_type)
+        _write_cache(targets_key, {"targets": targets}, ttl=WARM_TARGETS_TTL_SECONDS)
+
+    weeks: Dict[str, Any] = {}
+    expires_in: Dict[str, float] = {}
+    rebuilt: List[str] = []
+    for season_type, week in targets:
+        key = f"{season}:{season_type}:{week}"
+        cached = None if needs_rebuild(key) else _read_cache(key)
+        espn_diagnostics.record_cache("schedule_file", cached is not None)
+        if cached is None:
+            data = season_data()
+            cached = build_week_response(loaded["espn"], data, season, season_type, week)
+            rebuilt.append(key)
+        weeks[key] = cached
+        remaining = _cache_expires_in(key) if CACHE_ENABLED else cache_ttl_for_entries(cached.get("entries") or [])
+        expires_in[key] = round(remaining, 1)
+    return {
+        "weeks": weeks,
+        "meta": {
+            "season": season,
+            "targets": [f"{season}:{season_type}:{week}" for season_type, week in targets],
+            "rebuilt": rebuilt,
+            "expires_in": expires_in,
+        },
+    }
+
+
+def main():
+    argv = espn_diagnostics.strip_flag(sys.argv)
+    raw = None
+    with espn_diagnostics.track("schedule") as diagnostics:
+        if "--warm" in argv:
+            response = build_warm_response(argv)
+        elif "--range" in argv:
+            response = build_range_response(argv)
+        elif "--freeze" in argv:
+            response = build_freeze_response(argv)
+        else:
+            raw = stored_response_bytes(argv)
+            response = build_response(argv) if raw is None else None
+    if raw is not None:
+        # stored payloads go out byte for byte; a hit made no fetches worth reporting
+        espn_json.emit_raw(raw)
+        return
+    espn_diagnostics.attach(response, diagnostics)
+    espn_json.emit(response)
 
 
 if __name__ == "__main__":
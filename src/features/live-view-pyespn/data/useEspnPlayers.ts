@@ -1,5 +1,5 @@
 import { useEffect, useMemo, useRef, useState } from 'react';
-import { fetchEspnPlayer, type EspnPlayerPayload } from '../../../lib/api/espn-data';
+import { fetchEspnPlayers, type EspnPlayerPayload } from '../../../lib/api/espn-data';
 
 export interface EspnPlayerMeta {
   id: string;
@@ -105,41 +105,22 @@ export function useEspnPlayers(playerIds: string[]): UseEspnPlayersResult {
     setLoading(true);
     setError(null);
 
-    Promise.allSettled(
-      missing.map(async id => {
-        const payload = await fetchEspnPlayer(id);
-        return { id, payload };
-      }),
-    )
-      .then(results => {
+    fetchEspnPlayers(missing)
+      .then(payloads => {
         if (cancelled) {
           return;
         }
-        let changed = false;
-        let failure = false;
-        results.forEach((result, index) => {
-          const id = missing[index];
-          if (result.status === 'fulfilled') {
-            const payload = result.value.payload;
-            if (payload) {
-              cacheRef.current.set(id, buildPlayerMeta(payload));
-            } else {
-              console.warn(`PyESPN player payload missing for ${id}`);
-              cacheRef.current.set(id, null);
-            }
-            changed = true;
+        missing.forEach(id => {
+          const payload = payloads[id];
+          if (payload) {
+            cacheRef.current.set(id, buildPlayerMeta(payload));
           } else {
-            console.error(`Failed to load PyESPN player ${id}`, result.reason);
-            failure = true;
+            console.warn(`PyESPN player payload missing for ${id}`);
+            cacheRef.current.set(id, null);
           }
         });
-        if (changed) {
-          setVersion(prev => prev + 1);
-        }
-        if (failure) {
-          console.warn('Some PyESPN player lookups failed', { playerIds: missing });
-        }
-        setError(failure ? 'Failed to load some ESPN player data.' : null);
+        setVersion(prev => prev + 1);
+        setError(null);
       })
       .catch(err => {
         if (cancelled) {
@@ -1,5 +1,5 @@
 import { afterEach, describe, expect, it, vi } from 'vitest';
-import { fetchEspnSchedule } from '../espn-data';
+import { fetchEspnPlayers, fetchEspnSchedule, fetchEspnScheduleRange } from '../espn-data';
 
 describe('fetchEspnSchedule', () => {
   const originalFetch = globalThis.fetch;
@@ -261,3 +261,90 @@ describe('fetchEspnSchedule', () => {
     expect(fetchSpy.mock.calls[0]?.[0]).toBe('/api/espn/schedule/regular/2025/8?force=refresh');
   });
 });
+
+describe('fetchEspnScheduleRange', () => {
+  const originalFetch = globalThis.fetch;
+
+  afterEach(() => {
+    globalThis.fetch = originalFetch;
+    vi.restoreAllMocks();
+  });
+
+  it('splits a range response into weeks and memoizes each week', async () => {
+    const fetchSpy = vi.fn().mockResolvedValue({
+      ok: true,
+      json: async () => ({
+        weeks: [
+          {
+            season: 2024,
+            season_type: 'regular',
+            resolved_season_type: 'regular',
+            week: 3,
+            generated_at: '2024-09-20T00:00:00Z',
+            entries: [{ game_id: '401700003', week: 3, season: 2024, season_type: 'regular', status: 'STATUS_FINAL' }],
+          },
+        ],
+        meta: {
+          seasons: {
+            '2024': {
+              season_types: [{ id: 'regular', label: 'Regular Season', weeks: [1, 2, 3], current_week: null }],
+              week_to_season_type: { '3': 'regular' },
+              default_week: 1,
+              default_season_type: 'regular',
+            },
+          },
+        },
+      }),
+    } as unknown as Response);
+
+    globalThis.fetch = fetchSpy as unknown as typeof fetch;
+
+    const weeks = await fetchEspnScheduleRange('regular', 2024, { weeks: [1, 3] });
+
+    expect(fetchSpy.mock.calls[0]?.[0]).toBe('/api/espn/schedule/regular/2024?weeks=1-3');
+    expect(weeks).toHaveLength(1);
+    expect(weeks[0]).toMatchObject({ season: 2024, week: 3, season_type: 'regular' });
+    expect(weeks[0]?.entries[0]).toMatchObject({ game_id: '401700003', status: 'complete' });
+    expect(weeks[0]?.meta).toMatchObject({ requested_week: 3, default_week: 1, season: 2024 });
+
+    const memoized = await fetchEspnSchedule('regular', 2024, 3, { includeMeta: true });
+    expect(fetchSpy).toHaveBeenCalledTimes(1);
+    expect(memoized.entries[0]).toMatchObject({ game_id: '401700003' });
+  });
+});
+
+describe('fetchEspnPlayers', () => {
+  const originalFetch = globalThis.fetch;
+
+  afterEach(() => {
+    globalThis.fetch = originalFetch;
+    vi.restoreAllMocks();
+  });
+
+  it('requests every id in one batch and parses each entry', async () => {
+    const fetchSpy = vi.fn().mockResolvedValue({
+      ok: true,
+      json: async () => ({
+        players: {
+          '15847': {
+            id: '15847',
+            fullName: 'Mock Quarterback',
+            displayName: 'Mock QB',
+            position: 'QB',
+            team: { id: '1', abbreviation: 'MH', displayName: 'Mockington Home' },
+          },
+          '99': null,
+        },
+      }),
+    } as unknown as Response);
+
+    globalThis.fetch = fetchSpy as unknown as typeof fetch;
+
+    const players = await fetchEspnPlayers(['15847', '99', '15847']);
+
+    expect(fetchSpy).toHaveBeenCalledTimes(1);
+    expect(fetchSpy.mock.calls[0]?.[0]).toBe('/api/espn/players?ids=15847,99');
+    expect(players['15847']).toMatchObject({ id: '15847', fullName: 'Mock Quarterback', position: 'QB' });
+    expect(players['99']).toBeNull();
+  });
+});
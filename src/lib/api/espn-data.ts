@@ -83,6 +83,12 @@ export interface EspnScheduleResponse {
   meta: EspnScheduleMeta | null;
 }
 
+export interface EspnScheduleWeek extends EspnScheduleResponse {
+  season: number;
+  season_type: string;
+  week: number;
+}
+
 const isRecord = (value: unknown): value is Record<string, unknown> =>
   typeof value === 'object' && value !== null;
 
@@ -499,6 +505,65 @@ async function fetchJson(url: string): Promise<any | null> {
   }
 }
 
+const parseScheduleResponse = (data: unknown): EspnScheduleResponse => {
+  if (isRecord(data) && !Array.isArray(data)) {
+    const entries = Array.isArray(data.entries) ? data.entries : [];
+    const metaRecord = isRecord(data.meta) ? (data.meta as Record<string, unknown>) : null;
+    const entriesParsed = entries
+      .map(parseScheduleEntry)
+      .filter((entry): entry is EspnScheduleEntry => entry !== null);
+    const seasonTypes = Array.isArray(metaRecord?.season_types)
+      ? (metaRecord?.season_types as unknown[]).reduce<EspnSeasonTypeSummary[]>((acc, value) => {
+          if (!isRecord(value)) {
+            return acc;
+          }
+          const id = typeof value.id === 'string' ? value.id : null;
+          if (!id) {
+            return acc;
+          }
+          const label = typeof value.label === 'string' ? value.label : id;
+          const weeksRaw = Array.isArray(value.weeks) ? value.weeks : [];
+          const weeks = weeksRaw
+            .map(item => Number(item))
+            .filter(num => Number.isFinite(num))
+            .map(num => Number(num));
+          const currentWeek = Number.isFinite(Number(value.current_week))
+            ? Number(value.current_week)
+            : null;
+          acc.push({ id, label, weeks, current_week: currentWeek });
+          return acc;
+        }, [])
+      : [];
+    const weekToType = isRecord(metaRecord?.week_to_season_type)
+      ? (metaRecord?.week_to_season_type as Record<string, string>)
+      : {};
+    const meta: EspnScheduleMeta | null = metaRecord
+      ? {
+          season: Number.isFinite(Number(metaRecord.season)) ? Number(metaRecord.season) : null,
+          requested_season_type:
+            typeof metaRecord.requested_season_type === 'string' ? metaRecord.requested_season_type : null,
+          resolved_season_type:
+            typeof metaRecord.resolved_season_type === 'string' ? metaRecord.resolved_season_type : null,
+          requested_week: Number.isFinite(Number(metaRecord.requested_week))
+            ? Number(metaRecord.requested_week)
+            : null,
+          default_week: Number.isFinite(Number(metaRecord.default_week)) ? Number(metaRecord.default_week) : null,
+          default_season_type:
+            typeof metaRecord.default_season_type === 'string' ? metaRecord.default_season_type : null,
+          season_types: seasonTypes,
+          week_to_season_type: weekToType,
+          generated_at: typeof metaRecord.generated_at === 'string' ? metaRecord.generated_at : null,
+        }
+      : null;
+    return { entries: entriesParsed, meta };
+  }
+  const entries = Array.isArray(data) ? data : [];
+  const parsedEntries = entries
+    .map(parseScheduleEntry)
+    .filter((entry): entry is EspnScheduleEntry => entry !== null);
+  return { entries: parsedEntries, meta: null };
+};
+
 export async function fetchEspnSchedule(
   seasonType: string,
   season: number,
@@ -533,70 +598,67 @@ export async function fetchEspnSchedule(
     }
   }
   const data = await fetchJson(`/api/espn/schedule/${encodedSeasonType}/${encodedSeason}/${encodedWeek}${query}`);
-  const parsed: EspnScheduleResponse = (() => {
-    if (isRecord(data) && !Array.isArray(data)) {
-      const entries = Array.isArray(data.entries) ? data.entries : [];
-      const metaRecord = isRecord(data.meta) ? (data.meta as Record<string, unknown>) : null;
-      const entriesParsed = entries
-        .map(parseScheduleEntry)
-        .filter((entry): entry is EspnScheduleEntry => entry !== null);
-      const seasonTypes = Array.isArray(metaRecord?.season_types)
-        ? (metaRecord?.season_types as unknown[]).reduce<EspnSeasonTypeSummary[]>((acc, value) => {
-            if (!isRecord(value)) {
-              return acc;
-            }
-            const id = typeof value.id === 'string' ? value.id : null;
-            if (!id) {
-              return acc;
-            }
-            const label = typeof value.label === 'string' ? value.label : id;
-            const weeksRaw = Array.isArray(value.weeks) ? value.weeks : [];
-            const weeks = weeksRaw
-              .map(item => Number(item))
-              .filter(num => Number.isFinite(num))
-              .map(num => Number(num));
-            const currentWeek = Number.isFinite(Number(value.current_week))
-              ? Number(value.current_week)
-              : null;
-            acc.push({ id, label, weeks, current_week: currentWeek });
-            return acc;
-          }, [])
-        : [];
-      const weekToType = isRecord(metaRecord?.week_to_season_type)
-        ? (metaRecord?.week_to_season_type as Record<string, string>)
-        : {};
-      const meta: EspnScheduleMeta | null = metaRecord
-        ? {
-            season: Number.isFinite(Number(metaRecord.season)) ? Number(metaRecord.season) : null,
-            requested_season_type:
-              typeof metaRecord.requested_season_type === 'string' ? metaRecord.requested_season_type : null,
-            resolved_season_type:
-              typeof metaRecord.resolved_season_type === 'string' ? metaRecord.resolved_season_type : null,
-            requested_week: Number.isFinite(Number(metaRecord.requested_week))
-              ? Number(metaRecord.requested_week)
-              : null,
-            default_week: Number.isFinite(Number(metaRecord.default_week)) ? Number(metaRecord.default_week) : null,
-            default_season_type:
-              typeof metaRecord.default_season_type === 'string' ? metaRecord.default_season_type : null,
-            season_types: seasonTypes,
-            week_to_season_type: weekToType,
-            generated_at: typeof metaRecord.generated_at === 'string' ? metaRecord.generated_at : null,
-          }
-        : null;
-      return { entries: entriesParsed, meta };
-    }
-    const entries = Array.isArray(data) ? data : [];
-    const parsedEntries = entries
-      .map(parseScheduleEntry)
-      .filter((entry): entry is EspnScheduleEntry => entry !== null);
-    return { entries: parsedEntries, meta: null };
-  })();
+  const parsed = parseScheduleResponse(data);
   if (useMemo) {
     setScheduleMemo(memoKey, parsed);
   }
   return options.includeMeta ? parsed : parsed.entries;
 }
 
+const formatRange = (value: number | [number, number]): string =>
+  Array.isArray(value) ? `${value[0]}-${value[1]}` : String(value);
+
+export async function fetchEspnScheduleRange(
+  seasonType: string,
+  seasons: number | [number, number],
+  options: FetchOptions & { weeks?: number | [number, number] } = {},
+): Promise<EspnScheduleWeek[]> {
+  const normalizedSeasonType = seasonType.toLowerCase() === 'all' ? 'all' : normalizeSeasonType(seasonType);
+  const params = new URLSearchParams();
+  if (options.weeks !== undefined) {
+    params.set('weeks', formatRange(options.weeks));
+  }
+  if (options.forceRefresh) {
+    params.set('force', 'refresh');
+  }
+  const query = params.toString() ? `?${params.toString()}` : '';
+  const data = await fetchJson(
+    `/api/espn/schedule/${encodeURIComponent(normalizedSeasonType)}/${encodeURIComponent(formatRange(seasons))}${query}`,
+  );
+  if (!isRecord(data) || !Array.isArray(data.weeks)) {
+    return [];
+  }
+  const meta: Record<string, unknown> = isRecord(data.meta) ? data.meta : {};
+  const seasonMetas: Record<string, unknown> = isRecord(meta.seasons) ? meta.seasons : {};
+  return data.weeks.reduce<EspnScheduleWeek[]>((acc, item) => {
+    if (!isRecord(item) || !Number.isFinite(Number(item.season)) || !Number.isFinite(Number(item.week))) {
+      return acc;
+    }
+    const season = Number(item.season);
+    const week = Number(item.week);
+    const weekType = typeof item.season_type === 'string' ? item.season_type : normalizedSeasonType;
+    const seasonMetaValue = seasonMetas[String(season)];
+    const seasonMeta = isRecord(seasonMetaValue) ? seasonMetaValue : {};
+    // rebuild the single-week shape so each week also fills the fetchEspnSchedule memo
+    const parsed = parseScheduleResponse({
+      entries: item.entries,
+      meta: {
+        ...seasonMeta,
+        season,
+        requested_season_type: weekType,
+        resolved_season_type: item.resolved_season_type,
+        requested_week: week,
+        generated_at: item.generated_at,
+      },
+    });
+    if (options.useMemo !== false) {
+      setScheduleMemo(`${weekType}:${season}:${week}`, parsed);
+    }
+    acc.push({ ...parsed, season, season_type: weekType, week });
+    return acc;
+  }, []);
+}
+
 export async function fetchEspnEvent(
   eventId: string,
   options: FetchOptions = {},
@@ -623,3 +685,35 @@ export async function fetchEspnPlayer(
   const data = await fetchJson(`/api/espn/player/${encodeURIComponent(playerId)}${suffix}`);
   return parsePlayerPayload(data);
 }
+
+// Matches PLAYER_BATCH_LIMIT in espn-api-server.cjs.
+const PLAYER_BATCH_SIZE = 100;
+
+export async function fetchEspnPlayers(
+  playerIds: string[],
+  options: FetchOptions = {},
+): Promise<Record<string, EspnPlayerPayload | null>> {
+  const ids = Array.from(new Set(playerIds.map(id => id.trim()).filter(id => id.length > 0)));
+  const chunks: string[][] = [];
+  for (let index = 0; index < ids.length; index += PLAYER_BATCH_SIZE) {
+    chunks.push(ids.slice(index, index + PLAYER_BATCH_SIZE));
+  }
+  const suffix = options.forceRefresh ? '&force=refresh' : '';
+  const responses = await Promise.all(
+    chunks.map(chunk =>
+      fetchJson(`/api/espn/players?ids=${chunk.map(encodeURIComponent).join(',')}${suffix}`),
+    ),
+  );
+
+  const players: Record<string, EspnPlayerPayload | null> = {};
+  responses.forEach((data, index) => {
+    if (!isRecord(data) || !isRecord(data.players)) {
+      throw new Error('Failed to load ESPN player batch');
+    }
+    const found = data.players as Record<string, unknown>;
+    chunks[index].forEach(id => {
+      players[id] = parsePlayerPayload(found[id]);
+    });
+  });
+  return players;
+}
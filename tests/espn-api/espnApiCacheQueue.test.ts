@@ -0,0 +1,133 @@
+import { afterEach, describe, expect, it, vi } from 'vitest';
+import { createRequire } from 'node:module';
+import { promises as fs, readFileSync } from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+const repoRoot = path.resolve(__dirname, '..', '..');
+const sleepScript = path.resolve(__dirname, 'fakes', 'sleep_then_print.py');
+
+// The queue limits are read when the server module loads, so they are set just for the require.
+const queueEnv = { ESPN_PY_CONCURRENCY: '1', ESPN_PY_MAX_QUEUE: '2', ESPN_PY_TIMEOUT_MS: '1500' };
+const originalEnv = Object.fromEntries(Object.keys(queueEnv).map(name => [name, process.env[name]]));
+Object.assign(process.env, queueEnv);
+const require = createRequire(import.meta.url);
+const server = require(path.join(repoRoot, 'espn-api-server.cjs'));
+Object.entries(originalEnv).forEach(([name, value]) => {
+  if (value === undefined) {
+    delete process.env[name];
+  } else {
+    process.env[name] = value;
+  }
+});
+
+const runSleep = async (seconds: number, label: string, priority: number, extra: string[] = []) => {
+  const raw: Buffer = await server.runPy(sleepScript, [String(seconds), label, ...extra], { priority });
+  return (JSON.parse(raw.toString('utf8')) as { label: string }).label;
+};
+
+const processExists = (pid: number) => {
+  try {
+    process.kill(pid, 0);
+    return true;
+  } catch {
+    return false;
+  }
+};
+
+describe('espn-api-server caches', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it('evicts the least recently used entry once maxEntries is reached', () => {
+    const cache = server.createCache('test_entries', { ttlMs: 60000, maxEntries: 2 });
+    cache.set('a', { value: 'a' });
+    cache.set('b', { value: 'b' });
+    expect(cache.get('a')).toEqual({ value: 'a' });
+    cache.set('c', { value: 'c' });
+
+    expect(cache.get('b')).toBeNull();
+    expect(cache.get('a')).toEqual({ value: 'a' });
+    expect(cache.get('c')).toEqual({ value: 'c' });
+    expect(cache.size).toBe(2);
+    expect(server.metrics.render()).toContain('espn_api_cache_evictions_total{cache="test_entries",reason="entries"} 1');
+  });
+
+  it('evicts by bytes and never stores an entry larger than the cache', () => {
+    const cache = server.createCache('test_bytes', { ttlMs: 60000, maxEntries: 10, maxBytes: 10 });
+    cache.set('a', 'a', { size: 4 });
+    cache.set('b', 'b', { size: 4 });
+    cache.set('c', 'c', { size: 4 });
+
+    expect(cache.get('a')).toBeNull();
+    expect(cache.bytes).toBe(8);
+
+    cache.set('huge', 'huge', { size: 11 });
+    expect(cache.get('huge')).toBeNull();
+    expect(cache.size).toBe(2);
+    expect(server.metrics.render()).toContain('espn_api_cache_evictions_total{cache="test_bytes",reason="bytes"} 2');
+  });
+
+  it('sweeps expired entries without waiting for a lookup', () => {
+    const now = vi.spyOn(Date, 'now').mockReturnValue(1000);
+    const cache = server.createCache('test_sweep', { ttlMs: 1000 });
+    cache.set('short', 'short', { size: 5 });
+    cache.set('long', 'long', { size: 4, ttlMs: 60000 });
+
+    now.mockReturnValue(5000);
+    cache.sweep();
+
+    expect(cache.size).toBe(1);
+    expect(cache.bytes).toBe(4);
+    expect(cache.get('long')).toBe('long');
+  });
+});
+
+describe('espn-api-server python queue', () => {
+  it('starts queued jobs in priority order', async () => {
+    const started: string[] = [];
+    const blocker = runSleep(0.3, 'blocker', server.PY_PRIORITY.background);
+    const player = runSleep(0, 'player', server.PY_PRIORITY.player).then(label => started.push(label));
+    const pbp = runSleep(0, 'pbp', server.PY_PRIORITY.pbp).then(label => started.push(label));
+
+    await Promise.all([blocker, player, pbp]);
+    expect(started).toEqual(['pbp', 'player']);
+  }, 15000);
+
+  it('rejects jobs with a 503 once the queue is full', async () => {
+    const running = runSleep(0.3, 'running', server.PY_PRIORITY.background);
+    const queued = [runSleep(0, 'first', server.PY_PRIORITY.player), runSleep(0, 'second', server.PY_PRIORITY.player)];
+
+    const rejected = await runSleep(0, 'third', server.PY_PRIORITY.pbp).catch(err => err);
+    expect(rejected).toBeInstanceOf(server.PythonQueueFullError);
+    expect(server.pyErrorStatus(rejected)).toBe(503);
+    expect(server.pyErrorStatus(new Error('script failed'))).toBe(500);
+
+    await Promise.all([running, ...queued]);
+    expect(server.metrics.render()).toMatch(/espn_api_python_spawns_total\{outcome="rejected",script="sleep_then_print.py"\} 1/);
+  }, 15000);
+
+  it('kills and rejects a job that runs past the timeout', async () => {
+    const dir = await fs.mkdtemp(path.join(os.tmpdir(), 'espn-py-timeout-'));
+    const pidFile = path.join(dir, 'pid');
+
+    const slow = runSleep(30, 'slow', server.PY_PRIORITY.pbp, [pidFile]);
+    // queued behind the slow job, it may only start once the killed process has exited
+    const next = runSleep(0, 'next', server.PY_PRIORITY.pbp).then(label => ({
+      label,
+      slowAlive: processExists(Number(readFileSync(pidFile, 'utf8'))),
+    }));
+
+    await expect(slow).rejects.toThrow(/timed out/);
+    expect(await next).toEqual({ label: 'next', slowAlive: false });
+
+    const pid = Number(await fs.readFile(pidFile, 'utf8'));
+    expect(processExists(pid)).toBe(false);
+    expect(server.metrics.render()).toMatch(/espn_api_python_spawns_total\{outcome="timeout",script="sleep_then_print.py"\} 1/);
+    await fs.rm(dir, { recursive: true, force: true });
+  }, 15000);
+});
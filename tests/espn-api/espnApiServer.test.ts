@@ -65,6 +65,8 @@ describe('espn-api-server integration', () => {
       env: {
         ...process.env,
         PYTHONPATH: pythonPathValue,
+        ESPN_SCHEDULE_WARMER: '0',
+        ESPN_PLAYER_INDEX_BUILD: '0',
       },
       stdio: ['ignore', 'pipe', 'pipe'],
     });
@@ -155,4 +157,75 @@ describe('espn-api-server integration', () => {
       : refreshedEnvelope.entries ?? [];
     expect(refreshedSchedule[0]?.status).toBe('post');
   }, 20000);
+
+  it('serves many players from one batch request', async () => {
+    const response = await fetch('http://127.0.0.1:3001/api/espn/players?ids=15847,99');
+    expect(response.ok).toBe(true);
+    const body = (await response.json()) as { players: Record<string, Record<string, unknown> | null> };
+    expect(body.players['15847']).toMatchObject({ id: '15847', fullName: 'Mock Quarterback' });
+    expect(body.players['99']).toBeNull();
+
+    const playerSpawns = async () => {
+      const metrics = await (await fetch('http://127.0.0.1:3001/metrics')).text();
+      const match = metrics.match(/espn_api_python_spawns_total\{outcome="success",script="espn_players.py"\} (\d+)/);
+      return Number(match?.[1] ?? 0);
+    };
+    const spawnsBefore = await playerSpawns();
+    const repeat = await fetch('http://127.0.0.1:3001/api/espn/players?ids=99');
+    const repeatBody = (await repeat.json()) as { players: Record<string, unknown> };
+    expect(repeatBody.players['99']).toBeNull();
+    expect(await playerSpawns()).toBe(spawnsBefore);
+
+    const invalid = await fetch('http://127.0.0.1:3001/api/espn/players?ids=abc');
+    expect(invalid.status).toBe(400);
+  }, 20000);
+
+  it('serves a week range from one build and caches every week under its own key', async () => {
+    const response = await fetch('http://127.0.0.1:3001/api/espn/schedule/regular/2024?weeks=1-18');
+    expect(response.ok).toBe(true);
+    const body = (await response.json()) as {
+      weeks: Array<{ season: number; season_type: string; week: number; entries: Array<Record<string, unknown>> }>;
+      meta: { seasons: Record<string, { default_week: number | null }> };
+    };
+    expect(body.weeks.map(week => week.week)).toEqual([7]);
+    expect(body.weeks[0]).toMatchObject({ season: 2024, season_type: 'regular' });
+    expect(body.weeks[0]?.entries[0]).toMatchObject({ game_id: '401770001' });
+    expect(body.meta.seasons['2024']?.default_week).toBe(7);
+
+    await updateFakeEvent('401770001', event => {
+      event.status = 'post';
+    });
+    const single = await fetch('http://127.0.0.1:3001/api/espn/schedule/regular/2024/7');
+    const singleBody = (await single.json()) as { entries: Array<Record<string, unknown>>; meta: Record<string, unknown> };
+    expect(singleBody.entries[0]?.status).toBe('in-progress');
+    expect(singleBody.meta).toMatchObject({ season: 2024, requested_week: 7, default_week: 7 });
+
+    // season type aliases share the normalized key
+    const alias = await fetch('http://127.0.0.1:3001/api/espn/schedule/RegularSeason/2024/7');
+    const aliasBody = (await alias.json()) as { entries: Array<Record<string, unknown>> };
+    expect(aliasBody.entries[0]?.status).toBe('in-progress');
+    const aliasRange = await fetch('http://127.0.0.1:3001/api/espn/schedule/regular_season/2024?weeks=7');
+    const aliasRangeBody = (await aliasRange.json()) as { weeks: Array<{ season_type: string }>; meta: { rebuilt: string[] } };
+    expect(aliasRangeBody.weeks[0]?.season_type).toBe('regular');
+    expect(aliasRangeBody.meta.rebuilt).toEqual([]);
+
+    const invalid = await fetch('http://127.0.0.1:3001/api/espn/schedule/regular/24?weeks=1-18');
+    expect(invalid.status).toBe(400);
+  }, 20000);
+
+  it('exposes cache, python and route metrics in Prometheus format', async () => {
+    await fetch('http://127.0.0.1:3001/api/espn/game/401770001');
+    await fetch('http://127.0.0.1:3001/api/espn/game/401770001');
+
+    const metricsResponse = await fetch('http://127.0.0.1:3001/metrics');
+    expect(metricsResponse.ok).toBe(true);
+    expect(metricsResponse.headers.get('content-type')).toContain('text/plain');
+    const body = await metricsResponse.text();
+    expect(body).toContain('# TYPE espn_api_cache_lookups_total counter');
+    expect(body).toMatch(/espn_api_cache_lookups_total\{cache="game",result="hit"\} [1-9]/);
+    expect(body).toMatch(/espn_api_python_spawns_total\{outcome="success",script="espn_game.py"\} [1-9]/);
+    expect(body).toMatch(/espn_api_response_bytes_count\{route="\/game\/:eventId"\} [1-9]/);
+    expect(body).toMatch(/espn_api_cache_entries\{cache="game"\} [1-9]/);
+    expect(body).toContain('espn_api_python_in_flight 0');
+  }, 20000);
 });
@@ -0,0 +1,13 @@
+import json
+import os
+import sys
+import time
+
+# Stand-in script for the API server's python queue tests: optionally records its pid,
+# sleeps for the given number of seconds, then prints its label.
+seconds, label = float(sys.argv[1]), sys.argv[2]
+if len(sys.argv) > 3:
+    with open(sys.argv[3], "w", encoding="utf-8") as handle:
+        handle.write(str(os.getpid()))
+time.sleep(seconds)
+print(json.dumps({"label": label}))
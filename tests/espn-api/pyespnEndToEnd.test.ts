@@ -89,6 +89,8 @@ describe('PyESPN end-to-end integration', () => {
       env: {
         ...process.env,
         PYTHONPATH: pythonPathValue,
+        ESPN_SCHEDULE_WARMER: '0',
+        ESPN_PLAYER_INDEX_BUILD: '0',
       },
       stdio: ['ignore', 'pipe', 'pipe'],
     });
@@ -66,6 +66,32 @@ describe('PyESPN Python entrypoints', () => {
     });
   });
 
+  it('warms the current week and its neighbours under their schedule cache keys', async () => {
+    const raw = await runPythonScript('espn_schedule.py', ['--warm', 2025]);
+    const parsed = JSON.parse(raw) as {
+      weeks: Record<string, { entries: Array<Record<string, unknown>> }>;
+      meta: { targets: string[]; rebuilt: string[]; expires_in: Record<string, number | null> };
+    };
+    expect(parsed.meta.targets).toContain('2025:regular:7');
+    expect(parsed.meta.rebuilt).toEqual(parsed.meta.targets);
+    expect(parsed.weeks['2025:regular:7']?.entries[0]).toMatchObject({ game_id: '401770001' });
+    // week 7 has a game in progress, so it gets the short live lifetime
+    expect(parsed.meta.expires_in['2025:regular:7']).toBe(60);
+  });
+
+  it('returns a multi-season range grouped by week with one summary per season', async () => {
+    const raw = await runPythonScript('espn_schedule.py', ['--range', 'all', '2024-2025']);
+    const parsed = JSON.parse(raw) as {
+      weeks: Array<{ season: number; season_type: string; week: number; entries: unknown[] }>;
+      meta: { seasons: Record<string, { season_types: unknown[] }> };
+    };
+    expect(Object.keys(parsed.meta.seasons)).toEqual(['2024', '2025']);
+    expect(parsed.weeks).toContainEqual(
+      expect.objectContaining({ season: 2025, season_type: 'regular', week: 7 }),
+    );
+    expect(parsed.weeks.every(week => Array.isArray(week.entries))).toBe(true);
+  });
+
   it('returns game metadata for a known event id', async () => {
     const raw = await runPythonScript('espn_game.py', [401770001]);
     const parsed = JSON.parse(raw) as Record<string, unknown>;
@@ -90,6 +116,22 @@ describe('PyESPN Python entrypoints', () => {
     expect(parsed.fullName).toBe('Mock Quarterback');
   });
 
+  it('answers many player ids from the batch player script', async () => {
+    const raw = await runPythonScript('espn_players.py', ['15847,99']);
+    const parsed = JSON.parse(raw) as {
+      players: Record<string, Record<string, unknown> | null>;
+      meta: { missing: string[] };
+    };
+    expect(parsed.players['15847']).toMatchObject({
+      id: '15847',
+      fullName: 'Mock Quarterback',
+      position: 'QB',
+      team: { abbreviation: 'MH' },
+    });
+    expect(parsed.players['99']).toBeNull();
+    expect(parsed.meta.missing).toEqual(['99']);
+  });
+
   it('supports preseason, postseason, and play-in schedule types', async () => {
     const preseasonRaw = await runPythonScript('espn_schedule.py', ['Pre-Season', 2025, 1]);
     const preseason = JSON.parse(preseasonRaw) as { entries: Array<Record<string, unknown>>; meta: Record<string, unknown> | null };
@@ -132,7 +174,7 @@ describe('PyESPN Python entrypoints', () => {
   });
 
   it('compiles every PyESPN entrypoint without syntax errors', async () => {
-    const scripts = ['espn_schedule.py', 'espn_game.py', 'espn_pbp.py', 'espn_player.py'];
+    const scripts = ['espn_schedule.py', 'espn_game.py', 'espn_pbp.py', 'espn_player.py', 'espn_players.py'];
     await Promise.all(
       scripts.map(scriptName => {
         const scriptPath = path.resolve(repoRoot, 'py', scriptName);